@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark `pytk.util.auto_convert()` for each class of input.
+
+Does not require a display, e.g.:
+
+    $ python benchmarks/bench_auto_convert.py
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals, )
+
+# ======================================================================
+# :: Python Standard Library Imports
+import os
+import sys
+import timeit
+
+# ======================================================================
+# :: Internal Imports
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pytk import util
+
+# ======================================================================
+INPUTS = {
+    'int': '12345',
+    'float': '123.45e-3',
+    'complex': '1.5+2j',
+    'text': 'not a number',
+    'delimited': '<12345>',
+}
+
+
+# ======================================================================
+def main(number=100000, column_size=100000):
+    print('{:10s} {:>12s} {:>12s} {:>12s}'.format(
+        'input', 'slow [ns]', 'fast [ns]', 'cached [ns]'))
+    for name, text in INPUTS.items():
+        delims = ('<', '>') if name == 'delimited' else (None, None)
+        slow_text = text[1:-1] if name == 'delimited' else text
+        timings = [
+            min(timeit.repeat(func, number=number, repeat=5)) / number * 1e9
+            for func in (
+                lambda: util._auto_convert_slow(slow_text),
+                lambda: util.auto_convert(text, *delims),
+                lambda: util.auto_convert(text, *delims, cached=True))]
+        print('{:10s} {:12.1f} {:12.1f} {:12.1f}'.format(name, *timings))
+
+    print('\n{:10s} {:>12s} {:>12s}'.format(
+        'column', 'loop [ms]', 'many [ms]'))
+    for name, text in INPUTS.items():
+        column = [text] * column_size
+        timings = [
+            min(timeit.repeat(func, number=1, repeat=3)) * 1e3
+            for func in (
+                lambda: [util.auto_convert(x) for x in column],
+                lambda: util.auto_convert_many(column))]
+        print('{:10s} {:12.1f} {:12.1f}'.format(name, *timings))
+
+
+# ======================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark the import time of `pytk` against the import time of `tkinter`.
+
+Uses `python -X importtime` in fresh interpreters and exits with a non-zero
+status if `import pytk` costs more than `max_ratio` times `import tkinter`
+(or if any of the lazily loaded modules is imported eagerly, also by
+`import pytk.widgets` for the dialogs), e.g.:
+
+    $ python benchmarks/bench_import.py
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals, )
+
+# ======================================================================
+# :: Python Standard Library Imports
+import os
+import sys
+import subprocess
+
+# ======================================================================
+LAZY_MODULES = (
+    'flyingcircus', 'tkinter.ttk', 'tkinter.messagebox',
+    'tkinter.filedialog', 'tkinter.simpledialog')
+# :: the modules not needed by the widgets (`tkinter.ttk` is)
+DIALOG_MODULES = (
+    'tkinter.messagebox', 'tkinter.filedialog', 'tkinter.simpledialog')
+
+
+# ======================================================================
+def _get_env():
+    env = dict(os.environ)
+    dirpath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env['PYTHONPATH'] = os.pathsep.join(
+        [dirpath] + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else []))
+    return env
+
+
+# ======================================================================
+def import_times(module):
+    """
+    Measure the import time of a module in a fresh interpreter.
+
+    Args:
+        module (str): The name of the module to import.
+
+    Returns:
+        result (dict[str,int]): The cumulative import time in microseconds
+            of each (sub)module imported.
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module],
+        stderr=subprocess.PIPE, env=_get_env(), check=True,
+        universal_newlines=True)
+    result = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line.split('|')
+            try:
+                result[name.strip()] = int(cumulative)
+            except ValueError:  # header line
+                pass
+    return result
+
+
+# ======================================================================
+def loaded_modules(module):
+    """
+    Get the modules loaded by importing a module in a fresh interpreter.
+
+    Unlike `import_times()`, this includes the modules loaded with
+    `importlib.import_module()` (e.g. by the lazy imports of `pytk`).
+
+    Args:
+        module (str): The name of the module to import.
+
+    Returns:
+        result (set[str]): The names of the modules loaded.
+    """
+    proc = subprocess.run(
+        [sys.executable, '-c',
+         'import sys, {}; print("\\n".join(sys.modules))'.format(module)],
+        stdout=subprocess.PIPE, env=_get_env(), check=True,
+        universal_newlines=True)
+    return set(proc.stdout.split())
+
+
+# ======================================================================
+def main(repeat=7, max_ratio=1.5):
+    pytk_times = [import_times('pytk') for _ in range(repeat)]
+    tk_times = [import_times('tkinter') for _ in range(repeat)]
+    pytk_time = min(times['pytk'] for times in pytk_times)
+    tk_time = min(times['tkinter'] for times in tk_times)
+    ratio = pytk_time / tk_time
+    print('import tkinter: {:8d} us'.format(tk_time))
+    print('import pytk:    {:8d} us  (x{:.2f})'.format(pytk_time, ratio))
+    eager = sorted(set(LAZY_MODULES).intersection(loaded_modules('pytk')))
+    eager.extend(
+        '{} (by pytk.widgets)'.format(name) for name in sorted(
+            set(DIALOG_MODULES).intersection(loaded_modules('pytk.widgets'))))
+    if eager:
+        print('E: modules imported eagerly: {}'.format(', '.join(eager)))
+    if ratio > max_ratio:
+        print('E: import pytk exceeds x{:.2f} of import tkinter'.format(
+            max_ratio))
+    return 1 if eager or ratio > max_ratio else 0
+
+
+# ======================================================================
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Benchmark Listview refresh throughput: per-row vs. bulk mutation API.
+
+Requires a display (a virtual X server like `Xvfb` is fine), e.g.:
+
+    $ xvfb-run python benchmarks/bench_listview.py
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals, )
+
+# ======================================================================
+# :: Python Standard Library Imports
+import os
+import sys
+import random
+import timeit
+
+# ======================================================================
+# :: Internal Imports
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import pytk
+import pytk.widgets
+
+
+# ======================================================================
+def refresh_per_row(listview, items):
+    listview.clear()
+    for item in items:
+        listview.add_item(item)
+
+
+# ======================================================================
+def refresh_bulk(listview, items):
+    listview.replace_items(items)
+
+
+# ======================================================================
+def main(sizes=(1000, 10000, 100000), churn=0.1, repeat=3):
+    root = pytk.tk.Tk()
+    root.withdraw()
+    for num in sizes:
+        items = ['item_{:08d}'.format(i) for i in range(num)]
+        # simulate a periodic refresh where a fraction of the rows changes
+        changed = list(items)
+        for i in random.sample(range(num), int(num * churn)):
+            changed[i] = 'changed_{:08d}'.format(i)
+        for func in (refresh_per_row, refresh_bulk):
+            listview = pytk.widgets.Listview(root)
+            func(listview, items)
+            elapsed = min(timeit.repeat(
+                lambda: (func(listview, changed), func(listview, items)),
+                number=1, repeat=repeat)) / 2
+            print('{:16s} rows={:8d}  {:10.3f} s  {:12.0f} rows/s'.format(
+                func.__name__, num, elapsed, num / elapsed))
+            listview.destroy()
+    root.destroy()
+
+
+# ======================================================================
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,528 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Run the pytk benchmark suite and compare the results against a baseline.
+
+The GUI benchmarks require a display: if `DISPLAY` is not set and `Xvfb` is
+available, a virtual X server is started automatically (otherwise the GUI
+benchmarks are skipped).
+
+The results are written as JSON and compared against the stored baseline:
+the exit status is non-zero if any benchmark is slower than the baseline
+by more than the threshold factor.
+The timings depend on the machine, hence no baseline is shipped: create
+one (`benchmarks/baseline.json`) with `--update-baseline` on the reference
+machine, before the changes to be checked.
+
+Examples:
+
+    $ python benchmarks/run.py                    # run and compare
+    $ python benchmarks/run.py --quick            # smaller sizes
+    $ python benchmarks/run.py --update-baseline  # store a new baseline
+    $ python benchmarks/run.py -k listview        # only matching names
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals, )
+
+# ======================================================================
+# :: Python Standard Library Imports
+import os
+import sys
+import json
+import time
+import shutil
+import timeit
+import argparse
+import platform
+import subprocess
+
+# ======================================================================
+DIRPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(DIRPATH))
+sys.path.insert(0, DIRPATH)
+
+D_BASELINE_FILEPATH = os.path.join(DIRPATH, 'baseline.json')
+D_THRESHOLD = 1.5
+
+# ======================================================================
+# :: name -> (function, needs display)
+BENCHMARKS = {}
+
+
+# ======================================================================
+def benchmark(gui=False):
+    def decorator(func):
+        BENCHMARKS[func.__name__] = func, gui
+        return func
+
+    return decorator
+
+
+# ======================================================================
+def measure(func, number=1, repeat=3, setup=None):
+    """
+    Measure the best time of a function.
+
+    Args:
+        func (callable): The function to time.
+        number (int): The number of calls per measurement.
+        repeat (int): The number of measurements.
+        setup (callable|None): A function called before each measurement.
+
+    Returns:
+        result (float): The best time per call in s.
+    """
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        timings.append(timeit.timeit(func, number=number))
+    return min(timings) / number
+
+
+# ======================================================================
+@benchmark()
+def import_pytk(sizes):
+    import bench_import
+    return {
+        'import_pytk': min(
+            bench_import.import_times('pytk')['pytk']
+            for _ in range(5)) * 1e-6}
+
+
+# ======================================================================
+@benchmark()
+def geometry(sizes):
+    from pytk.Geometry import Geometry
+    geometry, parent = Geometry('640x480+10+20'), Geometry('1920x1080')
+    return {
+        'geometry_parse': measure(
+            lambda: Geometry('640x480+10+20'), number=20000, repeat=7),
+        'geometry_format': measure(
+            lambda: str(geometry), number=20000, repeat=7),
+        'geometry_set_to_center': measure(
+            lambda: geometry.set_to_center(parent), number=20000, repeat=7),
+    }
+
+
+# ======================================================================
+@benchmark()
+def auto_convert(sizes):
+    from pytk import util
+    from bench_auto_convert import INPUTS
+    results = {}
+    for name, text in INPUTS.items():
+        delims = ('<', '>') if name == 'delimited' else (None, None)
+        results['auto_convert_' + name] = measure(
+            lambda: util.auto_convert(text, *delims), number=20000, repeat=7)
+    column = [text for text in INPUTS.values()] * (max(sizes) // 5)
+    results['auto_convert_many_{}'.format(len(column))] = measure(
+        lambda: util.auto_convert_many(column))
+    return results
+
+
+# ======================================================================
+@benchmark()
+def plot_pyramid(sizes):
+    import array
+    from pytk.plot import MinMaxPyramid
+    results = {}
+    for num in sizes:
+        chunks = [
+            array.array('d', range(i, i + 1000)) for i in range(0, num, 1000)]
+        pyramid = MinMaxPyramid()
+
+        def append():
+            pyramid.clear()
+            for chunk in chunks:
+                pyramid.append(chunk)
+
+        results['plot_pyramid_append_{}'.format(num)] = measure(append)
+        results['plot_pyramid_minmax_{}'.format(num)] = measure(
+            lambda: pyramid.get_minmax(0, num, 1000), number=10)
+    return results
+
+
+# ======================================================================
+@benchmark()
+def image_encode(sizes):
+    from pytk import image
+    width = height = 4096
+    data = memoryview(bytearray(width * height * 3))
+    results = {}
+    for step in (1, 4, 16):
+        results['image_encode_tile_step{}'.format(step)] = measure(
+            lambda: image.encode_pnm(image._get_region(
+                data, width, 3, 0, 0, 256 * step, 256 * step, step),
+                256, 256, 3), number=10)
+    return results
+
+
+# ======================================================================
+@benchmark()
+def layout_solve(sizes):
+    from pytk import layout
+    constraints = [
+        dict(
+            region=(i % 10 / 10, i // 10 % 10 / 10, 0.1, 0.1),
+            aspect=4 / 3 if i % 2 else None, max_size=(80, None),
+            anchor=layout.ANCHORS[i % len(layout.ANCHORS)])
+        for i in range(100)]
+    return {
+        'layout_solve_100': measure(
+            lambda: layout.solve(constraints, 1920, 1080), number=100)}
+
+
+# ======================================================================
+@benchmark()
+def logview_index(sizes):
+    import tempfile
+    from pytk.logview import LineIndex
+    results = {}
+    dirpath = tempfile.mkdtemp()
+    try:
+        for num in sizes:
+            filepath = os.path.join(dirpath, 'log_{}.txt'.format(num))
+            with open(filepath, 'w') as file_obj:
+                for i in range(num):
+                    file_obj.write('{} INFO message number {}\n'.format(i, i))
+
+            def index():
+                line_index = LineIndex(filepath)
+                line_index.wait()
+                line_index.close()
+
+            results['logview_index_{}'.format(num)] = measure(index)
+            line_index = LineIndex(filepath)
+            line_index.wait()
+            results['logview_find_{}'.format(num)] = measure(
+                lambda: line_index.find(
+                    'number {}\n'.format(num - 1).encode()))
+            line_index.close()
+    finally:
+        shutil.rmtree(dirpath)
+    return results
+
+
+# ======================================================================
+@benchmark()
+def listbox_search(sizes):
+    from pytk.widgets import _ValueIndex
+    results = {}
+    for num in sizes:
+        values = ['PN-{:08d}-X'.format(i * 7919 % num) for i in range(num)]
+        results['listbox_search_index_{}'.format(num)] = measure(
+            lambda: _ValueIndex(values))
+        index = _ValueIndex(values)
+        results['listbox_search_typing_{}'.format(num)] = measure(
+            lambda: [
+                index.find_prefix(text, 50)
+                for text in ('p', 'pn', 'pn-', 'pn-0', 'pn-00', 'pn-000')],
+            number=100)
+        results['listbox_search_substring_{}'.format(num)] = measure(
+            lambda: index.find_substring('9-x', 50), number=100)
+    return results
+
+
+# ======================================================================
+@benchmark(gui=True)
+def listview(sizes):
+    import pytk.widgets
+    root = pytk.tk.Tk()
+    results = {}
+    for num in sizes:
+        items = ['item_{:08d}'.format(i) for i in range(num)]
+        listview = pytk.widgets.Listview(root)
+        results['listview_add_items_{}'.format(num)] = measure(
+            lambda: listview.add_items(items), setup=listview.clear)
+        results['listview_del_items_{}'.format(num)] = measure(
+            lambda: listview.del_items(items[::2]),
+            setup=lambda: listview.replace_items(items))
+        results['listview_clear_{}'.format(num)] = measure(
+            listview.clear, setup=lambda: listview.replace_items(items))
+        if num <= 10000:
+            results['listview_add_item_{}'.format(num)] = measure(
+                lambda: [listview.add_item(item) for item in items],
+                setup=listview.clear)
+        listview.replace_items(items)
+        results['listview_filter_typing_{}'.format(num)] = measure(
+            lambda: [listview.filter_items(text) for text in ('1', '12', '')])
+        results['listview_sort_{}'.format(num)] = measure(
+            lambda: (listview.sort(reverse=True), listview.unsort()))
+        listview.destroy()
+        listview = pytk.widgets.Listview(root, virtual=True)
+        listview.pack()
+        results['listview_virtual_set_items_{}'.format(num)] = measure(
+            lambda: (listview.set_items(items), listview.update()))
+        listview.destroy()
+    root.destroy()
+    return results
+
+
+# ======================================================================
+@benchmark(gui=True)
+def listview_table(sizes):
+    import pytk.widgets
+    root = pytk.tk.Tk()
+    results = {}
+    for num in sizes:
+        data = [
+            ('col{}'.format(j), [i * (j + 1) * 0.5 for i in range(num)])
+            for j in range(10)]
+        listview = pytk.widgets.Listview(root, virtual=True)
+        listview.pack()
+        results['listview_set_table_{}'.format(num)] = measure(
+            lambda: (listview.set_table(
+                data, formatters={'col0': '{:.2f}'}), listview.update()))
+        results['listview_table_scroll_{}'.format(num)] = measure(
+            lambda: [
+                (listview.yview_scroll(1, 'pages'), listview.update())
+                for _ in range(20)])
+        listview.destroy()
+    root.destroy()
+    return results
+
+
+# ======================================================================
+@benchmark(gui=True)
+def value_widgets(sizes):
+    import pytk.widgets
+    root = pytk.tk.Tk()
+    spinbox = pytk.widgets.Spinbox(root, start=0, stop=100, step=1)
+    range_ = pytk.widgets.Range(root, start=0, stop=100, step=1)
+    entry = pytk.widgets.Entry(root)
+    checkbutton = pytk.widgets.Checkbutton(root)
+    results = {}
+    for name, widget, val in (
+            ('spinbox', spinbox, 50), ('range', range_, 50),
+            ('entry', entry, 'text'), ('checkbutton', checkbutton, True)):
+        results[name + '_set_val'] = measure(
+            lambda: widget.set_val(val), number=1000)
+        results[name + '_get_val'] = measure(widget.get_val, number=1000)
+    root.destroy()
+    return results
+
+
+# ======================================================================
+@benchmark(gui=True)
+def form(sizes):
+    import pytk.widgets
+    root = pytk.tk.Tk()
+    for i in range(100):
+        pytk.widgets.Entry(root, name='entry{}'.format(i))
+        pytk.widgets.Checkbutton(root, name='check{}'.format(i))
+    widgets = pytk.widgets.get_form_widgets(root)
+    vals = pytk.widgets.get_form_vals(root, widgets)
+    results = {
+        'form_get_vals_200': measure(
+            lambda: pytk.widgets.get_form_vals(root, widgets), number=100),
+        'form_set_vals_200': measure(
+            lambda: pytk.widgets.set_form_vals(root, vals, widgets),
+            number=100),
+        'form_get_val_loop_200': measure(
+            lambda: {k: w.get_val() for k, w in widgets.items()},
+            number=100)}
+    root.destroy()
+    return results
+
+
+# ======================================================================
+@benchmark(gui=True)
+def declarative(sizes):
+    import pytk.widgets
+    from pytk.declarative import Renderer, element
+    root = pytk.tk.Tk()
+    frame = pytk.widgets.Frame(root)
+    renderer = Renderer(frame)
+    state = {'name{}'.format(i): str(i) for i in range(100)}
+
+    def tree():
+        return [
+            element(
+                'Entry', key=name, val=val, on_change=lambda x: None)
+            for name, val in state.items()]
+
+    def change_one():
+        state['name0'] = state['name0'] + 'x'
+        renderer.render(tree())
+
+    renderer.render(tree())
+    results = {
+        'declarative_render_one_change_100': measure(
+            change_one, number=20),
+        'declarative_rebuild_100': measure(
+            lambda: renderer.render(tree()),
+            setup=renderer.clear, number=1)}
+    root.destroy()
+    return results
+
+
+# ======================================================================
+@benchmark(gui=True)
+def scrolling_frame(sizes):
+    import pytk.widgets
+    root = pytk.tk.Tk()
+    root.geometry('400x400')
+    results = {}
+    for num in sizes:
+        if num > 10000:
+            continue
+        frames = []
+
+        def destroy():
+            while frames:
+                frames.pop().destroy()
+
+        def create():
+            frame = pytk.widgets.ScrollingFrame(root)
+            frame.pack(fill='both', expand=True)
+            for i in range(num):
+                pytk.widgets.Entry(frame.scrolling).pack(fill='x')
+            root.update()
+            frames.append(frame)
+
+        def resize():
+            for size in ('300x300', '400x400'):
+                root.geometry(size)
+                root.update()
+
+        results['scrolling_frame_create_{}'.format(num)] = measure(
+            create, setup=destroy)
+        results['scrolling_frame_resize_{}'.format(num)] = measure(resize)
+        destroy()
+    root.destroy()
+    return results
+
+
+# ======================================================================
+@benchmark(gui=True)
+def center(sizes):
+    import pytk
+    from pytk import util
+    root = pytk.tk.Tk()
+    window = pytk.Window(root)
+    results = {
+        'center_screen': measure(lambda: util.center(window), number=100),
+        'center_reference': measure(
+            lambda: util.center(window, root), number=100)}
+    root.destroy()
+    return results
+
+
+# ======================================================================
+def start_xvfb():
+    """Start a virtual X server, if needed and possible."""
+    if os.environ.get('DISPLAY') or sys.platform.startswith(('win', 'dar')):
+        return None
+    if not shutil.which('Xvfb'):
+        return None
+    display = ':{}'.format(90 + os.getpid() % 100)
+    proc = subprocess.Popen(
+        ['Xvfb', display, '-screen', '0', '1920x1080x24', '-nolisten', 'tcp'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ['DISPLAY'] = display
+    time.sleep(1.0)
+    return proc
+
+
+# ======================================================================
+def compare(results, baseline, threshold):
+    """
+    Compare results against a baseline.
+
+    Args:
+        results (dict[str,float]): The timings in s.
+        baseline (dict[str,float]): The baseline timings in s.
+        threshold (float): The maximum allowed ratio to the baseline.
+
+    Returns:
+        regressions (list[str]): The names of the regressed benchmarks.
+    """
+    regressions = []
+    fmtt = '{:40s} {:>12s} {:>12s} {:>8s}  {}'
+    print(fmtt.format('benchmark', 'time [s]', 'baseline [s]', 'ratio', ''))
+    for name, value in sorted(results.items()):
+        if name in baseline:
+            ratio = value / baseline[name]
+            status = 'REGRESSION' if ratio > threshold else ''
+            if status:
+                regressions.append(name)
+            print(fmtt.format(
+                name, '{:.6g}'.format(value), '{:.6g}'.format(baseline[name]),
+                '{:.2f}'.format(ratio), status))
+        else:
+            print(fmtt.format(name, '{:.6g}'.format(value), '-', '-', 'NEW'))
+    return regressions
+
+
+# ======================================================================
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument(
+        '-k', '--keyword', default='',
+        help='run only the benchmarks whose name contains this')
+    parser.add_argument(
+        '-q', '--quick', action='store_true',
+        help='use smaller sizes (1k-10k instead of 1k-1M)')
+    parser.add_argument(
+        '-o', '--output', default=None,
+        help='write the results to this JSON file')
+    parser.add_argument(
+        '-b', '--baseline', default=D_BASELINE_FILEPATH,
+        help='the baseline JSON file [%(default)s]')
+    parser.add_argument(
+        '-t', '--threshold', type=float, default=D_THRESHOLD,
+        help='the maximum allowed ratio to the baseline [%(default)s]')
+    parser.add_argument(
+        '-u', '--update-baseline', action='store_true',
+        help='store the results as the new baseline')
+    args = parser.parse_args()
+
+    sizes = (1000, 10000) if args.quick else (1000, 10000, 100000, 1000000)
+    xvfb = start_xvfb()
+    has_display = bool(os.environ.get('DISPLAY')) \
+        or sys.platform.startswith(('win', 'dar'))
+    results = {}
+    try:
+        for name, (func, gui) in sorted(BENCHMARKS.items()):
+            if args.keyword not in name:
+                continue
+            if gui and not has_display:
+                print('W: skipping `{}` (no display)'.format(name))
+                continue
+            results.update(func(sizes))
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+
+    info = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results}
+    if args.output:
+        with open(args.output, 'w') as file_obj:
+            json.dump(info, file_obj, indent=2, sort_keys=True)
+    baseline = {}
+    if os.path.isfile(args.baseline):
+        with open(args.baseline) as file_obj:
+            baseline = json.load(file_obj)['results']
+    elif not args.update_baseline:
+        print(
+            'W: no baseline `{}`: regressions cannot be detected '
+            '(create it with `--update-baseline`)'.format(args.baseline))
+    regressions = compare(results, baseline, args.threshold)
+    if args.update_baseline:
+        baseline.update(results)
+        info['results'] = baseline
+        with open(args.baseline, 'w') as file_obj:
+            json.dump(info, file_obj, indent=2, sort_keys=True)
+    return 1 if regressions and not args.update_baseline else 0
+
+
+# ======================================================================
+if __name__ == '__main__':
+    sys.exit(main())
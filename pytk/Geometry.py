@@ -227,3 +227,28 @@ class Geometry(object):
         self.left = parent.left
         self.top = parent.height // 2 - self.height // 2 + parent.top
         return self
+
+    def intersection(self, other):
+        """
+        Compute the intersection with another geometry.
+
+        Args:
+            other (Geometry): The other geometry.
+
+        Returns:
+            geometry (Geometry): The intersection.
+                If the geometries do not overlap, width and height are 0.
+
+        Examples:
+            >>> print(Geometry('4x4+0+0').intersection(Geometry('4x4+2+1')))
+            2x3+2+1
+            >>> print(Geometry('4x4').intersection(Geometry('1x1+5+5')))
+            0x0+5+5
+        """
+        left = max(self.left, other.left)
+        top = max(self.top, other.top)
+        right = min(self.left + self.width, other.left + other.width)
+        bottom = min(self.top + self.height, other.top + other.height)
+        return Geometry(
+            width=max(0, right - left), height=max(0, bottom - top),
+            left=left, top=top)
@@ -13,27 +13,70 @@ from __future__ import (
 
 # ======================================================================
 # :: Python Standard Library Imports
+import sys  # System-specific parameters and functions
+import importlib  # The implementation of import
+
 try:
     import tkinter as tk
-    import tkinter.ttk as ttk
-    import tkinter.messagebox as messagebox
-    import tkinter.filedialog as filedialog
-    import tkinter.simpledialog as simpledialog
 except ImportError:
     import Tkinter as tk
-    import ttk
-    import tkMessageBox as messagebox
-    import tkFileDialog as filedialog
-    import tkSimpleDialog as simpledialog
 
 Window = tk.Toplevel
-Style = ttk.Style
 
 # ======================================================================
+# :: Lazy Imports
+# name: (module (Python 3), module (Python 2), attribute)
+_LAZY = {
+    'ttk': ('tkinter.ttk', 'ttk', None),
+    'messagebox': ('tkinter.messagebox', 'tkMessageBox', None),
+    'filedialog': ('tkinter.filedialog', 'tkFileDialog', None),
+    'simpledialog': ('tkinter.simpledialog', 'tkSimpleDialog', None),
+    'Style': ('tkinter.ttk', 'ttk', 'Style'),
+}
 # :: External Imports
 # import flyingcircus as fc  # Everything you always wanted to have in Python*
-from flyingcircus import msg, dbg, fmt, fmtm, elapsed, report, pkg_paths
-from flyingcircus import VERB_LVL, VERB_LVL_NAMES, D_VERB_LVL
+_LAZY.update({
+    name: ('flyingcircus', 'flyingcircus', name)
+    for name in (
+        'msg', 'dbg', 'fmt', 'fmtm', 'elapsed', 'report', 'pkg_paths',
+        'VERB_LVL', 'VERB_LVL_NAMES', 'D_VERB_LVL')})
+
+
+def __getattr__(name):
+    """
+    Import the lazily loaded submodules and helpers on first access.
+
+    Args:
+        name (str): The name of the attribute.
+
+    Returns:
+        obj (Any): The requested module or object.
+
+    Raises:
+        AttributeError: If the name cannot be resolved.
+    """
+    if name not in _LAZY:
+        raise AttributeError(
+            'module `{}` has no attribute `{}`'.format(__name__, name))
+    py3_module, py2_module, attr = _LAZY[name]
+    try:
+        obj = importlib.import_module(py3_module)
+    except ImportError:
+        obj = importlib.import_module(py2_module)
+    if attr:
+        obj = getattr(obj, attr)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+# module-level `__getattr__()` requires Python 3.7+ (PEP 562)
+if sys.version_info < (3, 7):
+    for _name in _LAZY:
+        __getattr__(_name)
 
 # ======================================================================
 # :: Version
@@ -80,6 +123,7 @@ MY_GREETINGS = r"""
 # ======================================================================
 if __name__ == '__main__':
     import doctest  # Test interactive Python examples
+    from flyingcircus import msg, report
 
     msg(__doc__.strip())
     doctest.testmod()
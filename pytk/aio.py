@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+pytk.aio: run the Tk event loop cooperatively with an asyncio event loop.
+
+The Tk main loop drives the asyncio event loop: asyncio is advanced by one
+iteration whenever one of its file descriptors becomes ready (watched by Tk
+through the selector file descriptor), when its next timer is due, or when
+callbacks are scheduled from Tk.
+No polling happens, except where the selector does not expose a file
+descriptor (e.g. on Windows), in which case asyncio is polled every
+`interval` ms while it has nothing scheduled.
+
+Requires Python 3.
+
+Examples:
+    A minimal application awaiting IO and a dialog::
+
+        async def main(root):
+            reader, writer = await asyncio.open_connection('example.com', 80)
+            ...
+            if await pytk.aio.askyesno('Quit', 'Done. Quit?'):
+                root.quit()
+
+        root = pytk.tk.Tk()
+        pytk.aio.run(root, main(root))
+"""
+
+# ======================================================================
+# :: Python Standard Library Imports
+import math
+import asyncio
+
+from pytk import tk
+
+
+# ======================================================================
+class Runner(object):
+    def __init__(self, root, loop=None, interval=20):
+        """
+        Drive an asyncio event loop from the Tk event loop.
+
+        Args:
+            root (tk.Tk): The Tk root.
+            loop (asyncio.AbstractEventLoop|None): The asyncio event loop.
+                Must be a selector event loop.
+                If None, a new event loop is created.
+            interval (int): The polling interval in ms.
+                Only used if the selector has no file descriptor.
+
+        Returns:
+            None.
+        """
+        self.root = root
+        self.loop = loop if loop is not None else asyncio.new_event_loop()
+        self.interval = interval
+        self._after_id = None
+        self._after_time = None
+        asyncio.set_event_loop(self.loop)
+        self.fd = None
+        selector = getattr(self.loop, '_selector', None)
+        if hasattr(selector, 'fileno') and \
+                hasattr(root.tk, 'createfilehandler'):
+            self.fd = selector.fileno()
+            root.tk.createfilehandler(
+                self.fd, tk.READABLE, lambda *_args: self.step())
+        root._asyncio_runner = self
+        self.wakeup()
+
+    def step(self):
+        """Run one iteration of the asyncio event loop."""
+        self._after_id = None
+        if self.loop.is_closed():
+            return
+        if self.loop.is_running():  # e.g. re-entered from `root.update()`
+            self._schedule(0)
+            return
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+        self._schedule_next()
+
+    def _schedule(self, delay):
+        when = self.loop.time() + delay / 1000.0
+        if self._after_id is not None:
+            if self._after_time <= when:
+                return
+            self.root.after_cancel(self._after_id)
+        self._after_time = when
+        self._after_id = self.root.after(delay, self.step)
+
+    def _schedule_next(self):
+        if self.loop._ready:
+            delay = 0
+        elif self.loop._scheduled:
+            delay = int(math.ceil(
+                max(0.0, self.loop._scheduled[0].when() - self.loop.time())
+                * 1000))
+        else:
+            delay = None
+        if self.fd is None:
+            delay = self.interval if delay is None \
+                else min(delay, self.interval)
+        if delay is not None:
+            self._schedule(delay)
+
+    def wakeup(self):
+        """Make sure the asyncio event loop runs at the next idle cycle."""
+        self._schedule(0)
+
+    def create_task(self, coro):
+        """Schedule a coroutine from Tk code (e.g. event handlers)."""
+        task = self.loop.create_task(coro)
+        self.wakeup()
+        return task
+
+    def close(self):
+        """Cancel the pending tasks and close the asyncio event loop."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        if self.fd is not None:
+            self.root.tk.deletefilehandler(self.fd)
+            self.fd = None
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            self.loop.run_until_complete(
+                asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        self.loop.close()
+        if getattr(self.root, '_asyncio_runner', None) is self:
+            del self.root._asyncio_runner
+
+
+# ======================================================================
+def get_runner(widget):
+    """
+    Get the runner driving asyncio for the root of a widget.
+
+    Args:
+        widget (tk.Misc): The widget.
+
+    Returns:
+        runner (Runner): The runner.
+
+    Raises:
+        RuntimeError: If no runner is active for the widget root.
+    """
+    root = widget._root()
+    runner = getattr(root, '_asyncio_runner', None)
+    if runner is None:
+        raise RuntimeError('No asyncio runner for `{}`.'.format(root))
+    return runner
+
+
+# ======================================================================
+def run(root, coro=None, loop=None, interval=20):
+    """
+    Run the Tk main loop together with an asyncio event loop.
+
+    Returns when the Tk main loop exits (e.g. after `root.quit()` or
+    `root.destroy()`), after cancelling the pending asyncio tasks.
+
+    Args:
+        root (tk.Tk): The Tk root.
+        coro (Coroutine|None): A coroutine to schedule at start.
+        loop (asyncio.AbstractEventLoop|None): The asyncio event loop.
+            If None, a new event loop is created.
+        interval (int): The polling interval in ms.
+            Only used if the selector has no file descriptor.
+
+    Returns:
+        result (Any): The result of `coro`, if completed, otherwise None.
+    """
+    runner = Runner(root, loop, interval)
+    task = runner.create_task(coro) if coro is not None else None
+    try:
+        root.mainloop()
+    finally:
+        completed = \
+            task is not None and task.done() and not task.cancelled()
+        runner.close()
+    # raises the exception of `coro`, if any, after the cleanup
+    return task.result() if completed else None
+
+
+# ======================================================================
+def bind(widget, sequence, coro_func, add=None):
+    """
+    Bind a widget event to a coroutine function.
+
+    Each event schedules a new task running `coro_func(event)`.
+
+    Args:
+        widget (tk.Misc): The widget.
+        sequence (str): The event sequence, e.g. `<Button-1>`.
+        coro_func (callable): The coroutine function.
+            Must accept the event as its only argument.
+        add (str|None): Add to the existing bindings if '+'.
+
+    Returns:
+        func_id (str): The binding identifier.
+    """
+
+    def handler(event):
+        get_runner(widget).create_task(coro_func(event))
+
+    return widget.bind(sequence, handler, add)
+
+
+# ======================================================================
+def call_dialog(func, *_args, **_kws):
+    """
+    Show a modal dialog without blocking the asyncio event loop.
+
+    The dialog runs from the Tk event loop (outside of the asyncio event
+    loop iteration), so that asyncio keeps running while it is shown.
+
+    Args:
+        func (callable): The dialog function,
+            e.g. `messagebox.askyesno` or `simpledialog.askstring`.
+        *_args: Positional arguments for `func`.
+        **_kws: Keyword arguments for `func`.
+
+    Returns:
+        future (asyncio.Future): The future result of the dialog.
+    """
+    root = _kws['parent']._root() if 'parent' in _kws else tk._default_root
+    runner = get_runner(root)
+    future = runner.loop.create_future()
+
+    def show():
+        try:
+            result = func(*_args, **_kws)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            if not future.cancelled():
+                future.set_result(result)
+        runner.wakeup()
+
+    root.after_idle(show)
+    return future
+
+
+# ======================================================================
+def _dialog(module_name, name):
+    def func(*_args, **_kws):
+        import pytk
+        return call_dialog(
+            getattr(getattr(pytk, module_name), name), *_args, **_kws)
+
+    func.__name__ = name
+    func.__doc__ = 'Awaitable version of `{}.{}()`.'.format(module_name, name)
+    return func
+
+
+showinfo = _dialog('messagebox', 'showinfo')
+showwarning = _dialog('messagebox', 'showwarning')
+showerror = _dialog('messagebox', 'showerror')
+askquestion = _dialog('messagebox', 'askquestion')
+askokcancel = _dialog('messagebox', 'askokcancel')
+askyesno = _dialog('messagebox', 'askyesno')
+askyesnocancel = _dialog('messagebox', 'askyesnocancel')
+askretrycancel = _dialog('messagebox', 'askretrycancel')
+askstring = _dialog('simpledialog', 'askstring')
+askinteger = _dialog('simpledialog', 'askinteger')
+askfloat = _dialog('simpledialog', 'askfloat')
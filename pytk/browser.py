@@ -0,0 +1,380 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+pytk.browser: lazy file/directory browser for very large directories.
+
+Directories are enumerated with `os.scandir()` in background threads and
+the entries are streamed into a `ttk.Treeview` in batches (through a
+`pytk.dispatch.Dispatcher`), so that the UI stays responsive on
+directories with many files or on slow network mounts.
+Subdirectories are only read when opened, the listings are cached (and
+reused as long as the modification time of the directory does not
+change) and glob filters are applied to the entries already read.
+
+Examples:
+    Browse the home directory, showing only Python files::
+
+        browser = pytk.browser.FileBrowser(root, pattern='*.py')
+        browser.pack(fill='both', expand=True)
+        browser.set_root(os.path.expanduser('~'))
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals, )
+
+# ======================================================================
+# :: Python Standard Library Imports
+import os
+import time
+import fnmatch
+import threading
+import collections
+
+from pytk import ttk
+from pytk import dispatch
+from pytk.util import _call_tcl_proc
+
+# ======================================================================
+# :: dirpath -> (mtime, details, entries)
+# with entries: (name, is_dir, size, mtime), where size and mtime are None
+# if read without details
+_LISTINGS = {}
+
+# Tcl helpers inserting/deleting a batch of entries in a single round trip.
+# Directories get a placeholder child, so that they can be opened.
+# The entries deleted may be detached or already deleted with an ancestor.
+_BROWSER_TCL = r'''
+namespace eval ::pytk {}
+proc ::pytk::browser_insert {w parent rows} {
+    foreach {iid text is_dir values} $rows {
+        $w insert $parent end -id $iid -text $text -values $values
+        if {$is_dir} {
+            $w insert $iid end
+        }
+    }
+}
+proc ::pytk::browser_delete {w iids} {
+    foreach iid $iids {
+        if {[$w exists $iid]} {
+            $w delete [list $iid]
+        }
+    }
+}
+'''
+
+
+# ======================================================================
+def _iter_entries(dirpath, details=True):
+    scandir = getattr(os, 'scandir', None)
+    if scandir is not None:
+        for entry in scandir(dirpath):
+            try:
+                is_dir = entry.is_dir()
+                stat = entry.stat() if details else None
+            except OSError:  # e.g. broken links
+                is_dir, stat = False, None
+            yield (
+                entry.name, is_dir,
+                stat.st_size if stat else None,
+                stat.st_mtime if stat else None)
+    else:
+        for name in os.listdir(dirpath):
+            path = os.path.join(dirpath, name)
+            try:
+                stat = os.stat(path) if details else None
+                is_dir = os.path.isdir(path)
+            except OSError:
+                is_dir, stat = False, None
+            yield (
+                name, is_dir,
+                stat.st_size if stat else None,
+                stat.st_mtime if stat else None)
+
+
+# ======================================================================
+def _format_size(size):
+    if size is None:
+        return ''
+    for unit in ('B', 'KB', 'MB', 'GB', 'TB'):
+        if size < 1024 or unit == 'TB':
+            break
+        size /= 1024
+    return '{:.0f} {}'.format(size, unit) if unit == 'B' \
+        else '{:.1f} {}'.format(size, unit)
+
+
+# ======================================================================
+def clear_cache():
+    """Clear the cached directory listings."""
+    _LISTINGS.clear()
+
+
+# ======================================================================
+class FileBrowser(ttk.Treeview):
+    def __init__(self, *_args, **_kws):
+        """
+        Browse directories, reading them lazily in background threads.
+
+        Args:
+            *_args: Positional arguments for `ttk.Treeview`.
+            **_kws: Keyword arguments for `ttk.Treeview`, and:
+                pattern (str|Iterable[str]|None): The glob patterns of the
+                    files shown. Directories are always shown.
+                details (bool): Show the size and the modification time.
+                    Requires a `stat()` call per entry.
+                show_hidden (bool): Show the entries starting with `.`.
+                batch_size (int): The number of entries read per batch.
+                rows_per_flush (int): The maximum number of rows inserted
+                    into the view at once.
+                dispatcher (pytk.dispatch.Dispatcher|None): The dispatcher
+                    for the updates from the threads.
+                    If None, a new one is created.
+
+        Returns:
+            None.
+        """
+        pattern = _kws.pop('pattern', None)
+        self.details = _kws.pop('details', True)
+        self.show_hidden = _kws.pop('show_hidden', False)
+        self.batch_size = _kws.pop('batch_size', 1000)
+        self.rows_per_flush = _kws.pop('rows_per_flush', 5000)
+        dispatcher = _kws.pop('dispatcher', None)
+        if self.details:
+            _kws.setdefault('columns', ('size', 'modified'))
+        super(FileBrowser, self).__init__(*_args, **_kws)
+        if self.details:
+            self.heading('#0', text='Name')
+            self.heading('size', text='Size')
+            self.heading('modified', text='Modified')
+            self.column('size', anchor='e', width=80, stretch=False)
+            self.column('modified', width=130, stretch=False)
+        self._owns_dispatcher = dispatcher is None
+        self.dispatcher = dispatch.Dispatcher(self.winfo_toplevel()) \
+            if dispatcher is None else dispatcher
+        self.root_dirpath = None
+        self.patterns = None
+        self.set_pattern(pattern, refresh=False)
+        # dirpath -> entries read so far (for the directories opened)
+        self._entries = {}
+        # dirpath -> token of the scan in progress
+        self._scans = {}
+        # the iids inserted
+        self._created = set()
+        # the iids of the directories inserted
+        self._dirs = set()
+        # (dirpath, token, entries, done, error) read by the threads
+        self._pending = collections.deque()
+        self._closed = False
+        self.bind('<<TreeviewOpen>>', self._on_open, '+')
+
+    def _get_node(self, dirpath):
+        return '' if dirpath == self.root_dirpath else dirpath
+
+    def _is_shown(self, entry):
+        name, is_dir = entry[:2]
+        if not self.show_hidden and name.startswith('.'):
+            return False
+        return is_dir or self.patterns is None \
+            or any(fnmatch.fnmatch(name, pattern) for pattern in self.patterns)
+
+    def set_root(self, dirpath):
+        """
+        Show the content of a directory.
+
+        Args:
+            dirpath (str): The directory path.
+
+        Returns:
+            None.
+        """
+        self.clear()
+        self.root_dirpath = os.path.realpath(dirpath)
+        self._load(self.root_dirpath)
+
+    def clear(self):
+        """Remove all the entries (stopping the scans in progress)."""
+        self._scans.clear()
+        self._entries.clear()
+        # the entries hidden by the filters are detached, not deleted
+        self._delete(list(self._created) + list(self.get_children()))
+        self._created.clear()
+        self._dirs.clear()
+        self._pending.clear()
+
+    def refresh(self, dirpath=None):
+        """
+        Read a directory again (if modified) and show its content.
+
+        Args:
+            dirpath (str|None): The directory path.
+                If None, the root directory is refreshed.
+
+        Returns:
+            None.
+        """
+        if dirpath is None:
+            dirpath = self.root_dirpath
+        node = self._get_node(dirpath)
+        self._delete(self._forget(dirpath) + list(self.get_children(node)))
+        self._load(dirpath)
+
+    def _forget(self, dirpath):
+        # forget the entries of a directory and of its subdirectories,
+        # return the iids inserted for them
+        prefix = os.path.join(dirpath, '')
+        for key in list(self._entries):
+            if key == dirpath or key.startswith(prefix):
+                del self._entries[key]
+                self._scans.pop(key, None)
+        removed = [iid for iid in self._created if iid.startswith(prefix)]
+        self._created.difference_update(removed)
+        self._dirs.difference_update(removed)
+        return removed
+
+    def _delete(self, iids):
+        if iids:
+            _call_tcl_proc(
+                self, _BROWSER_TCL, '::pytk::browser_delete', self, iids)
+
+    def _on_open(self, event):
+        # also fired for the files (e.g. on double-click)
+        iid = self.focus()
+        if iid in self._dirs and iid not in self._entries:
+            # remove the placeholder
+            self.delete(*self.get_children(iid))
+            self._load(iid)
+
+    def _load(self, dirpath):
+        self._entries[dirpath] = []
+        token = object()
+        self._scans[dirpath] = token
+        thread = threading.Thread(target=self._scan, args=(dirpath, token))
+        thread.daemon = True
+        thread.start()
+
+    def _scan(self, dirpath, token):
+        # runs in a worker thread
+        try:
+            mtime = os.stat(dirpath).st_mtime
+            cached = _LISTINGS.get(dirpath)
+            # listings with details can also be used without
+            if cached is not None and cached[0] == mtime \
+                    and (cached[1] or not self.details):
+                entries = cached[2]
+                for i in range(0, len(entries), self.batch_size):
+                    self._post(dirpath, token, entries[i:i + self.batch_size])
+            else:
+                entries = []
+                batch = []
+                for entry in _iter_entries(dirpath, self.details):
+                    batch.append(entry)
+                    if len(batch) >= self.batch_size:
+                        if self._scans.get(dirpath) is not token:
+                            return
+                        self._post(dirpath, token, batch)
+                        entries.extend(batch)
+                        batch = []
+                entries.extend(batch)
+                self._post(dirpath, token, batch)
+                _LISTINGS[dirpath] = mtime, self.details, entries
+        except OSError as e:
+            self._post(dirpath, token, [], error=e)
+        self._post(dirpath, token, [], done=True)
+
+    def _post(self, dirpath, token, entries, done=False, error=None):
+        if not self._closed:
+            self._pending.append((dirpath, token, entries, done, error))
+            self.dispatcher.post(self, 'browser', self._flush)
+
+    def _flush(self):
+        num = 0
+        while self._pending and num < self.rows_per_flush:
+            dirpath, token, entries, done, error = self._pending.popleft()
+            if self._scans.get(dirpath) is not token:
+                continue
+            self._entries[dirpath].extend(entries)
+            num += self._insert(dirpath, entries)
+            if error is not None:
+                self.event_generate('<<FileBrowserError>>')
+            if done:
+                del self._scans[dirpath]
+                self._arrange(dirpath)
+                self.event_generate('<<FileBrowserLoaded>>')
+        if self._pending:
+            self.dispatcher.post(self, 'browser', self._flush)
+
+    def _insert(self, dirpath, entries):
+        rows = []
+        for entry in entries:
+            iid = os.path.join(dirpath, entry[0])
+            if iid not in self._created and self._is_shown(entry):
+                self._created.add(iid)
+                if entry[1]:
+                    self._dirs.add(iid)
+                rows.extend(
+                    (iid, entry[0], int(entry[1]), self._format(entry)))
+        if rows:
+            _call_tcl_proc(
+                self, _BROWSER_TCL, '::pytk::browser_insert',
+                self, self._get_node(dirpath), rows)
+        return len(rows) // 4
+
+    def _format(self, entry):
+        if not self.details:
+            return ()
+        name, is_dir, size, mtime = entry
+        return (
+            '' if is_dir else _format_size(size),
+            time.strftime('%Y-%m-%d %H:%M', time.localtime(mtime))
+            if mtime is not None else '')
+
+    def _arrange(self, dirpath):
+        # show the matching entries (directories first, sorted by name)
+        entries = sorted(
+            (entry for entry in self._entries[dirpath]
+             if self._is_shown(entry)),
+            key=lambda x: (not x[1], x[0].lower()))
+        self._insert(dirpath, entries)
+        self.set_children(
+            self._get_node(dirpath),
+            *[os.path.join(dirpath, entry[0]) for entry in entries])
+
+    def set_pattern(self, pattern=None, refresh=True):
+        """
+        Show only the files matching glob patterns.
+
+        The directories already read are filtered again, without reading
+        them.
+
+        Args:
+            pattern (str|Iterable[str]|None): The glob patterns.
+                Multiple patterns can also be separated by `;`.
+                If None or empty, all the files are shown.
+            refresh (bool): Update the entries shown.
+
+        Returns:
+            None.
+        """
+        if isinstance(pattern, str):
+            pattern = pattern.split(';')
+        self.patterns = tuple(
+            item.strip() for item in pattern if item.strip()) \
+            if pattern else None
+        if not self.patterns:
+            self.patterns = None
+        if refresh:
+            for dirpath in self._entries:
+                self._arrange(dirpath)
+
+    def get_val(self):
+        """Get the paths of the selected entries."""
+        return list(self.selection())
+
+    def destroy(self):
+        self._closed = True
+        self._scans.clear()
+        if self._owns_dispatcher:
+            self.dispatcher.close()
+        super(FileBrowser, self).destroy()
@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+pytk.declarative: declarative UI description with a reconciling renderer.
+
+A UI is described as a tree of elements (dicts, see `element()`) naming
+the widget classes, e.g. from `pytk.widgets`, with their options, value,
+callbacks and geometry manager options.
+A `Renderer` creates the widgets for a tree and, when given a new tree,
+compares it with the previous one and applies only the differences:
+the widgets are matched by `key` among their siblings (or by position),
+only the changed options are configured (in a single call per widget),
+only the changed values are set, and the widgets no longer present are
+destroyed.
+The callbacks are wrapped in stable proxies, so that passing a new
+function (e.g. a lambda) does not reconfigure the widget.
+
+Examples:
+    Re-render the whole form on every state change::
+
+        renderer = pytk.declarative.Renderer(frame)
+
+        def render():
+            renderer.render([
+                element('Entry', key='name', val=state['name'],
+                        on_change=lambda val: update(name=val)),
+                element('Checkbox', key='admin', text='Admin',
+                        val=state['admin'],
+                        on_change=lambda val: update(admin=val)),
+                element('Spinbox', key='level', start=0, stop=9,
+                        val=state['level'])
+                if state['admin'] else None,
+                element('Frame', key='buttons', pack=dict(fill='x'),
+                        children=[element('Button', text='OK')])])
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals, )
+
+# ======================================================================
+# :: Python Standard Library Imports
+import collections
+
+from pytk import tk
+from pytk import ttk
+from pytk import widgets
+
+# ======================================================================
+# :: the element keys not passed to the widgets
+GEOMETRY_MANAGERS = ('pack', 'grid', 'place')
+_RESERVED = frozenset(('type', 'key', 'children') + GEOMETRY_MANAGERS)
+
+# :: widget class -> Tk options
+_OPTIONS = {}
+
+_MISSING = object()
+
+
+# ======================================================================
+def element(type_, key=None, children=(), **_kws):
+    """
+    Describe a widget.
+
+    Args:
+        type_ (str|type): The widget class (or its name).
+            Names are looked up in `pytk.widgets`, then in `ttk` and `tk`.
+        key (Hashable|None): The identifier among the siblings.
+            If None, the position among the siblings is used.
+        children (Iterable[dict|None]): The child elements.
+            None items are ignored (e.g. for conditional elements).
+        **_kws: The widget options, and:
+            val: The value (set with `set_val()`).
+            values: The values (set with `set_values()`, if available).
+            pack (dict): The `pack()` options.
+            grid (dict): The `grid()` options.
+            place (dict): The `place()` options.
+            If no geometry manager is specified, `pack()` is used.
+
+    Returns:
+        result (dict): The element.
+
+    Examples:
+        >>> sorted(element('Entry', key='name', val='x').items())
+        [('children', []), ('key', 'name'), ('type', 'Entry'), ('val', 'x')]
+    """
+    result = dict(_kws)
+    result.update(type=type_, key=key, children=list(children))
+    return result
+
+
+# ======================================================================
+def _get_class(type_):
+    if isinstance(type_, type):
+        return type_
+    for module in (widgets, ttk, tk):
+        cls = getattr(module, type_, None)
+        if isinstance(cls, type):
+            return cls
+    raise ValueError('Renderer: unknown widget type `{}`'.format(type_))
+
+
+# ======================================================================
+def _get_options(widget):
+    cls = type(widget)
+    if cls not in _OPTIONS:
+        _OPTIONS[cls] = frozenset(widget.keys())
+    return _OPTIONS[cls]
+
+
+# ======================================================================
+def _get_geometry(elem):
+    for manager in GEOMETRY_MANAGERS:
+        if manager in elem:
+            return manager, dict(elem[manager] or {})
+    return 'pack', {}
+
+
+# ======================================================================
+class _Handler(object):
+    def __init__(self, renderer, func):
+        self.renderer = renderer
+        self.func = func
+
+    def __call__(self, *_args, **_kws):
+        # values set by the renderer are not notified
+        if not self.renderer._muted:
+            return self.func(*_args, **_kws)
+
+
+# ======================================================================
+class _Node(object):
+    def __init__(self, cls, widget, props, geometry):
+        self.cls = cls
+        self.widget = widget
+        self.props = props
+        self.geometry = geometry
+        # option name -> _Handler
+        self.handlers = {}
+        # key -> _Node
+        self.children = collections.OrderedDict()
+
+
+# ======================================================================
+class Renderer(object):
+    def __init__(self, parent):
+        """
+        Render element trees into a parent widget, reconciling the changes.
+
+        Args:
+            parent (tk.Widget): The parent of the rendered widgets.
+
+        Returns:
+            None.
+        """
+        self.parent = parent
+        self.children = collections.OrderedDict()
+        self.stats = collections.Counter()
+        self._muted = False
+
+    def render(self, tree):
+        """
+        Render a tree, applying only the differences from the previous one.
+
+        Args:
+            tree (dict|Iterable[dict|None]): The element(s).
+
+        Returns:
+            stats (collections.Counter): The number of widgets `created`,
+                `configured` (options and geometry), `set` (values) and
+                `destroyed`.
+        """
+        if isinstance(tree, dict):
+            tree = [tree]
+        self.stats = collections.Counter()
+        self.children = self._reconcile(self.parent, self.children, tree)
+        return self.stats
+
+    def get_widget(self, path):
+        """
+        Get a rendered widget.
+
+        Args:
+            path (str|Sequence): The keys from the root, separated by `/`.
+                The elements without a key are identified by `#<position>`.
+
+        Returns:
+            widget (tk.Widget): The widget.
+
+        Raises:
+            KeyError: If the path does not exist.
+        """
+        if isinstance(path, str):
+            path = path.split('/')
+        children = self.children
+        node = None
+        for key in path:
+            node = children[key]
+            children = node.children
+        if node is None:
+            raise KeyError(path)
+        return node.widget
+
+    def clear(self):
+        """Destroy all the rendered widgets."""
+        self.render([])
+
+    def _reconcile(self, parent, old_children, elems):
+        old_children = collections.OrderedDict(old_children)
+        old_order = list(old_children.values())
+        new_children = collections.OrderedDict()
+        created = set()
+        elems = [elem for elem in elems if elem is not None]
+        for i, elem in enumerate(elems):
+            key = elem.get('key')
+            if key is None:
+                key = '#{}'.format(i)
+            if key in new_children:
+                raise ValueError('Renderer: duplicate key `{}`'.format(key))
+            cls = _get_class(elem['type'])
+            node = old_children.pop(key, None)
+            if node is None or node.cls is not cls \
+                    or not self._update(node, elem):
+                if node is not None:
+                    self._destroy(node)
+                node = self._create(parent, cls, elem)
+                created.add(node)
+            new_children[key] = node
+        for node in old_children.values():
+            self._destroy(node)
+        self._arrange(new_children, old_order, created)
+        return new_children
+
+    def _split_props(self, elem):
+        return {
+            name: val for name, val in elem.items() if name not in _RESERVED}
+
+    def _wrap(self, node, name, val):
+        if callable(val):
+            node.handlers[name] = handler = _Handler(self, val)
+            return handler
+        return val
+
+    def _create(self, parent, cls, elem):
+        props = self._split_props(elem)
+        node = _Node(cls, None, props, _get_geometry(elem))
+        kws = {
+            name: self._wrap(node, name, val) for name, val in props.items()
+            if name != 'val'}
+        node.widget = cls(parent, **kws)
+        self.stats['created'] += 1
+        if 'val' in props:
+            self._set_val(node, props['val'])
+        node.children = self._reconcile(
+            node.widget, {}, elem.get('children', ()))
+        return node
+
+    def _update(self, node, elem):
+        # returns False if the widget must be created again
+        props = self._split_props(elem)
+        options = _get_options(node.widget)
+        changed = {}
+        for name in set(node.props) | set(props):
+            old = node.props.get(name, _MISSING)
+            new = props.get(name, _MISSING)
+            if name in node.handlers:
+                if not callable(new):
+                    return False
+                node.handlers[name].func = new
+            elif old == new or name == 'val':
+                continue
+            elif name == 'values' and hasattr(node.widget, 'set_values'):
+                node.widget.set_values(() if new is _MISSING else new)
+                self.stats['configured'] += 1
+            elif name.rstrip('_') in options:
+                changed[name] = node.widget.configure(name)[3] \
+                    if new is _MISSING else self._wrap(node, name, new)
+            else:
+                # only accepted by the constructor
+                return False
+        if changed:
+            node.widget.configure(**changed)
+            self.stats['configured'] += 1
+        if 'val' in props and props['val'] != node.props.get('val', _MISSING):
+            self._set_val(node, props['val'])
+        node.props = props
+        node.children = self._reconcile(
+            node.widget, node.children, elem.get('children', ()))
+        geometry = _get_geometry(elem)
+        if geometry != node.geometry:
+            if geometry[0] != node.geometry[0]:
+                getattr(node.widget, node.geometry[0] + '_forget')()
+                getattr(node.widget, geometry[0])(**geometry[1])
+            else:
+                getattr(node.widget, geometry[0] + '_configure')(
+                    **geometry[1])
+            node.geometry = geometry
+            self.stats['configured'] += 1
+        return True
+
+    def _set_val(self, node, val):
+        self._muted = True
+        try:
+            node.widget.set_val(val)
+        finally:
+            self._muted = False
+        self.stats['set'] += 1
+
+    def _destroy(self, node):
+        node.widget.destroy()
+        self.stats['destroyed'] += 1
+
+    def _arrange(self, children, old_order, created):
+        packed = [
+            node for node in children.values() if node.geometry[0] == 'pack']
+        kept = [node for node in packed if node not in created]
+        if kept != [node for node in old_order if node in kept]:
+            # the order of the packed widgets changed: pack them again
+            for node in packed:
+                node.widget.pack_forget()
+            for node in packed:
+                node.widget.pack(**node.geometry[1])
+            self.stats['configured'] += len(kept)
+            return
+        prev = None
+        for node in packed:
+            if node in created:
+                kws = dict(node.geometry[1])
+                if prev is not None:
+                    kws['after'] = prev.widget
+                elif kept:
+                    kws['before'] = kept[0].widget
+                node.widget.pack(**kws)
+            prev = node
+        for node in created:
+            if node.geometry[0] != 'pack':
+                getattr(node.widget, node.geometry[0])(**node.geometry[1])
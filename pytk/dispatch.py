@@ -0,0 +1,333 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+pytk.dispatch: thread-safe batched UI updates from worker threads/processes.
+
+Tk widgets must only be used from the thread running the Tk event loop.
+Worker threads post updates to a `Dispatcher`, which coalesces them
+(last write wins per widget and property, appends are concatenated) and
+applies them on the Tk thread at most `fps` times per second.
+Worker processes can post updates through a `multiprocessing` pipe with
+`PipeClient`, identifying widgets by their Tk path name.
+
+Examples:
+    A worker thread updating a progress bar and a Listview::
+
+        dispatcher = pytk.dispatch.Dispatcher(root, fps=30)
+
+        def work():
+            for i, path in enumerate(find_files()):
+                dispatcher.configure(progressbar, value=i)
+                dispatcher.append(listview, [path])
+
+        threading.Thread(target=work).start()
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals, )
+
+# ======================================================================
+# :: Python Standard Library Imports
+import os
+import sys
+import time
+import itertools
+import threading
+import collections
+
+from pytk import tk
+
+
+# ======================================================================
+class Dispatcher(object):
+    def __init__(self, root, fps=60):
+        """
+        Apply coalesced UI updates posted from other threads on the Tk thread.
+
+        Args:
+            root (tk.Tk): The Tk root.
+                Must be created in the thread running the Tk event loop.
+            fps (int|float): The maximum number of drains per second.
+
+        Returns:
+            None.
+        """
+        self.root = root
+        self.period = 1.0 / fps
+        self._lock = threading.Lock()
+        # (widget path, key) -> (func, args)
+        self._updates = collections.OrderedDict()
+        # widget path -> (widget, items)
+        self._appends = collections.OrderedDict()
+        self._counter = itertools.count()
+        self._first_post = None
+        self._last_drain = 0.0
+        self._after_id = None
+        self._poll_id = None
+        self._conns = []
+        self.stats = {
+            'posted': 0, 'coalesced': 0, 'applied': 0, 'drains': 0,
+            'depth': 0, 'max_depth': 0,
+            'last_latency': 0.0, 'max_latency': 0.0, 'total_latency': 0.0}
+        self._has_filehandler = hasattr(root.tk, 'createfilehandler')
+        if self._has_filehandler:
+            # the workers wake up the Tk thread by writing to a pipe
+            self._wake_r, self._wake_w = os.pipe()
+            root.tk.createfilehandler(
+                self._wake_r, tk.READABLE, self._on_wakeup)
+        else:
+            self._wake_r = self._wake_w = None
+            self._poll()
+
+    # ------------------------------------------------------------------
+    # :: worker side (thread-safe)
+    def post(self, widget, key, func, *_args):
+        """
+        Post a coalescing update: only the last one per `widget`/`key` runs.
+
+        Args:
+            widget (tk.Misc|str): The widget (or its Tk path name).
+            key (Hashable): The property being updated.
+            func (callable): The function applying the update.
+            *_args: Positional arguments for `func`.
+
+        Returns:
+            None.
+        """
+        self._post((str(widget), key), func, _args)
+
+    def call(self, func, *_args):
+        """Post a call to run on the Tk thread (never coalesced)."""
+        self._post((None, next(self._counter)), func, _args)
+
+    def set_val(self, widget, val):
+        """Post a `widget.set_val(val)` update (last write wins)."""
+        self._post((str(widget), 'val'), self._set_val, (widget, val))
+
+    def configure(self, widget, **_kws):
+        """Post `widget.configure()` updates (last write wins per option)."""
+        for name, val in _kws.items():
+            self._post(
+                (str(widget), ('configure', name)),
+                self._configure, (widget, name, val))
+
+    def append(self, widget, items):
+        """
+        Post items to append to a Listview-like widget.
+
+        All the items appended between drains are added in a single call to
+        `widget.add_items()` (or `widget.add_item()` for each, if missing).
+
+        Args:
+            widget (tk.Misc|str): The widget (or its Tk path name).
+            items (Iterable): The items to append.
+
+        Returns:
+            None.
+        """
+        items = list(items)
+        with self._lock:
+            path = str(widget)
+            if path in self._appends:
+                self._appends[path][1].extend(items)
+                self.stats['coalesced'] += 1
+            else:
+                self._appends[path] = (widget, items)
+            wake = self._touch(len(items))
+        if wake:
+            self._wakeup()
+
+    def _post(self, key, func, args):
+        with self._lock:
+            if key in self._updates:
+                self.stats['coalesced'] += 1
+                self.stats['depth'] -= 1
+            self._updates[key] = (func, args)
+            wake = self._touch(1)
+        if wake:
+            self._wakeup()
+
+    def _touch(self, num):
+        # must be called with the lock held
+        self.stats['posted'] += num
+        self.stats['depth'] += num
+        if self.stats['depth'] > self.stats['max_depth']:
+            self.stats['max_depth'] = self.stats['depth']
+        if self._first_post is None:
+            self._first_post = time.time()
+            return True
+        else:
+            return False
+
+    def _wakeup(self):
+        # the lock prevents writing to the pipe while `close()` closes it
+        with self._lock:
+            if self._wake_w is not None:
+                os.write(self._wake_w, b'x')
+
+    # ------------------------------------------------------------------
+    # :: Tk thread side
+    def _widget(self, widget):
+        return self.root.nametowidget(widget) \
+            if isinstance(widget, str) else widget
+
+    def _set_val(self, widget, val):
+        self._widget(widget).set_val(val)
+
+    def _configure(self, widget, name, val):
+        self._widget(widget).configure(**{name: val})
+
+    def _on_wakeup(self, fd, mask):
+        os.read(fd, 4096)
+        self._schedule()
+
+    def _schedule(self):
+        if self._after_id is None:
+            delay = self._last_drain + self.period - time.time()
+            self._after_id = self.root.after(
+                max(0, int(delay * 1000)), self.drain)
+
+    def _poll(self):
+        if self._first_post is not None:
+            self.drain()
+        self._poll_id = self.root.after(int(self.period * 1000), self._poll)
+
+    def drain(self):
+        """Apply all the pending updates (must run on the Tk thread)."""
+        self._after_id = None
+        with self._lock:
+            updates, self._updates = \
+                self._updates, collections.OrderedDict()
+            appends, self._appends = \
+                self._appends, collections.OrderedDict()
+            first_post, self._first_post = self._first_post, None
+            self.stats['depth'] = 0
+        if first_post is None:
+            return
+        for func, args in updates.values():
+            self._apply(func, *args)
+        for widget, items in appends.values():
+            self._apply(self._append, widget, items)
+        now = time.time()
+        self._last_drain = now
+        latency = now - first_post
+        self.stats['drains'] += 1
+        self.stats['applied'] += \
+            len(updates) + sum(len(items) for _, items in appends.values())
+        self.stats['last_latency'] = latency
+        self.stats['total_latency'] += latency
+        if latency > self.stats['max_latency']:
+            self.stats['max_latency'] = latency
+
+    def _apply(self, func, *_args):
+        try:
+            func(*_args)
+        except Exception:
+            self.root.report_callback_exception(*sys.exc_info())
+
+    def _append(self, widget, items):
+        widget = self._widget(widget)
+        if hasattr(widget, 'add_items'):
+            widget.add_items(items)
+        else:
+            for item in items:
+                widget.add_item(item)
+
+    def connect(self, conn):
+        """
+        Accept updates from another process through a pipe.
+
+        Args:
+            conn (multiprocessing.connection.Connection): The receiving end
+                of a `multiprocessing.Pipe()`.
+                The other end should be used with `PipeClient`.
+
+        Returns:
+            None.
+        """
+        if not self._has_filehandler:
+            raise RuntimeError(
+                'Dispatcher: pipes require Tk file handlers (not on Windows).')
+
+        def on_readable(fd, mask):
+            try:
+                while conn.poll():
+                    method, path, args, kws = conn.recv()
+                    getattr(self, method)(path, *args, **kws)
+            except EOFError:
+                self.root.tk.deletefilehandler(conn.fileno())
+                self._conns.remove(conn)
+
+        self._conns.append(conn)
+        self.root.tk.createfilehandler(
+            conn.fileno(), tk.READABLE, on_readable)
+
+    def get_stats(self):
+        """
+        Get the instrumentation counters.
+
+        Returns:
+            stats (dict): The counters, including:
+             - `depth`: the number of updates currently queued;
+             - `max_depth`: the maximum number of updates queued;
+             - `posted`/`coalesced`/`applied`: the number of updates;
+             - `drains`: the number of drains;
+             - `last_latency`/`max_latency`/`mean_latency`: the time in s
+               between the first update posted and its drain.
+        """
+        with self._lock:
+            stats = dict(self.stats)
+        stats['mean_latency'] = \
+            stats['total_latency'] / stats['drains'] if stats['drains'] else 0
+        return stats
+
+    def close(self):
+        """Stop accepting updates and release the resources."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+        for conn in self._conns:
+            self.root.tk.deletefilehandler(conn.fileno())
+        self._conns = []
+        if self._wake_r is not None:
+            self.root.tk.deletefilehandler(self._wake_r)
+            with self._lock:
+                os.close(self._wake_r)
+                os.close(self._wake_w)
+                self._wake_r = self._wake_w = None
+
+
+# ======================================================================
+class PipeClient(object):
+    def __init__(self, conn):
+        """
+        Post UI updates to a `Dispatcher` in another process.
+
+        Widgets are identified by their Tk path name, i.e. `str(widget)`.
+
+        Args:
+            conn (multiprocessing.connection.Connection): The sending end
+                of a `multiprocessing.Pipe()`, whose receiving end was passed
+                to `Dispatcher.connect()`.
+
+        Returns:
+            None.
+        """
+        self.conn = conn
+
+    def set_val(self, path, val):
+        self.conn.send(('set_val', path, (val,), {}))
+
+    def configure(self, path, **_kws):
+        self.conn.send(('configure', path, (), _kws))
+
+    def append(self, path, items):
+        self.conn.send(('append', path, (list(items),), {}))
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,414 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+pytk.image: display large images from memory buffers.
+
+The pixels are read from any object supporting the buffer protocol
+(e.g. `bytes`, `bytearray`, `memoryview`, `array.array`) or from NumPy
+arrays, and converted to `tk.PhotoImage` via in-memory PGM/PPM encoding,
+without temporary files.
+`ImageView` only converts the tiles intersecting the viewport at the
+current zoom level, and keeps the converted tiles in an LRU cache limited
+by memory usage, so that the source image is never copied as a whole.
+
+Examples:
+    Show a large NumPy array::
+
+        view = pytk.image.ImageView(root, cache_size=128 * 2 ** 20)
+        view.pack(fill='both', expand=True)
+        view.set_image(numpy.random.randint(0, 256, (16384, 16384, 3)))
+
+    Drag to pan, use the mouse wheel to zoom.
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals, )
+
+# ======================================================================
+# :: Python Standard Library Imports
+import collections
+
+from pytk import tk
+from pytk import util
+from pytk.Geometry import Geometry
+
+
+# ======================================================================
+def _get_region(data, width, channels, left, top, right, bottom, step=1):
+    # pixels of a region (grayscale or RGB) as bytes, sampled every `step`
+    if hasattr(data, 'dtype'):  # NumPy arrays
+        region = data[top:bottom:step, left:right:step]
+        if region.ndim == 3:
+            region = region[:, :, :3] if channels > 1 else region[:, :, 0]
+        return region.tobytes()
+    row_size = width * channels
+    out_channels = 1 if channels == 1 else 3
+    result = bytearray()
+    for y in range(top, bottom, step):
+        row = data[y * row_size + left * channels:y * row_size
+                   + right * channels]
+        if step == 1 and channels == out_channels:
+            result += row
+        elif channels == 1:
+            result += row[::step].tobytes()
+        else:
+            num = len(range(left, right, step))
+            pixels = bytearray(num * out_channels)
+            for channel in range(out_channels):
+                pixels[channel::out_channels] = \
+                    row[channel::step * channels].tobytes()
+            result += pixels
+    return bytes(result)
+
+
+# ======================================================================
+def _normalize(data, vmin, vmax):
+    # NumPy arrays of other types are scaled to `uint8`
+    import numpy as np
+    scale = 255.0 / (vmax - vmin) if vmax != vmin else 0.0
+    return np.clip((data - vmin) * scale, 0, 255).astype(np.uint8)
+
+
+# ======================================================================
+def encode_pnm(pixels, width, height, channels=1):
+    """
+    Encode pixels as binary PGM (grayscale) or PPM (RGB).
+
+    Args:
+        pixels (bytes): The 8-bit pixels, row by row.
+        width (int): The width in px.
+        height (int): The height in px.
+        channels (int): The number of channels, either 1 or 3.
+
+    Returns:
+        data (bytes): The encoded image.
+
+    Examples:
+        >>> encode_pnm(b'abcdef', 3, 2)
+        b'P5 3 2 255\\nabcdef'
+        >>> encode_pnm(b'abcdef', 2, 1, 3)
+        b'P6 2 1 255\\nabcdef'
+    """
+    header = 'P{} {} {} 255\n'.format(5 if channels == 1 else 6, width, height)
+    return header.encode('ascii') + pixels
+
+
+# ======================================================================
+def _get_shape(data, width, height, channels):
+    if hasattr(data, 'dtype'):
+        height, width = data.shape[:2]
+        channels = data.shape[2] if data.ndim == 3 else 1
+    elif width is None or height is None:
+        raise ValueError('Image: `width` and `height` required for buffers.')
+    elif channels is None:
+        channels = len(data) // (width * height)
+    if channels not in (1, 3, 4):
+        raise ValueError(
+            'Image: 1, 3 or 4 channels required (got {}).'.format(channels))
+    return width, height, channels
+
+
+# ======================================================================
+def make_photo(
+        data,
+        width=None,
+        height=None,
+        channels=None,
+        master=None):
+    """
+    Create a PhotoImage from 8-bit pixels in memory.
+
+    Args:
+        data (Buffer|numpy.ndarray): The pixels.
+            Either an object supporting the buffer protocol, with the 8-bit
+            pixels row by row, or a NumPy array with shape (height, width)
+            or (height, width, channels), of type `uint8`.
+            Alpha channels are ignored.
+        width (int|None): The width in px. Required for buffers.
+        height (int|None): The height in px. Required for buffers.
+        channels (int|None): The number of channels (1, 3 or 4).
+            If None, it is deduced from the size of the data.
+        master (tk.Misc|None): The master widget.
+
+    Returns:
+        photo (tk.PhotoImage): The image.
+    """
+    if not hasattr(data, 'dtype'):
+        data = memoryview(data).cast('B')
+    width, height, channels = _get_shape(data, width, height, channels)
+    pixels = _get_region(data, width, channels, 0, 0, width, height)
+    return tk.PhotoImage(
+        master=master, format='PPM',
+        data=encode_pnm(pixels, width, height, 1 if channels == 1 else 3))
+
+
+# ======================================================================
+class ImageView(tk.Canvas):
+    def __init__(self, *_args, **_kws):
+        """
+        Show a large image with tiled rendering, pan and zoom.
+
+        Args:
+            *_args: Positional arguments for `tk.Canvas`.
+            **_kws: Keyword arguments for `tk.Canvas`, and:
+                tile_size (int): The size of the tiles in px.
+                    Must be a power of 2.
+                cache_size (int): The maximum memory used by the tiles
+                    in bytes (the tiles shown are always kept).
+                tiles_per_frame (int): The maximum number of tiles converted
+                    per idle cycle; the others are converted in the next ones.
+                max_zoom (int): The maximum zoom factor (a power of 2).
+
+        Returns:
+            None.
+        """
+        self.tile_size = _kws.pop('tile_size', 256)
+        self.cache_size = _kws.pop('cache_size', 256 * 2 ** 20)
+        self.tiles_per_frame = _kws.pop('tiles_per_frame', 8)
+        self.max_zoom = _kws.pop('max_zoom', 16)
+        _kws.setdefault('highlightthickness', 0)
+        super(ImageView, self).__init__(*_args, **_kws)
+        self._data = None
+        self._shape = None
+        self._range = None
+        self._level = 0
+        # (level, column, row) -> (photo, size in bytes)
+        self._tiles = collections.OrderedDict()
+        self._tiles_size = 0
+        # (level, column, row) -> canvas item
+        self._items = {}
+        self._render_id = None
+        self._pointer = None
+        self.bind('<Configure>', lambda event: self.refresh())
+        self.bind('<Motion>', self._on_motion)
+        self.bind('<ButtonPress-1>', self._on_press)
+        self.bind('<B1-Motion>', self._on_drag)
+        util.bind_wheel(self, self._on_wheel)
+
+    def set_image(
+            self,
+            data,
+            width=None,
+            height=None,
+            channels=None,
+            vmin=None,
+            vmax=None):
+        """
+        Set the image to show.
+
+        The data is not copied: only the tiles being shown are converted.
+
+        Args:
+            data (Buffer|numpy.ndarray): The pixels.
+                Either an object supporting the buffer protocol, with the
+                8-bit pixels row by row, or a NumPy array with shape
+                (height, width) or (height, width, channels).
+                Alpha channels are ignored.
+            width (int|None): The width in px. Required for buffers.
+            height (int|None): The height in px. Required for buffers.
+            channels (int|None): The number of channels (1, 3 or 4).
+                If None, it is deduced from the size of the data.
+            vmin (int|float|None): The value shown as black.
+                Only used for NumPy arrays not of type `uint8`.
+                If None, the minimum of the data is used.
+            vmax (int|float|None): The value shown as white.
+                Only used for NumPy arrays not of type `uint8`.
+                If None, the maximum of the data is used.
+
+        Returns:
+            None.
+        """
+        self._range = None
+        if not hasattr(data, 'dtype'):
+            data = memoryview(data).cast('B')
+        elif data.dtype.name != 'uint8':
+            self._range = (
+                float(data.min()) if vmin is None else vmin,
+                float(data.max()) if vmax is None else vmax)
+        self._shape = _get_shape(data, width, height, channels)
+        self._data = data
+        self.clear_cache()
+        self.set_zoom(self._level, None)
+
+    def clear_cache(self):
+        """Discard all the converted tiles."""
+        self.delete('tile')
+        self._items = {}
+        self._tiles.clear()
+        self._tiles_size = 0
+        self.refresh()
+
+    def get_zoom(self):
+        """Get the zoom factor (a power of 2)."""
+        return 2.0 ** self._level
+
+    def set_zoom(self, level, center=None):
+        """
+        Set the zoom level.
+
+        Args:
+            level (int): The zoom level. The zoom factor is `2 ** level`.
+            center (tuple[int,int]|None): The widget coordinates kept in
+                place. If None, the center of the widget is used.
+
+        Returns:
+            None.
+        """
+        if self._data is None:
+            return
+        width, height = self._shape[:2]
+        min_level = 1 - max(width, height).bit_length()
+        level = max(min_level, min(level, self.max_zoom.bit_length() - 1))
+        if center is None:
+            center = self.winfo_width() // 2, self.winfo_height() // 2
+        # the image coordinates under `center`
+        x = self.canvasx(center[0]) / 2.0 ** self._level
+        y = self.canvasy(center[1]) / 2.0 ** self._level
+        if level != self._level:
+            self.delete('tile')
+            self._items = {}
+            self._level = level
+        zoom = 2.0 ** level
+        self.configure(scrollregion=(
+            0, 0, int(width * zoom), int(height * zoom)))
+        self.xview_moveto((x * zoom - center[0]) / (width * zoom))
+        self.yview_moveto((y * zoom - center[1]) / (height * zoom))
+
+    def xview(self, *args):
+        result = super(ImageView, self).xview(*args)
+        if args:
+            self.refresh()
+        return result
+
+    def yview(self, *args):
+        result = super(ImageView, self).yview(*args)
+        if args:
+            self.refresh()
+        return result
+
+    def xview_moveto(self, fraction):
+        self.xview('moveto', fraction)
+
+    def yview_moveto(self, fraction):
+        self.yview('moveto', fraction)
+
+    def xview_scroll(self, number, what):
+        self.xview('scroll', number, what)
+
+    def yview_scroll(self, number, what):
+        self.yview('scroll', number, what)
+
+    def _on_motion(self, event):
+        self._pointer = event.x, event.y
+
+    def _on_press(self, event):
+        self.scan_mark(event.x, event.y)
+
+    def _on_drag(self, event):
+        self.scan_dragto(event.x, event.y, gain=1)
+        self.refresh()
+
+    def _on_wheel(self, steps):
+        self.set_zoom(self._level + steps, self._pointer)
+
+    def refresh(self):
+        """Render the visible tiles when Tk becomes idle."""
+        if self._render_id is None:
+            self._render_id = self.after_idle(self._render)
+
+    def _get_visible_tiles(self):
+        width, height = self._shape[:2]
+        zoom = 2.0 ** self._level
+        size = self.tile_size
+        view = Geometry(
+            width=self.winfo_width(), height=self.winfo_height(),
+            left=int(self.canvasx(0)), top=int(self.canvasy(0)))
+        image = Geometry(width=int(width * zoom), height=int(height * zoom))
+        visible = view.intersection(image)
+        if not visible.width or not visible.height:
+            return []
+        return [
+            (self._level, column, row)
+            for row in range(
+                visible.top // size,
+                -(-(visible.top + visible.height) // size))
+            for column in range(
+                visible.left // size,
+                -(-(visible.left + visible.width) // size))]
+
+    def _make_tile(self, key):
+        level, column, row = key
+        width, height, channels = self._shape
+        size = self.tile_size
+        zoom = 2.0 ** level
+        image = Geometry(width=int(width * zoom), height=int(height * zoom))
+        tile = Geometry(
+            width=size, height=size, left=column * size, top=row * size
+        ).intersection(image)
+        # the source region, at least 1 px per tile px
+        factor = 2 ** max(0, level)
+        step = 2 ** max(0, -level)
+        left, top = tile.left * step // factor, tile.top * step // factor
+        right = min(width, -(-(tile.left + tile.width) * step // factor))
+        bottom = min(height, -(-(tile.top + tile.height) * step // factor))
+        data = self._data
+        if hasattr(data, 'dtype'):
+            data = data[top:bottom:step, left:right:step]
+            if self._range is not None:
+                data = _normalize(data, *self._range)
+            pixels = _get_region(
+                data, 0, channels, 0, 0, data.shape[1], data.shape[0])
+        else:
+            pixels = _get_region(
+                data, width, channels, left, top, right, bottom, step)
+        num_columns = len(range(left, right, step))
+        num_rows = len(range(top, bottom, step))
+        photo = tk.PhotoImage(
+            master=self, format='PPM', data=encode_pnm(
+                pixels, num_columns, num_rows, 1 if channels == 1 else 3))
+        if factor > 1:
+            source, photo = photo, tk.PhotoImage(
+                master=self, width=tile.width, height=tile.height)
+            photo.tk.call(photo, 'copy', source, '-zoom', factor, factor)
+        return photo, tile.width * tile.height * 4
+
+    def _get_tile(self, key):
+        try:
+            self._tiles.move_to_end(key)
+            return self._tiles[key][0]
+        except KeyError:
+            photo, size = self._tiles[key] = self._make_tile(key)
+            self._tiles_size += size
+            return photo
+
+    def _evict(self, keep):
+        for key in list(self._tiles):
+            if self._tiles_size <= self.cache_size:
+                break
+            if key not in keep:
+                self._tiles_size -= self._tiles.pop(key)[1]
+
+    def _render(self):
+        self._render_id = None
+        if self._data is None:
+            return
+        keys = self._get_visible_tiles()
+        visible = set(keys)
+        for key in [key for key in self._items if key not in visible]:
+            self.delete(self._items.pop(key))
+        budget = self.tiles_per_frame
+        for key in keys:
+            if key in self._items:
+                continue
+            if key not in self._tiles:
+                if budget <= 0:
+                    # convert the remaining tiles in the next idle cycles
+                    self._render_id = self.after(1, self._render)
+                    break
+                budget -= 1
+            self._items[key] = self.create_image(
+                key[1] * self.tile_size, key[2] * self.tile_size,
+                image=self._get_tile(key), anchor='nw', tags='tile')
+        self._evict(visible)
@@ -0,0 +1,260 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+pytk.instrument: opt-in profiling of Tcl round trips and widget methods.
+
+When enabled, the Tcl interpreter of a Tk root is wrapped so that every
+`call()`/`eval()` and every variable access (`getvar()`/`setvar()`) is
+counted and timed, and the main methods of the pytk widgets are wrapped
+so that the round trips are attributed to the widget class and method
+issuing them.
+Every top-level instrumented method call is also recorded into
+`pytk._EVENTS`, so that it can be displayed with `flyingcircus.report()`.
+
+When disabled, nothing is wrapped, hence there is no overhead.
+
+Examples:
+    Profile a piece of UI code::
+
+        pytk.instrument.enable(root)
+        for i in range(1000):
+            listview.add_item(str(i), unique=True)
+        pytk.instrument.disable(root)
+        print(pytk.instrument.report())
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals, )
+
+# ======================================================================
+# :: Python Standard Library Imports
+import time
+import functools
+
+import pytk
+from pytk import tk
+
+# ======================================================================
+# :: the widget methods instrumented by default
+METHODS = (
+    'get_val', 'set_val', 'is_valid', 'toggle',
+    'get_items', 'add_item', 'add_items', 'del_item', 'del_items',
+    'replace_items', 'clear',
+    'mousewheel', 'scroll', 'refresh', '_render', '_layout')
+
+# :: maximum number of time points recorded into `pytk._EVENTS`
+MAX_EVENTS = 100000
+
+# ======================================================================
+# :: (class name, method name) -> [calls, time, Tcl calls, Tcl time]
+_STATS = {}
+# :: the instrumented methods being executed (innermost last)
+_STACK = []
+# :: (class, method name) -> original method
+_PATCHED = {}
+# :: total number of Tcl round trips
+_TCL_CALLS = [0]
+
+
+# ======================================================================
+class _TclProxy(object):
+    def __init__(self, tkapp):
+        self._tkapp = tkapp
+
+    def __getattr__(self, name):
+        attr = getattr(self._tkapp, name)
+        setattr(self, name, attr)
+        return attr
+
+    def _timed(self, func, *_args):
+        begin = time.perf_counter()
+        try:
+            return func(*_args)
+        finally:
+            stats = _get_stats(_STACK[-1] if _STACK else ('<Tcl>', 'call'))
+            stats[2] += 1
+            stats[3] += time.perf_counter() - begin
+            _TCL_CALLS[0] += 1
+
+    def call(self, *_args):
+        return self._timed(self._tkapp.call, *_args)
+
+    def eval(self, script):
+        return self._timed(self._tkapp.eval, script)
+
+    def getvar(self, *_args):
+        return self._timed(self._tkapp.getvar, *_args)
+
+    def setvar(self, *_args):
+        return self._timed(self._tkapp.setvar, *_args)
+
+    def globalgetvar(self, *_args):
+        return self._timed(self._tkapp.globalgetvar, *_args)
+
+    def globalsetvar(self, *_args):
+        return self._timed(self._tkapp.globalsetvar, *_args)
+
+
+# ======================================================================
+def _get_stats(key):
+    try:
+        return _STATS[key]
+    except KeyError:
+        stats = _STATS[key] = [0, 0.0, 0, 0.0]
+        return stats
+
+
+# ======================================================================
+def _instrument(cls, name, method):
+    key = cls.__name__, name
+
+    @functools.wraps(method)
+    def wrapper(*_args, **_kws):
+        stats = _get_stats(key)
+        top_level = not _STACK
+        if top_level and len(pytk._EVENTS) < MAX_EVENTS:
+            pytk.elapsed('{}.{} <'.format(*key), events=pytk._EVENTS)
+        tcl_calls = _TCL_CALLS[0]
+        _STACK.append(key)
+        begin = time.perf_counter()
+        try:
+            return method(*_args, **_kws)
+        finally:
+            stats[0] += 1
+            stats[1] += time.perf_counter() - begin
+            _STACK.pop()
+            if top_level and len(pytk._EVENTS) < MAX_EVENTS:
+                pytk.elapsed(
+                    '{}.{} ({} Tcl)'.format(
+                        key[0], key[1], _TCL_CALLS[0] - tcl_calls),
+                    events=pytk._EVENTS)
+
+    return wrapper
+
+
+# ======================================================================
+def _iter_widgets(widget):
+    yield widget
+    for child in list(widget.children.values()):
+        for item in _iter_widgets(child):
+            yield item
+
+
+# ======================================================================
+def is_enabled():
+    return bool(_PATCHED)
+
+
+# ======================================================================
+def enable(root=None, classes=None, methods=METHODS):
+    """
+    Enable the instrumentation.
+
+    Args:
+        root (tk.Tk|None): The Tk root whose interpreter is wrapped.
+            The widgets created afterwards inherit the wrapped interpreter.
+            If None, uses the default root (if any).
+        classes (Iterable[type]|None): The widget classes to instrument.
+            If None, all the classes from `pytk.widgets` are used.
+        methods (Iterable[str]): The names of the methods to instrument.
+            Only the methods defined by the classes themselves are wrapped.
+
+    Returns:
+        None.
+    """
+    if classes is None:
+        import pytk.widgets
+        classes = [
+            obj for obj in vars(pytk.widgets).values()
+            if isinstance(obj, type)
+            and obj.__module__ == pytk.widgets.__name__]
+    for cls in classes:
+        for name in methods:
+            if name in vars(cls) and (cls, name) not in _PATCHED:
+                method = vars(cls)[name]
+                _PATCHED[cls, name] = method
+                setattr(cls, name, _instrument(cls, name, method))
+    if root is None:
+        root = getattr(tk, '_default_root', None)
+    if root is not None:
+        proxy = root.tk if isinstance(root.tk, _TclProxy) \
+            else _TclProxy(root.tk)
+        for widget in _iter_widgets(root):
+            widget.tk = proxy
+
+
+# ======================================================================
+def disable(root=None):
+    """
+    Disable the instrumentation.
+
+    The collected statistics are kept until `reset()` is called.
+
+    Args:
+        root (tk.Tk|None): The Tk root whose interpreter is unwrapped.
+            If None, uses the default root (if any).
+
+    Returns:
+        None.
+    """
+    for (cls, name), method in _PATCHED.items():
+        setattr(cls, name, method)
+    _PATCHED.clear()
+    if root is None:
+        root = getattr(tk, '_default_root', None)
+    if root is not None:
+        for widget in _iter_widgets(root):
+            if isinstance(widget.tk, _TclProxy):
+                widget.tk = widget.tk._tkapp
+
+
+# ======================================================================
+def reset():
+    """Clear the collected statistics and `pytk._EVENTS`."""
+    _STATS.clear()
+    del pytk._EVENTS[:]
+
+
+# ======================================================================
+def get_stats():
+    """
+    Get the collected statistics.
+
+    Returns:
+        stats (dict[tuple[str,str],dict]): The statistics.
+            The keys are `(class name, method name)`; Tcl round trips issued
+            outside of instrumented methods are under `('<Tcl>', 'call')`.
+            The values contain: `calls`, `time` (s, inclusive), `tcl_calls`
+            and `tcl_time` (s).
+    """
+    return {
+        key: dict(zip(('calls', 'time', 'tcl_calls', 'tcl_time'), stats))
+        for key, stats in _STATS.items()}
+
+
+# ======================================================================
+def report(timeline=False):
+    """
+    Report the collected statistics.
+
+    Args:
+        timeline (bool): Append the timeline of the top-level calls
+            recorded into `pytk._EVENTS` (via `flyingcircus.report()`).
+
+    Returns:
+        text (str): The report, sorted by decreasing time.
+    """
+    fmtt = '{:36s}  {:>8s}  {:>12s}  {:>9s}  {:>12s}\n'
+    text = fmtt.format(
+        'Widget.method', 'Calls', 'Time / s', 'Tcl calls', 'Tcl time / s')
+    text += fmtt.format(*['-' * n for n in (36, 8, 12, 9, 12)])
+    for key, stats in sorted(
+            _STATS.items(), key=lambda x: x[1][1] + x[1][3], reverse=True):
+        text += fmtt.format(
+            '.'.join(key)[:36], str(stats[0]), '{:.6f}'.format(stats[1]),
+            str(stats[2]), '{:.6f}'.format(stats[3]))
+    if timeline:
+        text += pytk.report(pytk._EVENTS)
+    return text
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+pytk.layout: constraint-based placement solved once per idle cycle.
+
+A `Layout` gathers the constraints of the widgets placed in a container
+(region of the container, size, minimum/maximum size, aspect ratio and
+anchor, following the `Geometry.set_to_*()` methods).
+The `<Configure>` events of the container and the changes of the
+constraints only schedule a layout pass: when Tk becomes idle, all the
+geometries are computed in Python and the widgets whose geometry changed
+are placed in a single Tcl round trip.
+
+Examples:
+    A 4:3 preview on the left (2/3 of the width) and a side panel::
+
+        layout = pytk.layout.get_layout(frame)
+        layout.split([preview, panel], weights=(2, 1))
+        layout.add(preview, region=(0, 0, 2 / 3, 1), aspect=4 / 3)
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals, )
+
+# ======================================================================
+# :: Python Standard Library Imports
+import collections
+
+from pytk.Geometry import Geometry
+from pytk.util import _call_tcl_proc
+
+# ======================================================================
+# :: the anchors supported (see `Geometry.set_to_*()`)
+ANCHORS = (
+    'center', 'top_left', 'top', 'top_right', 'right',
+    'bottom_right', 'bottom', 'bottom_left', 'left')
+
+# Tcl helper placing many widgets in a single round trip.
+_LAYOUT_PLACE_TCL = r'''
+namespace eval ::pytk {}
+proc ::pytk::layout_place {container specs} {
+    foreach {w x y width height} $specs {
+        if {![winfo exists $w]} {
+            continue
+        }
+        place $w -in $container -x $x -y $y -width $width -height $height
+    }
+}
+'''
+
+
+# ======================================================================
+def _clip(val, min_val, max_val):
+    if max_val is not None:
+        val = min(val, max_val)
+    if min_val is not None:
+        val = max(val, min_val)
+    return val
+
+
+# ======================================================================
+def _get_length(val, total):
+    # floats are fractions of the total
+    return int(round(val * total)) if isinstance(val, float) else val
+
+
+# ======================================================================
+def solve(constraints, width, height):
+    """
+    Compute the geometries of widgets from their constraints.
+
+    Args:
+        constraints (Iterable[dict]): The constraints.
+            See `Layout.add()` for the keys.
+        width (int): The width of the container.
+        height (int): The height of the container.
+
+    Returns:
+        result (list[Geometry]): The geometries, in the container frame.
+
+    Examples:
+        >>> items = [
+        ...     dict(region=(0, 0, 0.5, 1)),
+        ...     dict(region=(0.5, 0, 0.5, 1), aspect=2.0, anchor='top'),
+        ...     dict(size=(50, 50), max_size=(40, None), anchor='right'),
+        ...     dict(padding=10, min_size=(500, 0)),
+        ...     dict(region=(0, 0, 1, 0), aspect=2.0)]
+        >>> for geometry in solve(items, 200, 100):
+        ...     print(geometry)
+        100x100+0+0
+        100x50+100+0
+        40x50+160+25
+        500x80+-150+10
+        0x0+100+0
+    """
+    result = []
+    for item in constraints:
+        rx, ry, rw, rh = item.get('region', (0, 0, 1, 1))
+        padding = item.get('padding', 0)
+        left = int(round(rx * width))
+        top = int(round(ry * height))
+        region = Geometry(
+            width=max(0, int(round((rx + rw) * width)) - left - 2 * padding),
+            height=max(0, int(round((ry + rh) * height)) - top - 2 * padding),
+            left=left + padding, top=top + padding)
+        size = item.get('size')
+        if size is None:
+            w, h = region.width, region.height
+        else:
+            w = _get_length(size[0], region.width)
+            h = _get_length(size[1], region.height)
+        min_w, min_h = item.get('min_size') or (None, None)
+        max_w, max_h = item.get('max_size') or (None, None)
+        w, h = _clip(w, None, max_w), _clip(h, None, max_h)
+        aspect = item.get('aspect')
+        if aspect:
+            # shrink to fit the region
+            w, h = min(w, region.width), min(h, region.height)
+            if w > h * aspect:
+                w = int(h * aspect)
+            else:
+                h = int(w / aspect)
+        w, h = _clip(w, min_w, None), _clip(h, min_h, None)
+        geometry = Geometry(width=w, height=h)
+        getattr(geometry, 'set_to_' + item.get('anchor', 'center'))(region)
+        result.append(geometry)
+    return result
+
+
+# ======================================================================
+class Layout(object):
+    def __init__(self, container):
+        """
+        Place widgets in a container according to their constraints.
+
+        Use `get_layout()` to share the layout of a container.
+
+        Args:
+            container (tk.Widget): The container.
+
+        Returns:
+            None.
+        """
+        self.container = container
+        # widget path -> (widget, constraints)
+        self._items = collections.OrderedDict()
+        # widget path -> (x, y, width, height) last placed
+        self._placed = {}
+        self._size = None
+        self._after_id = None
+        self.num_passes = 0
+        container.bind('<Configure>', self._on_configure, '+')
+
+    def _on_configure(self, event):
+        if event.widget is self.container \
+                and (event.width, event.height) != self._size:
+            self._size = event.width, event.height
+            self.schedule()
+
+    def _on_destroy(self, event):
+        path = str(event.widget)
+        self._items.pop(path, None)
+        self._placed.pop(path, None)
+
+    def add(
+            self,
+            widget,
+            region=(0, 0, 1, 1),
+            size=None,
+            min_size=None,
+            max_size=None,
+            aspect=None,
+            anchor='center',
+            padding=0):
+        """
+        Set the constraints of a widget.
+
+        Args:
+            widget (tk.Widget): The widget.
+            region (Sequence[float]): The area of the container available.
+                Must be `(x, y, width, height)` as fractions of the size of
+                the container.
+            size (Sequence[int|float]|None): The size `(width, height)`.
+                Integers are in pixels, floats are fractions of the region.
+                If None, the widget fills the region.
+            min_size (Sequence[int|None]|None): The minimum size.
+            max_size (Sequence[int|None]|None): The maximum size.
+            aspect (float|None): The aspect ratio (width / height).
+                The size is shrunk to fit.
+            anchor (str): The position within the region.
+                Must be one of `ANCHORS`.
+            padding (int): The padding inside the region in pixels.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If the anchor is not supported.
+        """
+        if anchor not in ANCHORS:
+            raise ValueError(
+                'Layout: unknown anchor `{}` (must be in: {})'.format(
+                    anchor, ANCHORS))
+        path = str(widget)
+        if path not in self._items:
+            widget.bind('<Destroy>', self._on_destroy, '+')
+        self._items[path] = widget, dict(
+            region=region, size=size, min_size=min_size, max_size=max_size,
+            aspect=aspect, anchor=anchor, padding=padding)
+        self.schedule()
+
+    def split(self, widgets, weights=None, orient='horizontal', **_kws):
+        """
+        Split the container proportionally among widgets.
+
+        Args:
+            widgets (Sequence[tk.Widget]): The widgets.
+            weights (Sequence[int|float]|None): The relative sizes.
+                If None, the widgets get the same size.
+            orient (str): The direction of the split.
+                Must be either 'horizontal' or 'vertical'.
+            **_kws: Keyword arguments for `add()` (except `region`).
+
+        Returns:
+            None.
+        """
+        if weights is None:
+            weights = [1] * len(widgets)
+        total = float(sum(weights))
+        pos = 0.0
+        for widget, weight in zip(widgets, weights):
+            fraction = weight / total
+            region = (pos, 0.0, fraction, 1.0) if orient == 'horizontal' \
+                else (0.0, pos, 1.0, fraction)
+            self.add(widget, region=region, **_kws)
+            pos += fraction
+
+    def remove(self, widget):
+        """Remove the constraints of a widget and unplace it."""
+        path = str(widget)
+        if path in self._items:
+            del self._items[path]
+            if self._placed.pop(path, None) is not None:
+                widget.place_forget()
+
+    def schedule(self):
+        """Run a layout pass when Tk becomes idle."""
+        if self._after_id is None:
+            self._after_id = self.container.after_idle(self.update)
+
+    def update(self):
+        """Run a layout pass now."""
+        if self._after_id is not None:
+            self.container.after_cancel(self._after_id)
+            self._after_id = None
+        if self._size is None:
+            self._size = (
+                self.container.winfo_width(), self.container.winfo_height())
+        geometries = solve(
+            [constraints for _, constraints in self._items.values()],
+            *self._size)
+        specs = []
+        for path, geometry in zip(self._items, geometries):
+            placed = (
+                geometry.left, geometry.top, geometry.width, geometry.height)
+            if self._placed.get(path) != placed:
+                self._placed[path] = placed
+                specs.append(path)
+                specs.extend(placed)
+        if specs:
+            _call_tcl_proc(
+                self.container, _LAYOUT_PLACE_TCL, '::pytk::layout_place',
+                self.container, specs)
+        self.num_passes += 1
+        return len(specs) // 5
+
+
+# ======================================================================
+def get_layout(container):
+    """
+    Get the layout of a container (created if needed).
+
+    Args:
+        container (tk.Widget): The container.
+
+    Returns:
+        layout (Layout): The layout.
+    """
+    layout = getattr(container, '_pytk_layout', None)
+    if layout is None:
+        layout = container._pytk_layout = Layout(container)
+    return layout
@@ -0,0 +1,546 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+pytk.logview: read-only viewer for arbitrarily large text files.
+
+The file is memory-mapped and the offsets of the line starts are indexed
+in a background thread, so that the file content is never loaded as a
+whole: only the lines in the viewport are decoded and shown.
+The indexing and the lines shown use positional reads, which (unlike the
+memory map) are safe if the file is truncated meanwhile (e.g. by log
+rotation).
+Growing files (e.g. logs) can be followed: only the appended bytes are
+indexed.
+Searching scans the memory map directly (with `mmap.find()` or with
+regular expressions, which accept buffers).
+
+Examples:
+    Follow a growing log and search it::
+
+        view = pytk.logview.LogView(root, follow=True)
+        view.pack(fill='both', expand=True)
+        view.open('/var/log/syslog')
+        view.find('error', regex=True, case=False)
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals, )
+
+# ======================================================================
+# :: Python Standard Library Imports
+import os
+import re
+import mmap
+import array
+import bisect
+import threading
+
+from pytk import tk
+from pytk import ttk
+from pytk import util
+
+# ======================================================================
+# :: number of bytes indexed at once
+INDEX_CHUNK_SIZE = 2 ** 22
+
+
+# ======================================================================
+def _find_newlines(buffer, start, stop, offset=0):
+    # the line starts are shifted by `offset`
+    try:
+        import numpy as np
+    except ImportError:
+        result = array.array('q')
+        pos = buffer.find(b'\n', start, stop)
+        while pos >= 0:
+            result.append(pos + 1 + offset)
+            pos = buffer.find(b'\n', pos + 1, stop)
+        return result
+    else:
+        data = np.frombuffer(buffer, np.uint8, stop - start, start)
+        result = array.array('q')
+        result.frombytes(
+            (np.flatnonzero(data == 10) + (start + 1 + offset)).astype('<i8')
+            .tobytes())
+        return result
+
+
+# ======================================================================
+class LineIndex(object):
+    def __init__(self, filepath):
+        """
+        Index the lines of a file through a memory map.
+
+        Args:
+            filepath (str): The file path.
+
+        Returns:
+            None.
+        """
+        self.filepath = filepath
+        self.file_obj = open(filepath, 'rb')
+        self.mm = None
+        self.size = 0
+        self._starts = array.array('q', [0])
+        self._indexed = 0
+        self._lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._thread = None
+        self._closing = False
+        self.update()
+
+    def update(self):
+        """
+        Check whether the file size changed and index the new bytes.
+
+        The indexing runs in a background thread.
+
+        Returns:
+            changed (bool): True if the file size changed.
+        """
+        size = os.fstat(self.file_obj.fileno()).st_size
+        if size == self.size:
+            self._start_indexing()
+            return False
+        if size < self.size:  # truncated: start over
+            self._join()
+            with self._lock:
+                self._starts = array.array('q', [0])
+                self._indexed = 0
+        # the old map is released when no longer used by the indexer
+        self.mm = mmap.mmap(
+            self.file_obj.fileno(), 0, access=mmap.ACCESS_READ) \
+            if size else None
+        self.size = size
+        self._start_indexing()
+        return True
+
+    def _start_indexing(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        if self._indexed < self.size:
+            self._thread = threading.Thread(
+                target=self._index, args=(self._indexed, self.size))
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _index(self, start, stop):
+        pos = start
+        while pos < stop and not self._closing:
+            end = min(stop, pos + INDEX_CHUNK_SIZE)
+            data = self.read(pos, end)
+            if len(data) < end - pos:
+                # truncated: `update()` starts over
+                return
+            starts = _find_newlines(data, 0, len(data), pos)
+            with self._lock:
+                self._starts.extend(starts)
+                self._indexed = end
+            pos = end
+
+    def wait(self, timeout=None):
+        """Wait for the indexing to complete."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _join(self):
+        if self._thread is not None:
+            self._closing = True
+            self._thread.join()
+            self._closing = False
+            self._thread = None
+
+    def read(self, begin, end):
+        """
+        Read bytes from the file.
+
+        Unlike the memory map, this is safe if the file was truncated
+        (fewer bytes are returned).
+
+        Args:
+            begin (int): The offset of the first byte.
+            end (int): The offset after the last byte.
+
+        Returns:
+            data (bytes): The bytes read.
+        """
+        if end <= begin:
+            return b''
+        if hasattr(os, 'pread'):
+            return os.pread(self.file_obj.fileno(), end - begin, begin)
+        with self._read_lock:
+            self.file_obj.seek(begin)
+            return self.file_obj.read(end - begin)
+
+    def is_truncated(self):
+        """Check whether the file shrank since the last `update()`."""
+        return os.fstat(self.file_obj.fileno()).st_size < self.size
+
+    def is_indexing(self):
+        return self._indexed < self.size
+
+    def get_progress(self):
+        """Get the fraction of the file indexed."""
+        return self._indexed / float(self.size) if self.size else 1.0
+
+    def __len__(self):
+        # the number of lines indexed (the last one may be partial)
+        with self._lock:
+            num = len(self._starts)
+            if self._starts[-1] >= self.size:
+                num -= 1
+        return num
+
+    def get_offset(self, line):
+        """Get the byte offset of the beginning of a line."""
+        with self._lock:
+            return self._starts[line] if line < len(self._starts) \
+                else self._indexed
+
+    def get_line(self, offset):
+        """Get the line containing a byte offset (if indexed)."""
+        with self._lock:
+            if offset >= self._indexed and self._indexed < self.size:
+                return None
+            return bisect.bisect_right(self._starts, offset) - 1
+
+    def get_lines(self, first, num, max_length=None):
+        """
+        Get lines of text as bytes.
+
+        Args:
+            first (int): The index of the first line.
+            num (int): The number of lines.
+            max_length (int|None): The maximum number of bytes per line.
+
+        Returns:
+            lines (list[bytes]): The lines, without the line terminators.
+        """
+        with self._lock:
+            starts = self._starts[first:first + num + 1].tolist()
+            indexed = self._indexed
+        if starts and starts[-1] >= self.size:
+            starts.pop()  # past the trailing newline
+        if not starts:
+            return []
+        if len(starts) <= num:
+            starts.append(indexed)
+        lines = []
+        for begin, end in zip(starts[:-1], starts[1:]):
+            if max_length is not None:
+                end = min(end, begin + max_length)
+            lines.append(self.read(begin, end).rstrip(b'\r\n'))
+        return lines
+
+    def find(
+            self,
+            pattern,
+            start=0,
+            backwards=False,
+            regex=False,
+            case=True):
+        """
+        Find a pattern, scanning the memory map.
+
+        Args:
+            pattern (bytes): The pattern.
+            start (int): The byte offset where the search starts.
+            backwards (bool): Search towards the beginning of the file.
+            regex (bool): Interpret the pattern as a regular expression.
+            case (bool): Match case.
+                If False, the pattern is used as a regular expression.
+
+        Returns:
+            result (tuple[int,int]|None): The offsets of the beginning and
+                the end of the match, if found.
+        """
+        # touching the pages past the end of a truncated file would crash
+        if self.mm is None or self.is_truncated():
+            return None
+        if not case or regex:
+            if not regex:
+                pattern = re.escape(pattern)
+            pattern = re.compile(pattern, 0 if case else re.IGNORECASE)
+            if not backwards:
+                match = pattern.search(self.mm, start)
+            else:
+                match = None
+                # scan backwards in chunks, keeping the last match
+                end = start
+                while end > 0 and match is None:
+                    begin = max(0, end - INDEX_CHUNK_SIZE)
+                    for match in pattern.finditer(self.mm, begin, end):
+                        pass
+                    end = begin
+            return match.span() if match is not None else None
+        if backwards:
+            pos = self.mm.rfind(pattern, 0, start)
+        else:
+            pos = self.mm.find(pattern, start)
+        return (pos, pos + len(pattern)) if pos >= 0 else None
+
+    def close(self):
+        """Stop indexing and release the file."""
+        self._join()
+        self._closing = True
+        self.mm = None
+        self.file_obj.close()
+
+
+# ======================================================================
+class LogView(ttk.Frame):
+    def __init__(self, *_args, **_kws):
+        """
+        Show a large text file, rendering only the visible lines.
+
+        Args:
+            *_args: Positional arguments for `ttk.Frame`.
+            **_kws: Keyword arguments for `ttk.Frame`, and:
+                follow (bool): Keep showing the end of growing files.
+                poll_interval (int): The interval in ms between checks of the
+                    file size (and of the indexing progress).
+                encoding (str): The text encoding of the file.
+                max_line_length (int): The maximum number of bytes shown
+                    per line.
+                font (str|tuple): The font.
+
+        Returns:
+            None.
+        """
+        self.follow = _kws.pop('follow', False)
+        self.poll_interval = _kws.pop('poll_interval', 250)
+        self.encoding = _kws.pop('encoding', 'utf-8')
+        self.max_line_length = _kws.pop('max_line_length', 4096)
+        font = _kws.pop('font', 'TkFixedFont')
+        super(LogView, self).__init__(*_args, **_kws)
+        self.text = tk.Text(
+            self, wrap='none', font=font, height=1, width=1,
+            cursor='arrow', undo=False)
+        self.yscrollbar = ttk.Scrollbar(
+            self, orient='vertical', command=self.yview)
+        self.xscrollbar = ttk.Scrollbar(
+            self, orient='horizontal', command=self.text.xview)
+        self.text.configure(xscrollcommand=self.xscrollbar.set)
+        self.text.grid(row=0, column=0, sticky='nsew')
+        self.yscrollbar.grid(row=0, column=1, sticky='ns')
+        self.xscrollbar.grid(row=1, column=0, sticky='ew')
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+        self.text.tag_configure('match', background='yellow')
+        # prevent editing, while allowing selection and copy
+        self.text.bind('<Key>', self._on_key)
+        for sequence in ('<<Paste>>', '<<Cut>>', '<<Clear>>', '<Button-2>'):
+            self.text.bind(sequence, lambda event: 'break')
+        self.text.bind('<Configure>', self._on_configure)
+        util.bind_wheel(self.text, self._on_wheel)
+        self.index = None
+        self.top = 0
+        self._num_visible = 1
+        self._match = None
+        self._render_id = None
+        self._poll_id = None
+        self._shown = None
+
+    def open(self, filepath):
+        """
+        Show a file.
+
+        Args:
+            filepath (str): The file path.
+
+        Returns:
+            None.
+        """
+        self.close()
+        self.index = LineIndex(filepath)
+        self.top = 0
+        self._match = None
+        self._poll()
+
+    def close(self):
+        """Stop showing the current file, if any."""
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+            self._poll_id = None
+        if self.index is not None:
+            self.index.close()
+            self.index = None
+        self._shown = None
+        self.refresh()
+
+    def destroy(self):
+        self.close()
+        super(LogView, self).destroy()
+
+    def _poll(self):
+        num_lines = len(self.index)
+        changed = self.index.update()
+        if changed or self.index.is_indexing() or \
+                num_lines != len(self.index):
+            if self.follow:
+                self.top = len(self.index)
+            self.refresh()
+        self._poll_id = self.after(self.poll_interval, self._poll)
+
+    def _on_configure(self, event):
+        linespace = int(self.text.tk.call(
+            'font', 'metrics', self.text.cget('font'), '-linespace'))
+        num_visible = max(1, event.height // max(1, linespace))
+        if num_visible != self._num_visible:
+            self._num_visible = num_visible
+            self._shown = None
+            self.refresh()
+
+    def _on_key(self, event):
+        steps = {
+            'Up': -1, 'Down': 1,
+            'Prior': -self._num_visible, 'Next': self._num_visible}
+        if event.keysym in steps:
+            self.scroll(steps[event.keysym])
+        elif event.keysym == 'Home':
+            self.see_line(0)
+        elif event.keysym == 'End':
+            self.follow = True
+            self.see_line(self.get_num_lines())
+        elif event.keysym in ('Left', 'Right') or event.state & 0x4:
+            # horizontal moves and shortcuts (e.g. Ctrl+C) are allowed
+            return None
+        return 'break'
+
+    def _on_wheel(self, steps):
+        self.scroll(-3 * steps)
+
+    def get_num_lines(self):
+        return len(self.index) if self.index is not None else 0
+
+    def scroll(self, num):
+        """Scroll by a number of lines (positive towards the end)."""
+        self.see_line(self.top + num, top=True)
+
+    def see_line(self, line, top=False):
+        """
+        Make a line visible.
+
+        Args:
+            line (int): The line index.
+            top (bool): Show the line at the top (if possible).
+
+        Returns:
+            None.
+        """
+        if top or line < self.top:
+            self.top = line
+        elif line >= self.top + self._num_visible:
+            self.top = line - self._num_visible + 1
+        # scrolling up stops following, reaching the end starts it again
+        self.follow = self.top >= self.get_num_lines() - self._num_visible
+        self.refresh()
+
+    def yview(self, *args):
+        num_lines = self.get_num_lines()
+        if not args:
+            if not num_lines:
+                return 0.0, 1.0
+            return (
+                self.top / float(num_lines),
+                min(self.top + self._num_visible, num_lines)
+                / float(num_lines))
+        elif args[0] == 'moveto':
+            self.see_line(int(float(args[1]) * num_lines), top=True)
+        elif args[0] == 'scroll':
+            num = int(args[1])
+            if args[2] == 'pages':
+                num *= self._num_visible
+            self.scroll(num)
+        return None
+
+    def refresh(self):
+        """Re-render the visible lines when Tk becomes idle."""
+        if self._render_id is None:
+            self._render_id = self.after_idle(self._render)
+
+    def _render(self):
+        self._render_id = None
+        num_lines = self.get_num_lines()
+        self.top = max(0, min(self.top, num_lines - self._num_visible))
+        lines = self.index.get_lines(
+            self.top, self._num_visible, self.max_line_length) \
+            if self.index is not None else []
+        key = self.top, lines
+        if key != self._shown:
+            self._shown = key
+            self.text.delete('1.0', 'end')
+            self.text.insert('1.0', b'\n'.join(lines).decode(
+                self.encoding, 'replace'))
+            self._highlight()
+        self.yscrollbar.set(*self.yview())
+
+    def _highlight(self):
+        if self._match is None:
+            return
+        line = self.index.get_line(self._match[0])
+        if line is None or not 0 <= line - self.top < self._num_visible:
+            return
+        begin = self.index.get_offset(line)
+        prefix, match = self.index.read(begin, self._match[0]), \
+            self.index.read(*self._match)
+        column = len(prefix.decode(self.encoding, 'replace'))
+        first = '{}.{}'.format(line - self.top + 1, column)
+        self.text.tag_add(
+            'match', first, '{}+{}c'.format(
+                first, len(match.decode(self.encoding, 'replace'))))
+        self.text.see(first)
+
+    def find(
+            self,
+            text,
+            backwards=False,
+            regex=False,
+            case=True):
+        """
+        Find text, starting after (or before) the current match.
+
+        The matching line is shown and the match is highlighted.
+
+        Args:
+            text (str): The text (or the regular expression) to find.
+            backwards (bool): Search towards the beginning of the file.
+            regex (bool): Interpret the text as a regular expression.
+            case (bool): Match case.
+
+        Returns:
+            line (int|None): The line of the match, if found.
+                If the line is not indexed yet, it is shown as soon as
+                it is.
+        """
+        if self.index is None:
+            return None
+        if self._match is not None:
+            start = self._match[0] if backwards else self._match[1]
+        else:
+            start = self.index.get_offset(self.top)
+        match = self.index.find(
+            text.encode(self.encoding), start, backwards, regex, case)
+        if match is None:
+            return None
+        self._match = match
+        self._shown = None
+        line = self.index.get_line(match[0])
+        if line is not None:
+            self.follow = False
+            self.see_line(line)
+        else:
+            self.after(self.poll_interval, self._see_match)
+        return line
+
+    def _see_match(self):
+        if self._match is None or self.index is None:
+            return
+        line = self.index.get_line(self._match[0])
+        if line is None:
+            self.after(self.poll_interval, self._see_match)
+        else:
+            self.follow = False
+            self.see_line(line)
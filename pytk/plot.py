@@ -0,0 +1,485 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+pytk.plot: streaming plots of long time series on a Canvas.
+
+The samples are appended in chunks (lists, `array.array` or NumPy arrays),
+which are stored as they are (no copy) and summarized by a multi-resolution
+min/max pyramid.
+Redrawing only needs the min/max of the samples covered by each pixel
+column of the current view, hence its cost depends on the width of the
+plot and not on the number of samples.
+
+Examples:
+    A plot following a live signal, showing the last 10000 samples::
+
+        plot = pytk.plot.Plot(root, window=10000, max_samples=10 ** 7)
+        plot.pack(fill='both', expand=True)
+
+        def on_data(chunk):  # e.g. from `pytk.dispatch.Dispatcher.call()`
+            plot.append(chunk)
+
+    Drag to pan, use the mouse wheel to zoom, double-click to follow again.
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals, )
+
+# ======================================================================
+# :: Python Standard Library Imports
+import sys
+import math
+import time
+import array
+import bisect
+
+from pytk import tk
+from pytk import util
+
+
+# ======================================================================
+def _concatenate(parts):
+    numpy = sys.modules.get('numpy')
+    if numpy is not None and any(
+            isinstance(part, numpy.ndarray) for part in parts):
+        return numpy.concatenate(parts)
+    result = []
+    for part in parts:
+        result.extend(part)
+    return result
+
+
+# ======================================================================
+class MinMaxPyramid(object):
+    def __init__(self, block=16, factor=4, num_levels=8):
+        """
+        Store samples and the min/max of blocks of increasing size.
+
+        Level `i` holds the minimum and the maximum of each block of
+        `block * factor ** i` consecutive samples; only complete blocks
+        are stored, the incomplete ones are computed when needed.
+
+        Args:
+            block (int): The number of samples per block at level 0.
+            factor (int): The ratio between the block sizes of consecutive
+                levels.
+            num_levels (int): The number of levels.
+
+        Returns:
+            None.
+        """
+        self.block = block
+        self.factor = factor
+        self.sizes = [block * factor ** i for i in range(num_levels)]
+        self.mins = [array.array('d') for _ in range(num_levels)]
+        self.maxs = [array.array('d') for _ in range(num_levels)]
+        # :: the number of samples dropped from the beginning
+        self.offset = 0
+        self._chunks = []
+        self._starts = []
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, samples):
+        """
+        Append samples.
+
+        Args:
+            samples (Sequence[int|float]): The samples.
+                Sequences (e.g. lists, `array.array` or NumPy arrays) are
+                stored without copying, hence they should not be modified
+                afterwards.
+
+        Returns:
+            None.
+        """
+        if not hasattr(samples, '__getitem__'):
+            samples = list(samples)
+        if not len(samples):
+            return
+        self._chunks.append(samples)
+        self._starts.append(self._size)
+        self._size += len(samples)
+        self._build()
+
+    def _build(self):
+        prev_mins = prev_maxs = None
+        for i, size in enumerate(self.sizes):
+            mins, maxs = self.mins[i], self.maxs[i]
+            done = len(mins)
+            num = self._size // size - done
+            if num <= 0:
+                break
+            if i == 0:
+                values = self.get_samples(
+                    done * size + self.offset, (done + num) * size
+                    + self.offset)
+                if hasattr(values, 'reshape'):  # NumPy arrays
+                    values = values.reshape(num, size)
+                    mins.extend(values.min(1).tolist())
+                    maxs.extend(values.max(1).tolist())
+                    prev_mins, prev_maxs = mins, maxs
+                    continue
+                step, lows, highs = size, values, values
+                first = 0
+            else:
+                step, lows, highs = self.factor, prev_mins, prev_maxs
+                first = done * self.factor
+            for j in range(first, first + num * step, step):
+                mins.append(min(lows[j:j + step]))
+                maxs.append(max(highs[j:j + step]))
+            prev_mins, prev_maxs = mins, maxs
+
+    def drop(self, num):
+        """
+        Drop samples from the beginning.
+
+        Only multiples of the largest block size in use are dropped, so that
+        the blocks stay aligned.
+
+        Args:
+            num (int): The maximum number of samples to drop.
+
+        Returns:
+            num (int): The number of samples actually dropped.
+        """
+        granularity = max(
+            [self.block] + [
+                size for size, mins in zip(self.sizes, self.mins) if mins])
+        num = min(num, self._size) // granularity * granularity
+        if not num:
+            return 0
+        for size, mins, maxs in zip(self.sizes, self.mins, self.maxs):
+            del mins[:num // size]
+            del maxs[:num // size]
+        while self._chunks and self._starts[0] + len(self._chunks[0]) <= num:
+            self._chunks.pop(0)
+            self._starts.pop(0)
+        if self._chunks and self._starts[0] < num:
+            self._chunks[0] = self._chunks[0][num - self._starts[0]:]
+            self._starts[0] = num
+        self._starts = [start - num for start in self._starts]
+        self._size -= num
+        self.offset += num
+        return num
+
+    def clear(self):
+        """Drop all the samples."""
+        self.offset += self._size
+        self._chunks, self._starts, self._size = [], [], 0
+        for mins, maxs in zip(self.mins, self.maxs):
+            del mins[:]
+            del maxs[:]
+
+    def get_samples(self, start, stop):
+        """
+        Get the samples in a range.
+
+        Args:
+            start (int): The index of the first sample (included).
+            stop (int): The index of the last sample (excluded).
+                The indices count the dropped samples as well.
+
+        Returns:
+            samples (Sequence): The samples.
+                A slice of the stored chunk, if the range is within a chunk.
+        """
+        start = max(0, start - self.offset)
+        stop = min(self._size, stop - self.offset)
+        if start >= stop:
+            return []
+        i = bisect.bisect_right(self._starts, start) - 1
+        parts = []
+        while i < len(self._chunks) and self._starts[i] < stop:
+            first = self._starts[i]
+            parts.append(self._chunks[i][
+                max(0, start - first):stop - first])
+            i += 1
+        return parts[0] if len(parts) == 1 else _concatenate(parts)
+
+    def _get_minmax(self, start, stop, level):
+        # min/max of the samples in [start, stop) using levels up to `level`
+        if level < 0:
+            values = self.get_samples(start + self.offset, stop + self.offset)
+            return min(values), max(values)
+        size = self.sizes[level]
+        first = -(-start // size)
+        last = min(stop // size, len(self.mins[level]))
+        if first >= last:
+            return self._get_minmax(start, stop, level - 1)
+        low = min(self.mins[level][first:last])
+        high = max(self.maxs[level][first:last])
+        for begin, end in ((start, first * size), (last * size, stop)):
+            if begin < end:
+                edge_low, edge_high = self._get_minmax(begin, end, level - 1)
+                low, high = min(low, edge_low), max(high, edge_high)
+        return low, high
+
+    def get_minmax(self, start, stop, num):
+        """
+        Get the min/max of the samples in a range, split in bins.
+
+        Args:
+            start (int|float): The index of the first sample (included).
+            stop (int|float): The index of the last sample (excluded).
+                The indices count the dropped samples as well.
+            num (int): The number of bins.
+
+        Returns:
+            result (tuple[list,list,list]): The bins, the minima and the
+                maxima, where the bins are the indices of the non-empty bins.
+        """
+        step = (stop - start) / float(num)
+        begin = start - self.offset
+        # use the largest blocks not exceeding a bin
+        level = bisect.bisect_right(self.sizes, step) - 1
+        if level >= 0:
+            size = self.sizes[level]
+            available = len(self.mins[level])
+            level_mins, level_maxs = self.mins[level], self.maxs[level]
+        else:
+            size, available = 1, 0
+        bins, lows, highs = [], [], []
+        for k in range(num):
+            low_index = begin + k * step
+            high_index = begin + (k + 1) * step if k < num - 1 \
+                else stop - self.offset
+            if high_index <= 0:
+                continue
+            elif low_index >= self._size:
+                break
+            # bin edges are rounded to the blocks of the selected level
+            first = int(max(0, low_index)) // size
+            if k == num - 1 or high_index >= self._size:
+                # the last bin includes the incomplete block
+                last = -(-int(math.ceil(min(self._size, high_index))) // size)
+            else:
+                last = int(high_index) // size
+            last = max(first + 1, last)
+            if last <= available:
+                low = min(level_mins[first:last])
+                high = max(level_maxs[first:last])
+            else:
+                low, high = self._get_minmax(
+                    first * size, min(last * size, self._size), level)
+            bins.append(k)
+            lows.append(low)
+            highs.append(high)
+        return bins, lows, highs
+
+
+# ======================================================================
+class Plot(tk.Canvas):
+    def __init__(self, *_args, **_kws):
+        """
+        Plot a growing time series, redrawn at most `fps` times per second.
+
+        Args:
+            *_args: Positional arguments for `tk.Canvas`.
+            **_kws: Keyword arguments for `tk.Canvas`, and:
+                window (int|None): The number of samples shown while following
+                    the data. If None, all the samples are shown.
+                max_samples (int|None): The maximum number of samples kept.
+                    If None, all the samples are kept.
+                fps (int|float): The maximum number of redraws per second.
+                    Slow redraws are spaced further, so that redrawing takes
+                    at most half of the time.
+                ylim (tuple[float,float]|None): The fixed range of the values.
+                    If None, the range of the visible values is used.
+                color (str): The color of the line.
+
+        Returns:
+            None.
+        """
+        self.window = _kws.pop('window', None)
+        self.max_samples = _kws.pop('max_samples', None)
+        self.fps = _kws.pop('fps', 30)
+        self.ylim = _kws.pop('ylim', None)
+        color = _kws.pop('color', 'black')
+        _kws.setdefault('background', 'white')
+        _kws.setdefault('highlightthickness', 0)
+        super(Plot, self).__init__(*_args, **_kws)
+        num_levels = 8
+        if self.max_samples:
+            # keep the largest blocks small enough to drop old samples
+            while num_levels > 1 and \
+                    16 * 4 ** (num_levels - 1) * 4 > self.max_samples:
+                num_levels -= 1
+        self.data = MinMaxPyramid(num_levels=num_levels)
+        self.follow = True
+        self._view = None
+        self._line = self.create_line(0, 0, 0, 0, fill=color)
+        self._redraw_id = None
+        self._last_redraw = 0.0
+        self._redraw_time = 0.0
+        self._drag = None
+        self._pointer_x = None
+        self.bind('<Configure>', lambda event: self.refresh())
+        self.bind('<Motion>', self._on_motion)
+        self.bind('<ButtonPress-1>', self._on_press)
+        self.bind('<B1-Motion>', self._on_drag)
+        self.bind('<ButtonRelease-1>', self._on_release)
+        self.bind('<Double-Button-1>', lambda event: self.set_follow())
+        util.bind_wheel(self, self._on_wheel)
+
+    def append(self, samples):
+        """
+        Append samples and schedule a redraw.
+
+        Args:
+            samples (Sequence[int|float]): The samples.
+                Sequences (e.g. lists, `array.array` or NumPy arrays) are
+                stored without copying, hence they should not be modified
+                afterwards.
+
+        Returns:
+            None.
+        """
+        end = self.data.offset + len(self.data)
+        self.data.append(samples)
+        dropped = 0
+        if self.max_samples and len(self.data) > self.max_samples:
+            dropped = self.data.drop(len(self.data) - self.max_samples)
+        # skip redrawing if the view is not affected
+        if self.follow or self._view[1] > end or dropped:
+            self.refresh()
+
+    def clear(self):
+        """Drop all the samples."""
+        self.data.clear()
+        self.refresh()
+
+    def get_view(self):
+        """
+        Get the range of the samples shown.
+
+        Returns:
+            view (tuple[int|float,int|float]): The first (included) and last
+                (excluded) sample indices.
+        """
+        if self.follow:
+            stop = self.data.offset + len(self.data)
+            start = self.data.offset if self.window is None \
+                else stop - self.window
+            return start, stop
+        return self._view
+
+    def set_view(self, start, stop):
+        """
+        Set the range of the samples shown, and stop following the data.
+
+        Args:
+            start (int|float): The first sample index (included).
+            stop (int|float): The last sample index (excluded).
+
+        Returns:
+            None.
+        """
+        self.follow = False
+        self._view = (start, max(stop, start + 1))
+        self.refresh()
+
+    def set_follow(self, window=None):
+        """Show the most recent samples as they are appended."""
+        if window is not None:
+            self.window = window
+        self.follow = True
+        self.refresh()
+
+    def pan(self, num):
+        """Move the view by a number of samples (positive to the right)."""
+        start, stop = self.get_view()
+        self.set_view(start + num, stop + num)
+
+    def zoom(self, factor, center=None):
+        """
+        Zoom the view.
+
+        Args:
+            factor (float): The zoom factor (larger than 1 to zoom in).
+            center (float|None): The sample index kept in place.
+                If None, the center of the view is used.
+
+        Returns:
+            None.
+        """
+        start, stop = self.get_view()
+        if center is None:
+            center = (start + stop) / 2.0
+        self.set_view(
+            center - (center - start) / factor,
+            center + (stop - center) / factor)
+
+    def _x_to_index(self, x):
+        start, stop = self.get_view()
+        return start + (stop - start) * x / float(max(1, self.winfo_width()))
+
+    def _on_motion(self, event):
+        self._pointer_x = event.x
+
+    def _on_press(self, event):
+        self._drag = event.x, self.get_view()
+
+    def _on_drag(self, event):
+        if self._drag is not None:
+            x, (start, stop) = self._drag
+            shift = (x - event.x) * (stop - start) \
+                / float(max(1, self.winfo_width()))
+            self.set_view(start + shift, stop + shift)
+
+    def _on_release(self, event):
+        self._drag = None
+
+    def _on_wheel(self, steps):
+        center = self._x_to_index(self._pointer_x) \
+            if self._pointer_x is not None else None
+        self.zoom(1.25 ** steps, center)
+
+    def refresh(self):
+        """Schedule a redraw, within the redraw budget."""
+        if self._redraw_id is None:
+            interval = max(1.0 / self.fps, 2 * self._redraw_time)
+            delay = self._last_redraw + interval - time.time()
+            self._redraw_id = self.after(
+                max(0, int(delay * 1000)), self._redraw)
+
+    def _redraw(self):
+        self._redraw_id = None
+        begin = time.time()
+        width = self.winfo_width()
+        height = self.winfo_height()
+        start, stop = self.get_view()
+        if stop - start <= 2 * width:
+            first = int(max(start, self.data.offset))
+            samples = self.data.get_samples(first, int(stop) + 1)
+            scale = width / float(stop - start)
+            xs = [(first + i - start) * scale for i in range(len(samples))]
+            lows = highs = samples
+        else:
+            bins, lows, highs = self.data.get_minmax(start, stop, width)
+            xs = bins
+        coords = []
+        if len(xs):
+            if self.ylim:
+                y_min, y_max = self.ylim
+            else:
+                y_min, y_max = min(lows), max(highs)
+            pad = 2
+            scale = (height - 2 * pad) / float(y_max - y_min or 1)
+            offset = height - pad + y_min * scale
+            if lows is highs:
+                for x, y in zip(xs, lows):
+                    coords.extend((x, offset - y * scale))
+            else:
+                for x, low, high in zip(xs, lows, highs):
+                    coords.extend(
+                        (x, offset - high * scale, x, offset - low * scale))
+        if len(coords) < 4:
+            coords = [0, 0, 0, 0]
+        self.coords(self._line, coords)
+        self._last_redraw = time.time()
+        self._redraw_time = self._last_redraw - begin
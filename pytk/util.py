@@ -1,25 +1,85 @@
 import os
+import re
+import sys
+import weakref
 import warnings
 
-import flyingcircus as fc
-
 from pytk import tk
-from pytk import msg, dbg
 from pytk.Geometry import Geometry
 
 
+# ======================================================================
+# :: bounded memoization for `auto_convert()`
+AUTO_CONVERT_CACHE_SIZE = 4096
+_AUTO_CONVERT_CACHE = {}
+
+
+# ======================================================================
+def _auto_convert_slow(text):
+    try:
+        val = int(text)
+    except (TypeError, ValueError):
+        try:
+            val = float(text)
+        except (TypeError, ValueError):
+            try:
+                val = complex(text)
+            except (TypeError, ValueError):
+                val = text
+    return val
+
+
+# ======================================================================
+# :: the non-numeric words accepted by `float()`
+_FLOAT_WORDS = frozenset(('inf', 'infinity', 'nan'))
+
+
+# ======================================================================
+def _auto_convert_str(text):
+    # unsigned integers are handled by the callers with `isdecimal()`
+    if text[1:].isdecimal() and text[:1] in '+-':
+        return int(text)
+    if '(' in text:
+        # e.g. `complex('(1)')`
+        return _auto_convert_slow(text)
+    if 'j' in text or 'J' in text:
+        try:
+            return complex(text)
+        except ValueError:
+            return text
+    head = text.lstrip()[:1]
+    if not head or not (head.isdecimal() or head in '+-.') \
+            and text.strip().lower() not in _FLOAT_WORDS:
+        return text
+    try:
+        val = float(text)
+    except ValueError:
+        return text
+    # signed or padded integers are also accepted by `float()`
+    for char in '.eEnN':
+        if char in text:
+            return val
+    return int(text)
+
+
 # ======================================================================
 def auto_convert(
         text,
         pre_delim=None,
-        post_delim=None):
+        post_delim=None,
+        cached=False):
     """
     Convert value to numeric if possible, or strip delimiters from string.
 
+    The numeric type is picked with cheap character checks, so that at most
+    one exception is raised (and caught), and none for numbers.
+
     Args:
         text (str|int|float|complex): The text input string.
         pre_delim (str): initial string decorator.
         post_delim (str): final string decorator.
+        cached (bool): Memoize the result.
+            At most `AUTO_CONVERT_CACHE_SIZE` results are kept.
 
     Returns:
         val (int|float|complex): The numeric value of the string.
@@ -37,89 +97,414 @@ def auto_convert(
         1000
         >>> auto_convert(1000.0)
         1000.0
+        >>> auto_convert(' -inf ')
+        -inf
+        >>> auto_convert('j')
+        1j
+        >>> auto_convert('jump')
+        'jump'
+        >>> auto_convert('12', cached=True)
+        12
+        >>> auto_convert(' -12 ')
+        -12
+        >>> auto_convert('(1.5)')
+        (1.5+0j)
     """
-    if isinstance(text, str):
-        if pre_delim and post_delim and \
-                fc.has_delim(text, pre_delim, post_delim):
-            text = fc.strip_delim(text, pre_delim, post_delim)
+    if not isinstance(text, str):
+        return text
+    if cached:
+        key = text, pre_delim, post_delim
         try:
-            val = int(text)
-        except (TypeError, ValueError):
-            try:
-                val = float(text)
-            except (TypeError, ValueError):
-                try:
-                    val = complex(text)
-                except (TypeError, ValueError):
-                    val = text
+            return _AUTO_CONVERT_CACHE[key]
+        except KeyError:
+            val = auto_convert(text, pre_delim, post_delim)
+            if len(_AUTO_CONVERT_CACHE) >= AUTO_CONVERT_CACHE_SIZE:
+                _AUTO_CONVERT_CACHE.clear()
+            _AUTO_CONVERT_CACHE[key] = val
+            return val
+    if pre_delim and post_delim and \
+            text.startswith(pre_delim) and text.endswith(post_delim):
+        text = text[len(pre_delim):len(text) - len(post_delim)]
+    if text.isdecimal():
+        return int(text)
+    return _auto_convert_str(text)
+
+
+# ======================================================================
+def auto_convert_many(
+        texts,
+        pre_delim=None,
+        post_delim=None):
+    """
+    Convert multiple values with `auto_convert()` in bulk.
+
+    Equivalent to (but faster than) calling `auto_convert()` for each item,
+    especially for columns of integers.
+
+    Args:
+        texts (Iterable[str|int|float|complex]): The text input strings.
+        pre_delim (str): initial string decorator.
+        post_delim (str): final string decorator.
+
+    Returns:
+        vals (list[int|float|complex|str]): The converted values.
+
+    Examples:
+        >>> auto_convert_many(['1', '2.5', '<3>', 'x', '1j', 4], '<', '>')
+        [1, 2.5, 3, 'x', 1j, 4]
+        >>> auto_convert_many(['1', '2', '3'])
+        [1, 2, 3]
+        >>> auto_convert_many(['1', '2.0', '3e1'])
+        [1, 2.0, 30.0]
+    """
+    texts = list(texts)
+    if pre_delim and post_delim:
+        texts = [
+            text[len(pre_delim):len(text) - len(post_delim)]
+            if isinstance(text, str) and text.startswith(pre_delim)
+            and text.endswith(post_delim) else text
+            for text in texts]
+    if set(map(type, texts)) == {str}:
+        # columns of integers are parsed at C speed
+        try:
+            return list(map(int, texts))
+        except ValueError:
+            pass
+    return [
+        (int(text) if text.isdecimal() else _auto_convert_str(text))
+        if isinstance(text, str) else text
+        for text in texts]
+
+
+# ======================================================================
+# :: cache of the screen geometries: (display, kind) -> geometry
+_SCREEN_GEOMETRIES = {}
+
+
+# ======================================================================
+def _get_display(root=None):
+    return root.winfo_screen() if root else os.environ.get('DISPLAY', '')
+
+
+# ======================================================================
+def _call_tcl_proc(widget, source, name, *_args):
+    # define the helper procs on first use in each interpreter
+    try:
+        return widget.tk.call(name, *_args)
+    except tk.TclError as e:
+        if 'invalid command name "{}"'.format(name) not in str(e):
+            raise
+        widget.tk.eval(source)
+        return widget.tk.call(name, *_args)
+
+
+# ======================================================================
+def _bind_own(widget, name, sequence, func):
+    """
+    Bind an event of a widget, but not of its descendants.
+
+    The bindings of a root (or toplevel) widget also get the events of all
+    the widgets inside it: a dedicated bindtag avoids the Python callback
+    for each of them.
+    """
+    tag = 'pytk_{}{}'.format(name, widget._w)
+    widget.bind_class(tag, sequence, func)
+    tags = widget.bindtags()
+    widget.bindtags(tags[:1] + (tag,) + tags[1:])
+
+
+# ======================================================================
+def _watch_screen_geometry(root):
+    """Invalidate the cached screen geometries when `root` is configured."""
+    if getattr(root, '_screen_geometry_watched', False):
+        return
+    display = _get_display(root)
+    _bind_own(
+        root, 'screen', '<Configure>',
+        lambda event: clear_screen_geometry_cache(display))
+    root._screen_geometry_watched = True
+
+
+# ======================================================================
+def clear_screen_geometry_cache(display=None):
+    """
+    Invalidate the cached screen geometries.
+
+    Args:
+        display (str|None): The display to invalidate.
+            If None, all displays are invalidated.
+
+    Returns:
+        None.
+    """
+    if display is None:
+        _SCREEN_GEOMETRIES.clear()
     else:
-        val = text
-    return val
+        for key in list(_SCREEN_GEOMETRIES):
+            if key[0] == display:
+                del _SCREEN_GEOMETRIES[key]
 
 
 # ======================================================================
-def get_screen_geometry(from_all=False):
+def get_screen_geometry(from_all=False, root=None, cached=True):
     """
     Workaround to get the size of the current screen in a multi-screen setup.
 
+    The result is cached per display and `from_all`.
+    If a Tk root exists (or is given), it is used instead of creating a new
+    Tk interpreter, and the cache is invalidated when the root is
+    configured (e.g. moved to another screen).
+
+    Args:
+        from_all (bool): Get the geometry of the whole (virtual) screen.
+        root (tk.Tk|None): The Tk root to use.
+            If None, the default root is used, if available.
+        cached (bool): Use the cached value, if available.
+
     Returns:
         geometry (str): The standard Tk geometry string.
             [width]x[height]+[left]+[top]
     """
-    root = tk.Tk()
+    if root is None:
+        root = getattr(tk, '_default_root', None)
+    key = (_get_display(root), bool(from_all))
+    if cached and key in _SCREEN_GEOMETRIES:
+        return _SCREEN_GEOMETRIES[key]
+    temp_root = root is None
+    if temp_root:
+        root = tk.Tk()
     if from_all:
         width = root.winfo_screenwidth()
         height = root.winfo_screenheight()
         geometry = str(Geometry(width=width, height=height))
     else:
-        root.update_idletasks()
-        root.attributes('-fullscreen', True)
-        root.state('iconic')
-        geometry = root.winfo_geometry()
-    root.destroy()
+        window = root if temp_root else tk.Toplevel(root)
+        window.update_idletasks()
+        window.attributes('-fullscreen', True)
+        window.state('iconic')
+        geometry = window.winfo_geometry()
+        if not temp_root:
+            window.destroy()
+    if temp_root:
+        root.destroy()
+    else:
+        _watch_screen_geometry(root)
+    _SCREEN_GEOMETRIES[key] = geometry
     return geometry
 
 
 # ======================================================================
-def set_icon(
-        root,
-        basename,
-        dirpath=os.path.abspath(os.path.dirname(__file__))):
-    basepath = os.path.join(dirpath, basename) if dirpath else basename
+def _get_x11_screens_geometry():
+    # imported here, since it is slow to import and rarely needed
+    import subprocess
+    try:
+        output = subprocess.check_output(
+            ['xrandr', '--listmonitors'], universal_newlines=True)
+    except (OSError, subprocess.CalledProcessError):
+        return []
+    # e.g.: ` 0: +*DP-1 2560/597x1440/336+0+0  DP-1`
+    return [
+        str(Geometry(width=int(w), height=int(h), left=int(l), top=int(t)))
+        for w, h, l, t in re.findall(
+            r'(\d+)/\d+x(\d+)/\d+\+(-?\d+)\+(-?\d+)', output)]
+
+
+# ======================================================================
+def _get_win32_screens_geometry():
+    try:
+        import ctypes
+        import ctypes.wintypes
+        user32 = ctypes.windll.user32
+    except (ImportError, AttributeError):
+        return []
+    geometries = []
+    monitor_enum_proc = ctypes.WINFUNCTYPE(
+        ctypes.c_int, ctypes.c_void_p, ctypes.c_void_p,
+        ctypes.POINTER(ctypes.wintypes.RECT), ctypes.wintypes.LPARAM)
 
+    def callback(monitor, dc, rect, data):
+        rect = rect.contents
+        geometries.append(str(Geometry(
+            width=rect.right - rect.left, height=rect.bottom - rect.top,
+            left=rect.left, top=rect.top)))
+        return 1
+
+    user32.EnumDisplayMonitors(0, 0, monitor_enum_proc(callback), 0)
+    return geometries
+
+
+# ======================================================================
+def get_screens_geometry(root=None, cached=True):
+    """
+    Get the geometries of all the screens (monitors) in one pass.
+
+    This uses `xrandr` on X11 and the Win32 API on Windows.
+    Elsewhere (or if these fail), the geometry of the whole (virtual) screen
+    is returned as the only screen.
+    The result is cached per display, like `get_screen_geometry()`.
+
+    Args:
+        root (tk.Tk|None): The Tk root to use.
+            If None, the default root is used, if available.
+        cached (bool): Use the cached value, if available.
+
+    Returns:
+        geometries (list[str]): The standard Tk geometry strings.
+            [width]x[height]+[left]+[top]
+    """
+    if root is None:
+        root = getattr(tk, '_default_root', None)
+    key = (_get_display(root), 'screens')
+    if cached and key in _SCREEN_GEOMETRIES:
+        return list(_SCREEN_GEOMETRIES[key])
+    if sys.platform.startswith('win'):
+        geometries = _get_win32_screens_geometry()
+    elif sys.platform != 'darwin':
+        geometries = _get_x11_screens_geometry()
+    else:
+        geometries = []
+    if not geometries:
+        geometries = [get_screen_geometry(True, root, cached)]
+    if root is not None:
+        _watch_screen_geometry(root)
+    _SCREEN_GEOMETRIES[key] = geometries
+    return list(geometries)
+
+
+# ======================================================================
+# :: root -> {(file path, mtime) -> icon (None if not usable)}
+_ICONS = weakref.WeakKeyDictionary()
+# :: (base path, windowing system) -> (directory mtime, icon file paths)
+_ICON_FILEPATHS = {}
+
+
+# ======================================================================
+def _get_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+# ======================================================================
+def _find_icon_files(basepath, tk_sys):
+    # the lookup is repeated only if the directory content changes
+    key = basepath, tk_sys
+    dir_mtime = _get_mtime(os.path.dirname(basepath) or os.curdir)
+    cached = _ICON_FILEPATHS.get(key)
+    if cached is not None and cached[0] == dir_mtime:
+        return cached[1]
+    filepaths = []
     # first try modern file formats
     for file_ext in ['png', 'gif']:
         if not basepath.endswith('.' + file_ext):
             filepath = basepath + '.' + file_ext
         else:
             filepath = basepath
-        try:
-            icon = tk.PhotoImage(file=filepath)
-            root.tk.call('wm', 'iconphoto', root._w, icon)
-        except tk.TclError:
-            warnings.warn('E: Could not use icon `{}`'.format(filepath))
-        else:
-            return
-
+        if os.path.isfile(filepath):
+            filepaths.append(filepath)
     # fall back to ico/xbm format
-    tk_sys = root.tk.call('tk', 'windowingsystem')
     if tk_sys.startswith('win'):
         filepath = basepath + '.ico'
     else:  # if tk_sys == 'x11':
-        filepath = '@' + basepath + '.xbm'
+        filepath = basepath + '.xbm'
+    if os.path.isfile(filepath):
+        filepaths.append(filepath)
+    if not filepaths:
+        warnings.warn('E: Could not find icon `{}`.'.format(basepath))
+    _ICON_FILEPATHS[key] = dir_mtime, filepaths
+    return filepaths
+
+
+# ======================================================================
+def _get_icons(root):
+    """Get the icons loaded for `root`, forgotten when it is destroyed."""
+    icons = _ICONS.get(root)
+    if icons is None:
+        icons = _ICONS[root] = {}
+    if not getattr(root, '_icons_watched', False):
+        _bind_own(
+            root, 'icons', '<Destroy>', lambda event: _ICONS.pop(root, None))
+        root._icons_watched = True
+    return icons
+
+
+# ======================================================================
+def _load_icon(root, filepath):
+    icons = _get_icons(root)
+    key = filepath, _get_mtime(filepath)
+    try:
+        return icons[key]
+    except KeyError:
+        pass
+    for old_key in [k for k in icons if k[0] == filepath]:
+        del icons[old_key]
     try:
-        root.iconbitmap(filepath)
+        icon = tk.PhotoImage(master=root, file=filepath)
     except tk.TclError:
-        warnings.warn('E: Could not use icon `{}`.'.format(filepath))
-    else:
-        return
+        warnings.warn('E: Could not use icon `{}`'.format(filepath))
+        icon = None
+    icons[key] = icon
+    return icon
+
+
+# ======================================================================
+def clear_icon_cache():
+    """Forget the icons loaded and looked up by `set_icon()`."""
+    _ICONS.clear()
+    _ICON_FILEPATHS.clear()
+
+
+# ======================================================================
+def set_icon(
+        root,
+        basename,
+        dirpath=os.path.abspath(os.path.dirname(__file__))):
+    """
+    Set the icon of a window.
+
+    The icon files are looked up and decoded once: the decoded images are
+    shared by all the windows, and reloaded only if the files change.
+    Missing or unusable files are remembered (and reported only once).
+
+    Args:
+        root (tk.Tk|tk.Toplevel): The window.
+        basename (str): The icon file name, without extension.
+            PNG and GIF images are preferred, then ICO (on Windows) or XBM.
+        dirpath (str|None): The directory of the icon file.
+
+    Returns:
+        None.
+    """
+    basepath = os.path.join(dirpath, basename) if dirpath else basename
+    basepath = os.path.realpath(basepath)
+    tk_sys = root.tk.call('tk', 'windowingsystem')
+    for filepath in _find_icon_files(basepath, tk_sys):
+        if filepath.endswith(('.ico', '.xbm')):
+            bitmap = filepath if filepath.endswith('.ico') else '@' + filepath
+            icons = _get_icons(root._root())
+            key = bitmap, _get_mtime(filepath)
+            if icons.get(key, True) is None:
+                continue
+            try:
+                root.iconbitmap(bitmap)
+            except tk.TclError:
+                warnings.warn('E: Could not use icon `{}`.'.format(bitmap))
+                icons[key] = None
+            else:
+                return
+        else:
+            icon = _load_icon(root._root(), filepath)
+            if icon is not None:
+                root.tk.call('wm', 'iconphoto', root._w, icon)
+                return
 
 
 # ======================================================================
 def center(target, reference=None):
     target.update_idletasks()
     if reference is None:
-        geometry = get_screen_geometry()
+        geometry = get_screen_geometry(root=target._root())
     elif not isinstance(reference, (str, Geometry)):
         reference.update_idletasks()
         geometry = reference.winfo_geometry()
@@ -133,13 +518,225 @@ def center(target, reference=None):
 
 # ======================================================================
 def set_aspect(target, parent, aspect=1.0):
-    def enforce_aspect_ratio(event):
-        width = event.width
-        height = int(event.width / aspect)
-        if height > event.height:
-            height = event.height
-            width = int(event.height * aspect)
-        target.place(
-            in_=parent, x=0, y=0, width=width, height=height)
-
-    parent.bind("<Configure>", enforce_aspect_ratio)
+    """
+    Keep the aspect ratio of a widget, fitting it in the top-left of a parent.
+
+    The constraint is added to the layout of the parent (see
+    `pytk.layout.get_layout()`), so that all the widgets of the parent are
+    placed at once, in one pass per idle cycle.
+
+    Args:
+        target (tk.Widget): The widget.
+        parent (tk.Widget): The container.
+        aspect (float): The aspect ratio (width / height).
+
+    Returns:
+        None.
+    """
+    from pytk.layout import get_layout
+    get_layout(parent).add(target, aspect=aspect, anchor='top_left')
+
+
+# ======================================================================
+# :: mouse wheel event details: X11 button number / Windows-macOS delta
+WHEEL_EVENTS = {
+    'scroll_up': {'unix': 4, 'win': +120},
+    'scroll_down': {'unix': 5, 'win': -120}}
+
+
+# ======================================================================
+def get_wheel_steps(event, sys_events=None):
+    """
+    Get the number of steps of a mouse wheel event.
+
+    Args:
+        event (tk.Event): The `<MouseWheel>`, `<Button-4>` or `<Button-5>`
+            event.
+        sys_events (dict|None): The mouse wheel event details.
+            If None, uses `WHEEL_EVENTS`.
+
+    Returns:
+        steps (int): The number of steps.
+            Positive values indicate scrolling up.
+    """
+    if sys_events is None:
+        sys_events = WHEEL_EVENTS
+    if event.num == sys_events['scroll_up']['unix']:
+        return 1
+    elif event.num == sys_events['scroll_down']['unix']:
+        return -1
+    elif event.delta:
+        steps = event.delta // abs(sys_events['scroll_up']['win'])
+        return steps or (1 if event.delta > 0 else -1)
+    else:
+        return 0
+
+
+# ======================================================================
+def _schedule(widget, func, delay=None):
+    return widget.after_idle(func) if delay is None \
+        else widget.after(delay, func)
+
+
+# ======================================================================
+def coalesce(widget, func, delay=None):
+    """
+    Wrap an event handler to run at most once per idle cycle.
+
+    All the events received before the handler runs are dropped except the
+    last one, e.g. to process only the last `<Configure>` of a resize.
+
+    Args:
+        widget (tk.Widget): The widget used for scheduling.
+        func (callable): The event handler.
+            Must accept the event as its only argument.
+        delay (int|None): The delay in ms before running the handler.
+            If None, the handler runs when Tk becomes idle.
+
+    Returns:
+        handler (callable): The coalescing event handler.
+    """
+    state = {'event': None, 'after_id': None}
+
+    def flush():
+        event, state['event'], state['after_id'] = state['event'], None, None
+        func(event)
+
+    def handler(event):
+        state['event'] = event
+        if state['after_id'] is None:
+            state['after_id'] = _schedule(widget, flush, delay)
+
+    return handler
+
+
+# ======================================================================
+def throttle(widget, func, interval=16):
+    """
+    Wrap an event handler to run at most once every `interval` ms.
+
+    The first event is handled immediately, the last event received during
+    each interval is handled at the end of the interval.
+
+    Args:
+        widget (tk.Widget): The widget used for scheduling.
+        func (callable): The event handler.
+            Must accept the event as its only argument.
+        interval (int): The minimum interval between calls in ms.
+
+    Returns:
+        handler (callable): The throttling event handler.
+    """
+    state = {'event': None, 'after_id': None}
+
+    def flush():
+        event, state['event'] = state['event'], None
+        if event is not None:
+            func(event)
+            state['after_id'] = widget.after(interval, flush)
+        else:
+            state['after_id'] = None
+
+    def handler(event):
+        if state['after_id'] is None:
+            func(event)
+            state['after_id'] = widget.after(interval, flush)
+        else:
+            state['event'] = event
+
+    return handler
+
+
+# ======================================================================
+def debounce(widget, func, delay=100):
+    """
+    Wrap an event handler to run only after `delay` ms without events.
+
+    Args:
+        widget (tk.Widget): The widget used for scheduling.
+        func (callable): The event handler.
+            Must accept the event as its only argument.
+        delay (int): The quiet time required before running in ms.
+
+    Returns:
+        handler (callable): The debouncing event handler.
+    """
+    state = {'after_id': None}
+
+    def handler(event):
+        if state['after_id'] is not None:
+            widget.after_cancel(state['after_id'])
+        state['after_id'] = widget.after(delay, flush, event)
+
+    def flush(event):
+        state['after_id'] = None
+        func(event)
+
+    return handler
+
+
+# ======================================================================
+def accumulate_wheel(widget, func, delay=None, sys_events=None):
+    """
+    Wrap a mouse wheel handler to run at most once per idle cycle.
+
+    The steps of all the mouse wheel events received before the handler
+    runs are summed up.
+
+    Args:
+        widget (tk.Widget): The widget used for scheduling.
+        func (callable): The handler.
+            Must accept the number of steps as its only argument
+            (positive values indicate scrolling up).
+        delay (int|None): The delay in ms before running the handler.
+            If None, the handler runs when Tk becomes idle.
+        sys_events (dict|None): The mouse wheel event details.
+            If None, uses `WHEEL_EVENTS`.
+
+    Returns:
+        handler (callable): The accumulating event handler.
+    """
+    state = {'steps': 0, 'after_id': None}
+
+    def flush():
+        steps, state['steps'], state['after_id'] = state['steps'], 0, None
+        if steps:
+            func(steps)
+
+    def handler(event):
+        state['steps'] += get_wheel_steps(event, sys_events)
+        if state['after_id'] is None:
+            state['after_id'] = _schedule(widget, flush, delay)
+
+    return handler
+
+
+# ======================================================================
+def bind_wheel(widgets, func, delay=None, sys_events=None, add=None):
+    """
+    Bind the mouse wheel of widgets to an accumulating handler.
+
+    Args:
+        widgets (tk.Widget|Iterable[tk.Widget]): The widgets to bind.
+            All the widgets share the same accumulator.
+        func (callable): The handler.
+            Must accept the number of steps as its only argument
+            (positive values indicate scrolling up).
+        delay (int|None): The delay in ms before running the handler.
+            If None, the handler runs when Tk becomes idle.
+        sys_events (dict|None): The mouse wheel event details.
+            If None, uses `WHEEL_EVENTS`.
+        add (str|None): Add to the existing bindings if '+'.
+
+    Returns:
+        handler (callable): The accumulating event handler.
+    """
+    if isinstance(widgets, tk.Misc):
+        widgets = [widgets]
+    handler = None
+    for widget in widgets:
+        if handler is None:
+            handler = accumulate_wheel(widget, func, delay, sys_events)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            widget.bind(sequence, handler, add)
+    return handler
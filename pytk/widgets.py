@@ -1,13 +1,15 @@
 import os
+import bisect
+import threading
+import collections
 
 # Python interface to Tcl/Tk
 from pytk import tk
 from pytk import ttk
-from pytk import messagebox
-from pytk import filedialog
-from pytk import simpledialog
 
 from pytk import util
+from pytk.util import _call_tcl_proc
+from pytk import dispatch
 
 Frame = ttk.Frame
 Label = ttk.Label
@@ -23,14 +25,183 @@ Checkbutton_ = ttk.Checkbutton
 # Spinbox = tk.Spinbox
 Scale = tk.Scale
 
+# Tcl helper applying a batch of Listview changes in a single round trip.
+# Placeholders (empty iids) in `order` are filled with the inserted items.
+_LISTVIEW_APPLY_TCL = r'''
+namespace eval ::pytk {}
+proc ::pytk::listview_apply {w dels texts order} {
+    if {[llength $dels]} {
+        $w delete $dels
+    }
+    set new {}
+    foreach text $texts {
+        lappend new [$w insert {} end -text $text]
+    }
+    if {[llength $order]} {
+        set children {}
+        set i 0
+        foreach iid $order {
+            if {$iid eq {}} {
+                lappend children [lindex $new $i]
+                incr i
+            } else {
+                lappend children $iid
+            }
+        }
+        $w children {} $children
+    }
+    return $new
+}
+'''
+
+# Tcl helper replacing the children of a LazyTree node in a single round trip.
+# The nodes with children get a placeholder child, so that they can be opened.
+_TREE_LOAD_TCL = r'''
+namespace eval ::pytk {}
+proc ::pytk::tree_load {w parent placeholder rows} {
+    $w delete [$w children $parent]
+    set new {}
+    foreach {text values has_children} $rows {
+        set iid [$w insert $parent end -text $text -values $values]
+        if {$has_children} {
+            $w insert $iid end -text $placeholder
+        }
+        lappend new $iid
+    }
+    return $new
+}
+'''
+
+# Tcl helpers reading and writing the values of many widgets at once.
+_FORM_TCL = r'''
+namespace eval ::pytk {}
+proc ::pytk::form_get {specs} {
+    set result {}
+    foreach {w kind} $specs {
+        if {$kind eq {check}} {
+            lappend result [$w instate selected]
+        } else {
+            lappend result [$w get]
+        }
+    }
+    return $result
+}
+proc ::pytk::form_set {specs} {
+    set changed 0
+    foreach {w kind val} $specs {
+        switch -- $kind {
+            var {
+                upvar #0 $w var
+                if {$var ne $val} {
+                    set var $val
+                    incr changed
+                }
+            }
+            check {
+                if {[$w instate selected] != $val} {
+                    $w invoke
+                    incr changed
+                }
+            }
+            scale {
+                if {[$w get] != $val} {
+                    $w set $val
+                    incr changed
+                }
+            }
+            combo {
+                if {[$w get] ne $val} {
+                    $w set $val
+                    incr changed
+                }
+            }
+            default {
+                if {[$w get] ne $val} {
+                    set state [$w cget -state]
+                    $w configure -state normal
+                    $w delete 0 end
+                    $w insert 0 $val
+                    $w configure -state $state
+                    incr changed
+                }
+            }
+        }
+    }
+    return $changed
+}
+'''
+
 
 # ======================================================================
-class Entry(Entry_):
+class _Traced(object):
+    """
+    Mirror the value of a Tk variable into a Python attribute.
+
+    The variable is traced, so that `get_val()` is an attribute read
+    and the `on_change` callbacks are notified of every change,
+    whether it comes from the user, from `set_val()` or from Tcl.
+    """
+
+    def _init_var(self, option, var_cls, convert, on_change=None, var=None):
+        if isinstance(var, tk.Variable):
+            self._var = var
+        elif var:
+            self._var = var_cls(self, name=str(var))
+        else:
+            self._var = var_cls(self, value=self._get_var_default())
+            self.configure(**{option: self._var})
+        self._convert = convert
+        self._on_change = [on_change] if on_change is not None else []
+        self._val = convert(self.getvar(str(self._var)))
+        if hasattr(self._var, 'trace_add'):
+            self._var.trace_add('write', self._on_var_write)
+        else:
+            self._var.trace_variable('w', self._on_var_write)
+
+    def _get_var_default(self):
+        return ''
+
+    def _on_var_write(self, *_args):
+        val = self._convert(self.getvar(str(self._var)))
+        if val != self._val:
+            self._val = val
+            for func in self._on_change:
+                func(val)
+
+    def bind_change(self, func, add=None):
+        """
+        Call a function whenever the value changes.
+
+        Args:
+            func (callable): The function to call with the new value.
+            add (str|bool|None): Add to the existing callbacks if True
+                (or '+'), otherwise replace them.
+
+        Returns:
+            None.
+        """
+        if not add:
+            self._on_change = []
+        self._on_change.append(func)
+
+    def unbind_change(self, func=None):
+        """Remove a change callback (or all of them, if None)."""
+        if func is None:
+            self._on_change = []
+        else:
+            self._on_change.remove(func)
+
+
+# ======================================================================
+class Entry(_Traced, Entry_):
     def __init__(self, *_args, **_kws):
+        on_change = _kws.pop('on_change', None)
         super(Entry, self).__init__(*_args, **_kws)
+        var = _kws.get('textvariable')
+        self._init_var('textvariable', tk.StringVar, str, on_change, var)
 
     def get_val(self):
-        return self.get()
+        return self._val
 
     def set_val(self, val=''):
         try:
@@ -40,20 +211,26 @@ class Entry(Entry_):
                 raise ValueError
         except ValueError:
             val = ''
-        state = self['state']
-        self['state'] = 'enabled'
-        self.delete(0, tk.END)
-        self.insert(0, val)
-        self['state'] = state
+        # the variable is writable also in `disabled`/`readonly` state
+        self._var.set(val)
 
 
 # ======================================================================
-class Checkbutton(Checkbutton_):
+class Checkbutton(_Traced, Checkbutton_):
     def __init__(self, *_args, **_kws):
+        on_change = _kws.pop('on_change', None)
         super(Checkbutton, self).__init__(*_args, **_kws)
+        var = _kws.get('variable')
+        self._onvalue = str(self.cget('onvalue'))
+        self._init_var(
+            'variable', tk.StringVar,
+            lambda x: str(x) == self._onvalue, on_change, var)
+
+    def _get_var_default(self):
+        return str(self.cget('offvalue'))
 
     def get_val(self):
-        return 'selected' in self.state()
+        return self._val
 
     def set_val(self, val=True):
         # if (val and not self.get_val()) or (not val and self.get_val()):
@@ -70,7 +247,7 @@ class Text(Entry):
         super(Text, self).__init__(*_args, **_kws)
 
     def get_val(self):
-        return self.get()
+        return self._val
 
     def set_val(self, val=''):
         try:
@@ -80,11 +257,8 @@ class Text(Entry):
                 raise ValueError
         except ValueError:
             val = ''
-        state = self['state']
-        self['state'] = 'enabled'
-        self.delete(0, tk.END)
-        self.insert(0, val)
-        self['state'] = state
+        # the variable is writable also in `disabled`/`readonly` state
+        self._var.set(val)
 
 
 # ======================================================================
@@ -93,7 +267,7 @@ class Checkbox(Checkbutton):
         super(Checkbox, self).__init__(*_args, **_kws)
 
     def get_val(self):
-        return 'selected' in self.state()
+        return self._val
 
     def set_val(self, val=True):
         # if (val and not self.get_val()) or (not val and self.get_val()):
@@ -105,7 +279,7 @@ class Checkbox(Checkbutton):
 
 
 # ======================================================================
-class Spinbox(tk.Spinbox):
+class Spinbox(_Traced, tk.Spinbox):
     def __init__(self, *_args, **_kws):
         if 'start' in _kws:
             _kws['from_'] = _kws.pop('start')
@@ -117,31 +291,33 @@ class Spinbox(tk.Spinbox):
             self.default = _kws.pop('default')
         else:
             self.default = None
+        on_change = _kws.pop('on_change', None)
         super(Spinbox, self).__init__(*_args, **_kws)
+        self._init_var(
+            'textvariable', tk.StringVar,
+            lambda x: util.auto_convert(str(x), cached=True), on_change,
+            _kws.get('textvariable'))
         self.values = _kws['values'] if 'values' in _kws else None
         self.start = _kws['from_'] if 'from_' in _kws else None
         self.stop = _kws['to'] if 'to' in _kws else None
         self.step = _kws['increment'] if 'increment' in _kws else None
         if self.default is not None:
             self.set_val(self.default)
-        self.bind('<MouseWheel>', self.mousewheel)
-        self.bind('<Button-4>', self.mousewheel)
-        self.bind('<Button-5>', self.mousewheel)
         self.sys_events = {
             'scroll_up': {'unix': 4, 'win': +120},
             'scroll_down': {'unix': 5, 'win': -120}}
+        util.bind_wheel(self, self.scroll, sys_events=self.sys_events)
+
+    def _get_var_default(self):
+        # keep the initial value set by `from_`/`values`
+        return self.get()
 
     def mousewheel(self, event):
-        scroll_up = (
-                event.num == self.sys_events['scroll_up']['unix'] or
-                event.delta == self.sys_events['scroll_up']['win'])
-        scroll_down = (
-                event.num == self.sys_events['scroll_down']['unix'] or
-                event.delta == self.sys_events['scroll_down']['win'])
-        if scroll_up:
-            self.invoke('buttonup')
-        elif scroll_down:
-            self.invoke('buttondown')
+        self.scroll(util.get_wheel_steps(event, self.sys_events))
+
+    def scroll(self, steps):
+        for _ in range(abs(steps)):
+            self.invoke('buttonup' if steps > 0 else 'buttondown')
 
     def is_valid(self, val=''):
         if self.values:
@@ -151,15 +327,12 @@ class Spinbox(tk.Spinbox):
         return result
 
     def get_val(self):
-        return util.auto_convert(self.get())
+        return self._val
 
     def set_val(self, val=''):
         if self.is_valid(val):
-            state = self['state']
-            self['state'] = 'normal'
-            self.delete(0, tk.END)
-            self.insert(0, val)
-            self['state'] = state
+            # the variable is writable also in `disabled`/`readonly` state
+            self._var.set(val)
         else:
             raise ValueError('Spinbox: value `{}` not allowed.'.format(val))
 
@@ -184,24 +357,17 @@ class Range(Scale):
         self.step = _kws['resolution'] if 'resolution' in _kws else None
         if self.default is not None:
             self.set_val(self.default)
-        self.bind('<MouseWheel>', self.mousewheel)
-        self.bind('<Button-4>', self.mousewheel)
-        self.bind('<Button-5>', self.mousewheel)
         self.sys_events = {
             'scroll_up': {'unix': 4, 'win': +120},
             'scroll_down': {'unix': 5, 'win': -120}}
+        util.bind_wheel(self, self.scroll, sys_events=self.sys_events)
 
     def mousewheel(self, event):
-        scroll_up = (
-                event.num == self.sys_events['scroll_up']['unix'] or
-                event.delta == self.sys_events['scroll_up']['win'])
-        scroll_down = (
-                event.num == self.sys_events['scroll_down']['unix'] or
-                event.delta == self.sys_events['scroll_down']['win'])
-        if scroll_up:
-            self.set_val(self.get_val() + self.step)
-        elif scroll_down:
-            self.set_val(self.get_val() - self.step)
+        self.scroll(util.get_wheel_steps(event, self.sys_events))
+
+    def scroll(self, steps):
+        if steps:
+            self.set_val(self.get_val() + steps * self.step)
 
     def is_valid(self, val=0):
         result = self.start <= self.get_val() <= self.stop
@@ -219,15 +385,190 @@ class Range(Scale):
             raise ValueError('Spinbox: value `{}` not allowed.'.format(val))
 
 
+# ======================================================================
+class _ValueIndex(object):
+    def __init__(self, values):
+        """
+        Index values for prefix and substring lookups (ignoring case).
+
+        Args:
+            values (Iterable[str]): The values.
+
+        Returns:
+            None.
+        """
+        self.values = list(values)
+        folded = [value.lower() for value in self.values]
+        # prefix lookups: bisection on the sorted folded values
+        self.order = sorted(range(len(folded)), key=folded.__getitem__)
+        self.keys = [folded[i] for i in self.order]
+        # substring lookups: `str.find()` on all the folded values at once
+        self.text = '\n'.join(folded)
+        self.starts = []
+        pos = 0
+        for key in folded:
+            self.starts.append(pos)
+            pos += len(key) + 1
+        # the prefix range of the last lookup
+        self._last = '', 0, len(self.keys)
+
+    def find_prefix(self, prefix, num):
+        """
+        Find the values starting with a prefix, in sorted order.
+
+        When the prefix extends the one of the previous lookup (e.g. while
+        typing), only the previous range is bisected.
+
+        Args:
+            prefix (str): The prefix (lowercase).
+            num (int|None): The maximum number of results.
+
+        Returns:
+            result (list[str]): The matching values.
+        """
+        last, first, last_stop = self._last
+        if not prefix.startswith(last):
+            first, last_stop = 0, len(self.keys)
+        first = bisect.bisect_left(self.keys, prefix, first, last_stop)
+        # the first key not starting with the prefix
+        stop = bisect.bisect_left(
+            self.keys, prefix + '\U0010ffff', first, last_stop)
+        self._last = prefix, first, stop
+        if num is not None:
+            stop = min(stop, first + num)
+        return [self.values[self.order[i]] for i in range(first, stop)]
+
+    def find_substring(self, text, num, exclude=()):
+        """
+        Find the values containing a text, in the original order.
+
+        Args:
+            text (str): The text (lowercase).
+            num (int|None): The maximum number of results.
+            exclude (Container[str]): The values to skip.
+
+        Returns:
+            result (list[str]): The matching values.
+        """
+        result = []
+        pos = self.text.find(text)
+        while pos >= 0 and (num is None or len(result) < num):
+            i = bisect.bisect_right(self.starts, pos) - 1
+            if self.values[i] not in exclude:
+                result.append(self.values[i])
+            # continue from the next value
+            pos = self.text.find(
+                text, self.starts[i + 1] if i + 1 < len(self.starts)
+                else len(self.text))
+        return result
+
+
 # ======================================================================
 class Listbox(Combobox):
     def __init__(self, *_args, **_kws):
+        """
+        A read-only combobox, optionally searchable.
+
+        In searchable mode, the entry is editable and the dropdown only
+        shows the first matches of the typed text, so that very long lists
+        of values never reach Tk as a whole.
+
+        Args:
+            *_args: Positional arguments for `ttk.Combobox`.
+            **_kws: Keyword arguments for `ttk.Combobox`, and:
+                searchable (bool): Enable the searchable mode.
+                max_matches (int): The maximum number of values shown
+                    in searchable mode.
+                substring (bool): In searchable mode, after the values
+                    starting with the text, show the values containing it.
+                In searchable mode, `postcommand` is called after the
+                values shown are updated.
+
+        Returns:
+            None.
+        """
+        self.searchable = _kws.pop('searchable', False)
+        self.max_matches = _kws.pop('max_matches', 50)
+        self.substring = _kws.pop('substring', True)
+        values = _kws.pop('values', ()) if self.searchable else None
+        self._postcommand = None
+        if self.searchable:
+            self._postcommand = _kws.pop('postcommand', None)
+            _kws['postcommand'] = self._on_post
         super(Listbox, self).__init__(*_args, **_kws)
-        self['state'] = 'readonly'
+        self._index = None
+        self._update_id = None
+        self._text = None
+        if self.searchable:
+            self.set_values(values)
+            self.bind('<KeyRelease>', self._on_key_release, '+')
+        else:
+            self['state'] = 'readonly'
 
     def get_values(self):
+        if self.searchable:
+            return self._index.values
         return self.configure('values')[-1]
 
+    def set_values(self, values):
+        """
+        Set the values.
+
+        Args:
+            values (Iterable[str]): The values.
+
+        Returns:
+            None.
+        """
+        if self.searchable:
+            self._index = _ValueIndex(values)
+            self._text = None
+            self._update_matches()
+        else:
+            self['values'] = tuple(values)
+
+    def get_matches(self, text):
+        """
+        Get the values shown for a text in searchable mode.
+
+        Args:
+            text (str): The text.
+
+        Returns:
+            result (list[str]): The values starting with the text (sorted),
+                followed by the values containing it (if `substring`),
+                at most `max_matches`.
+        """
+        text = text.lower()
+        result = self._index.find_prefix(text, self.max_matches)
+        num = self.max_matches - len(result) \
+            if self.max_matches is not None else None
+        if self.substring and text and (num is None or num > 0):
+            result.extend(
+                self._index.find_substring(text, num, frozenset(result)))
+        return result
+
+    def _on_key_release(self, event):
+        if self._update_id is None:
+            # coalesce fast typing into one update
+            self._update_id = self.after_idle(self._update_matches)
+
+    def _on_post(self):
+        self._update_matches()
+        if callable(self._postcommand):
+            self._postcommand()
+        elif self._postcommand:
+            self.tk.eval(self._postcommand)
+
+    def _update_matches(self):
+        if self._update_id is not None:
+            self.after_cancel(self._update_id)
+            self._update_id = None
+        text = self.get()
+        if text != self._text:
+            self._text = text
+            self['values'] = self.get_matches(text)
+
     def get_val(self):
         return self.get()
 
@@ -235,27 +576,1031 @@ class Listbox(Combobox):
         self.set(val)
 
 
+# ======================================================================
+class _CallableSequence(object):
+    def __init__(self, get_item, size):
+        self.get_item = get_item
+        self.size = size
+
+    def __len__(self):
+        return self.size() if callable(self.size) else self.size
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self.get_item(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('index `{}` out of range'.format(i))
+        return self.get_item(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.get_item(i)
+
+
+# ======================================================================
+class _TableRows(object):
+    def __init__(self, columns):
+        self.columns = columns
+        # the row order (None for the storage order)
+        self.index = None
+
+    def __len__(self):
+        if self.index is not None:
+            return len(self.index)
+        return min(len(column) for column in self.columns) \
+            if self.columns else 0
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('index `{}` out of range'.format(i))
+        if self.index is not None:
+            i = self.index[i]
+        return tuple(column[i] for column in self.columns)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def argsort(self, key=None, reverse=False):
+        column = getattr(key, 'column', None)
+        if column is None:
+            keys = [key(row) if key else row for row in self]
+            return sorted(
+                range(len(keys)), key=keys.__getitem__, reverse=reverse)
+        values = self.columns[column]
+        if self.index is not None:
+            values = _take(values, self.index)
+        if hasattr(values, 'argsort'):  # NumPy arrays
+            if reverse:
+                # stable descending order
+                return (len(values) - 1
+                        - values[::-1].argsort(kind='stable'))[::-1]
+            return values.argsort(kind='stable')
+        return sorted(
+            range(len(self)), key=values.__getitem__, reverse=reverse)
+
+    def reorder(self, order):
+        self.index = order if self.index is None else _take(self.index, order)
+
+
+# ======================================================================
+def _take(seq, index):
+    return seq.take(index) if hasattr(seq, 'take') \
+        else [seq[i] for i in index]
+
+
+# ======================================================================
+def _column_key(i):
+    def key(row):
+        return row[i]
+
+    key.column = i
+    return key
+
+
+# ======================================================================
+def _get_formatter(fmt):
+    if fmt is None:
+        return str
+    elif callable(fmt):
+        return fmt
+    else:
+        return fmt.format
+
+
 # ======================================================================
 class Listview(Treeview):
     def __init__(self, *_args, **_kws):
+        self.virtual = _kws.pop('virtual', False)
+        items = _kws.pop('items', None)
+        num_items = _kws.pop('num_items', None)
+        self._yscrollcommand = \
+            _kws.pop('yscrollcommand', None) if self.virtual else None
+        # text -> iids and iid -> text of the top-level rows
+        self._iids = {}
+        self._texts = {}
+        # item -> number of occurrences in the model (virtual mode only)
+        self._counts = None
+        # sort/filter state: while active, `_rows` holds all the top-level
+        # rows in insertion order, and `_shown` the ones attached (in order)
+        self._rows = None
+        self._shown = None
+        self._sorting = False
+        self._sort_key = None
+        self._sort_reverse = False
+        self._sort_keys = {}
+        self._sorted_rows = None
+        self._filter_text = None
+        self._filter_func = None
+        self._folded = {}
+        # column names and formatters (table mode only)
+        self._columns = None
+        self._formatters = None
+        self._matches = None
+        self._hidden_selection = set()
+        self._view_id = None
         super(Listview, self).__init__(*_args, **_kws)
+        self.sys_events = {
+            'scroll_up': {'unix': 4, 'win': +120},
+            'scroll_down': {'unix': 5, 'win': -120}}
+        if self.virtual:
+            self._model = []
+            self._offset = 0
+            self._num_visible = int(_kws.get('height', 10))
+            self._row_height = None
+            self._header_height = 0
+            self._measure_id = None
+            self._slots = []
+            self._slot_texts = []
+            self._selected = set()
+            self._render_id = None
+            self.set_items(items if items is not None else [], num_items)
+            self.bind('<Configure>', self._on_configure)
+            self.bind('<<TreeviewSelect>>', self._on_select)
+            self.bind('<MouseWheel>', self.mousewheel)
+            self.bind('<Button-4>', self.mousewheel)
+            self.bind('<Button-5>', self.mousewheel)
+            self.bind('<Up>', lambda event: self._on_key(-1))
+            self.bind('<Down>', lambda event: self._on_key(1))
+            self.bind('<Prior>', lambda event: self._on_key(-1, 'pages'))
+            self.bind('<Next>', lambda event: self._on_key(1, 'pages'))
+            self.bind('<Home>', lambda event: self._on_key(-1, 'all'))
+            self.bind('<End>', lambda event: self._on_key(1, 'all'))
+        elif items is not None:
+            for item in items:
+                self.add_item(item)
+
+    def configure(self, cnf=None, **_kws):
+        if self.virtual:
+            # the scrollbar follows the model, not the rows in Tk
+            updated = False
+            if isinstance(cnf, dict) and 'yscrollcommand' in cnf:
+                cnf = dict(cnf)
+                self._yscrollcommand = cnf.pop('yscrollcommand')
+                updated = True
+            if 'yscrollcommand' in _kws:
+                self._yscrollcommand = _kws.pop('yscrollcommand')
+                updated = True
+            if updated:
+                self._update_scrollbar()
+                if not cnf and not _kws:
+                    return None
+        return super(Listview, self).configure(cnf, **_kws)
+
+    config = configure
+
+    def set_items(self, items, num_items=None):
+        """
+        Set the Python-side model backing a virtual Listview.
+
+        Args:
+            items (Sequence|callable): The items to show.
+                If callable, it must accept the item index and return the
+                corresponding item, and `num_items` must be specified.
+            num_items (int|callable|None): The number of items.
+                Only used if `items` is callable.
+                If callable, it is called without arguments every time the
+                number of items is needed (useful for growing models).
+
+        Returns:
+            None.
+        """
+        if callable(items):
+            if num_items is None:
+                raise ValueError(
+                    'Listview: `num_items` required for callable `items`.')
+            items = _CallableSequence(items, num_items)
+        if self.virtual:
+            self._model = items
+            self._counts = None
+            self._selected = set()
+            self._offset = 0
+            self.refresh()
+        else:
+            self.clear()
+            for item in items:
+                self.add_item(item)
+
+    def set_table(self, data, formatters=None):
+        """
+        Show tabular data in a virtual Listview, one column per field.
+
+        The columns are used as they are (no copy): only the rows being
+        displayed are formatted, so that the memory used is proportional
+        to the raw data.
+        Sorting by column (e.g. with `bind_heading_sort()`) only reorders
+        an index, and uses `argsort()` for NumPy columns.
+
+        Args:
+            data (Mapping|Iterable|numpy.ndarray): The columns.
+                Either a mapping or an iterable of (name, column) pairs,
+                or a NumPy structured array.
+                Each column can be any sequence, e.g. a list, an
+                `array.array` or a NumPy array.
+            formatters (Mapping|None): The column formatters.
+                The keys are the column names and the values are either
+                format strings (e.g. `{:.3f}`) or callables accepting the
+                value and returning its text.
+                Missing columns are formatted with `str()`.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If the Listview is not in virtual mode.
+        """
+        if not self.virtual:
+            raise ValueError('Listview: tables require virtual mode.')
+        if hasattr(data, 'dtype') and data.dtype.names:
+            data = [(name, data[name]) for name in data.dtype.names]
+        elif hasattr(data, 'items'):
+            data = data.items()
+        names, columns = [], []
+        for name, column in data:
+            names.append(name)
+            columns.append(column)
+        formatters = formatters or {}
+        self._columns = names
+        self._formatters = [
+            _get_formatter(formatters.get(name)) for name in names]
+        self._slot_texts = [None] * len(self._slots)
+        super(Listview, self).configure(columns=names, show='headings')
+        for name in names:
+            self.heading(name, text=name)
+        self.set_items(_TableRows(columns))
+
+    def _mutable_model(self):
+        if not hasattr(self._model, 'append'):
+            self._model = list(self._model)
+        return self._model
+
+    def refresh(self):
+        """Re-render the visible rows (e.g. after changing the model)."""
+        if self.virtual and self._render_id is None:
+            self._render_id = self.after_idle(self._render)
+
+    def _render(self):
+        self._render_id = None
+        num = len(self._model)
+        max_offset = max(0, num - self._num_visible)
+        self._offset = min(max(0, self._offset), max_offset)
+        # one more row for the partially visible one at the bottom
+        count = max(0, min(self._num_visible + 1, num - self._offset))
+        if len(self._slots) > count:
+            super(Listview, self).delete(*self._slots[count:])
+            del self._slots[count:]
+            del self._slot_texts[count:]
+        while len(self._slots) < count:
+            self._slots.append(super(Listview, self).insert('', tk.END))
+            self._slot_texts.append(None)
+        selection = []
+        for k, iid in enumerate(self._slots):
+            i = self._offset + k
+            text = self._model[i]
+            if text != self._slot_texts[k]:
+                if self._formatters is None:
+                    self.item(iid, text=text)
+                else:
+                    self.item(iid, values=[
+                        fmt(x) for fmt, x in zip(self._formatters, text)])
+                self._slot_texts[k] = text
+            if i in self._selected:
+                selection.append(iid)
+        if tuple(selection) != self.selection():
+            self.selection_set(selection)
+        self._update_scrollbar()
+        if not self._row_height and self._slots:
+            # measure the rows once they are laid out
+            self._schedule_measure()
+
+    def _schedule_measure(self):
+        if self._measure_id is None:
+            self._measure_id = self.after_idle(self._measure)
+
+    def _measure(self):
+        # compute the number of rows fitting the height of the widget
+        self._measure_id = None
+        if self._slots:
+            bbox = self.bbox(self._slots[0])
+            if bbox:
+                self._row_height = bbox[3]
+                self._header_height = bbox[1]
+        if self._row_height:
+            num_visible = max(
+                1, (self.winfo_height() - self._header_height)
+                // self._row_height)
+            if num_visible != self._num_visible:
+                self._num_visible = num_visible
+                self.refresh()
+
+    def _update_scrollbar(self):
+        if self._yscrollcommand:
+            first, last = self.yview()
+            if callable(self._yscrollcommand):
+                self._yscrollcommand(first, last)
+            else:
+                self.tk.eval('{} {} {}'.format(
+                    self._yscrollcommand, first, last))
+
+    def _on_configure(self, event):
+        self._measure()
+        if not self._row_height:
+            # e.g. the first rows are not laid out yet
+            self._schedule_measure()
+
+    def _on_select(self, event):
+        visible = range(self._offset, self._offset + len(self._slots))
+        self._selected.difference_update(visible)
+        self._selected.update(
+            self._offset + self._slots.index(iid)
+            for iid in self.selection() if iid in self._slots)
+
+    def _on_key(self, step, what='units'):
+        if what == 'units':
+            focus = self.focus()
+            if focus not in self._slots:
+                return None
+            k = self._slots.index(focus)
+            last = min(self._num_visible, len(self._slots)) - 1
+            if not (step < 0 and k == 0 or step > 0 and k >= last):
+                return None
+            self._selected = {self._offset + k + step}
+        elif what == 'all':
+            self._offset = 0 if step < 0 else len(self._model)
+            self.refresh()
+            return 'break'
+        self.yview('scroll', step, what)
+        return 'break'
+
+    def mousewheel(self, event):
+        # rendering is already deferred to the next idle cycle
+        steps = util.get_wheel_steps(event, self.sys_events)
+        if steps:
+            self.yview_scroll(-steps, 'units')
+        return 'break'
+
+    def yview(self, *args):
+        if not self.virtual:
+            return super(Listview, self).yview(*args)
+        num = len(self._model)
+        if not args:
+            if not num:
+                return 0.0, 1.0
+            return (
+                self._offset / float(num),
+                min(self._offset + self._num_visible, num) / float(num))
+        elif args[0] == 'moveto':
+            self._offset = int(round(float(args[1]) * num))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            if args[2] == 'pages':
+                step *= self._num_visible
+            self._offset += step
+        self.refresh()
+        return None
+
+    def yview_moveto(self, fraction):
+        if not self.virtual:
+            return super(Listview, self).yview_moveto(fraction)
+        self.yview('moveto', fraction)
+
+    def yview_scroll(self, number, what):
+        if not self.virtual:
+            return super(Listview, self).yview_scroll(number, what)
+        self.yview('scroll', number, what)
+
+    def see_index(self, index):
+        if not self.virtual:
+            self.see(self.get_children('')[index])
+        elif index < self._offset:
+            self._offset = index
+            self.refresh()
+        elif index >= self._offset + self._num_visible:
+            self._offset = index - self._num_visible + 1
+            self.refresh()
+
+    def get_selected_items(self):
+        if self.virtual:
+            return [self._model[i] for i in sorted(self._selected)]
+        else:
+            return [self.item(child, 'text') for child in self.selection()]
+
+    def _get_counts(self):
+        if self._counts is None:
+            self._counts = {}
+            for item in self._model:
+                self._counts[item] = self._counts.get(item, 0) + 1
+        return self._counts
+
+    def _index(self, iid, text):
+        self._texts[iid] = text
+        self._iids.setdefault(text, []).append(iid)
+
+    def _unindex(self, iid):
+        text = self._texts.pop(iid)
+        iids = self._iids[text]
+        iids.remove(iid)
+        if not iids:
+            del self._iids[text]
+
+    def __contains__(self, item):
+        if self.virtual:
+            return item in self._get_counts()
+        return item in self._iids
+
+    def __len__(self):
+        if self.virtual:
+            return len(self._model)
+        return len(self._texts)
+
+    def __bool__(self):
+        # a widget is always truthy, even if empty
+        return True
+
+    __nonzero__ = __bool__
+
+    def insert(self, parent, index, iid=None, **_kws):
+        iid = super(Listview, self).insert(parent, index, iid, **_kws)
+        if parent == '':
+            self._index(iid, _kws.get('text', ''))
+            if self._rows is not None:
+                self._rows.append(iid)
+                self._invalidate_view()
+        return iid
+
+    def delete(self, *items):
+        super(Listview, self).delete(*items)
+        for iid in items:
+            if iid in self._texts:
+                self._unindex(iid)
+        if self._rows is not None:
+            self._forget_rows(items)
+
+    def item(self, item, option=None, **_kws):
+        if 'text' in _kws and item in self._texts:
+            self._unindex(item)
+            self._index(item, _kws['text'])
+            self._folded.pop(item, None)
+            self._invalidate_view()
+        return super(Listview, self).item(item, option, **_kws)
+
+    def get_iids(self, item):
+        return list(self._iids.get(item, ()))
 
     def get_items(self):
-        return [self.item(child, 'text') for child in self.get_children('')]
+        if self.virtual:
+            return list(self._model)
+        return [self._texts[child] for child in self.get_children('')]
 
     def add_item(self, item, unique=False):
-        items = self.get_items()
-        if not unique or unique and item not in items:
+        if self.virtual:
+            if not unique or item not in self:
+                self._mutable_model().append(item)
+                if self._counts is not None:
+                    self._counts[item] = self._counts.get(item, 0) + 1
+                self.refresh()
+            return
+        if not unique or item not in self._iids:
             self.insert('', tk.END, text=item)
 
     def del_item(self, item):
-        for child in self.get_children(''):
-            if self.item(child, 'text') == item:
-                self.delete(child)
+        if self.virtual:
+            if item not in self:
+                return
+            model = self._mutable_model()
+            removed = [i for i, x in enumerate(model) if x == item]
+            model[:] = [x for x in model if x != item]
+            self._counts.pop(item, None)
+            self._selected = {
+                i - bisect.bisect_left(removed, i)
+                for i in self._selected.difference(removed)}
+            self.refresh()
+            return
+        if item in self._iids:
+            self.delete(*self._iids[item])
 
     def clear(self):
-        for child in self.get_children(''):
-            self.delete(child)
+        if self.virtual:
+            if hasattr(self._model, 'append'):
+                del self._model[:]
+            else:
+                self._model = []
+            self._counts = None
+            self._selected = set()
+            self.refresh()
+            return
+        children = self.get_children('') if self._rows is None \
+            else list(self._rows)
+        if children:
+            self.delete(*children)
+
+    def _apply(self, dels=(), texts=(), order=()):
+        new = _call_tcl_proc(
+            self, _LISTVIEW_APPLY_TCL, '::pytk::listview_apply', self._w,
+            tuple(dels), tuple(texts), tuple(order))
+        for iid in dels:
+            self._unindex(iid)
+        new = self.tk.splitlist(new)
+        for iid, text in zip(new, texts):
+            self._index(iid, text)
+        if self._rows is not None:
+            if order:
+                new_iter = iter(new)
+                self._rows = [iid or next(new_iter) for iid in order]
+            else:
+                self._forget_rows(dels)
+                self._rows.extend(new)
+            self._invalidate_view()
+        return new
+
+    def add_items(self, items, unique=False):
+        """
+        Add multiple items at the end in a single Tcl round trip.
+
+        Args:
+            items (Iterable): The items to add.
+            unique (bool): Skip items that are already present.
+
+        Returns:
+            None.
+        """
+        if unique:
+            seen = set(
+                self._get_counts() if self.virtual else self._iids)
+            texts = []
+            for item in items:
+                if item not in seen:
+                    seen.add(item)
+                    texts.append(item)
+        else:
+            texts = list(items)
+        if not texts:
+            return
+        if self.virtual:
+            self._mutable_model().extend(texts)
+            if self._counts is not None:
+                for item in texts:
+                    self._counts[item] = self._counts.get(item, 0) + 1
+            self.refresh()
+        else:
+            self._apply(texts=texts)
+
+    def del_items(self, items):
+        """
+        Remove all occurrences of multiple items in a single Tcl round trip.
+
+        Args:
+            items (Iterable): The items to remove.
+
+        Returns:
+            None.
+        """
+        items = set(items)
+        if self.virtual:
+            if not items.intersection(self._get_counts()):
+                return
+            self.replace_items(x for x in self._model if x not in items)
+        else:
+            dels = [iid for item in items for iid in self._iids.get(item, ())]
+            if dels:
+                self._apply(dels=dels)
+
+    def replace_items(self, items):
+        """
+        Replace the contents with new items, applying only the differences.
+
+        Rows whose text is still present are kept (and moved if needed),
+        the others are deleted, and the missing ones are inserted.
+        All the changes are applied in a single Tcl round trip.
+
+        Args:
+            items (Iterable): The new items.
+
+        Returns:
+            None.
+        """
+        items = list(items)
+        if self.virtual:
+            if hasattr(self._model, 'append'):
+                self._model[:] = items
+            else:
+                self._model = items
+            self._counts = None
+            self._selected = set()
+            self.refresh()
+            return
+        children = self.get_children('') if self._rows is None \
+            else self._rows
+        pool = {}
+        for iid in children:
+            pool.setdefault(self._texts[iid], []).append(iid)
+        for iids in pool.values():
+            iids.reverse()
+        order, texts = [], []
+        for item in items:
+            iids = pool.get(item)
+            if iids:
+                order.append(iids.pop())
+            else:
+                order.append('')
+                texts.append(item)
+        dels = [iid for iids in pool.values() for iid in iids]
+        # skip reordering if kept rows keep their order and new rows go last
+        kept = [iid for iid in order if iid]
+        dels_set = set(dels)
+        if not any(order[len(kept):]) and \
+                kept == [iid for iid in children if iid not in dels_set]:
+            order = ()
+        if dels or texts or order:
+            self._apply(dels, texts, order)
+
+    def _forget_rows(self, iids):
+        iids = set(iids)
+        self._rows = [iid for iid in self._rows if iid not in iids]
+        self._hidden_selection.difference_update(iids)
+        for iid in iids:
+            self._folded.pop(iid, None)
+        self._invalidate_view()
+
+    def _invalidate_view(self):
+        if self._rows is None:
+            return
+        self._sorted_rows = None
+        self._matches = None
+        # the attached rows may have changed as well
+        self._shown = None
+        if self._view_id is None:
+            self._view_id = self.after_idle(self._update_view)
+
+    def _get_sort_key(self, text):
+        try:
+            return self._sort_keys[text]
+        except KeyError:
+            key = self._sort_keys[text] = \
+                self._sort_key(text) if self._sort_key else text
+            return key
+
+    def _filter_rows(self, iids):
+        texts = self._texts
+        text = self._filter_text
+        if self._filter_func is not None:
+            func = self._filter_func
+            return [iid for iid in iids if func(text, texts[iid])]
+        folded = self._folded
+        for iid in iids:
+            if iid not in folded:
+                folded[iid] = str(texts[iid]).lower()
+        return [iid for iid in iids if text in folded[iid]]
+
+    def _update_view(self):
+        if self._view_id is not None:
+            self.after_cancel(self._view_id)
+            self._view_id = None
+        if self._rows is None:
+            return
+        rows = self._rows
+        if self._sorting:
+            if self._sorted_rows is None:
+                texts = self._texts
+                self._sorted_rows = sorted(
+                    rows, key=lambda iid: self._get_sort_key(texts[iid]),
+                    reverse=self._sort_reverse)
+            rows = self._sorted_rows
+        if self._filter_text is not None:
+            self._matches = self._filter_rows(
+                self._matches if self._matches is not None else rows)
+            rows = self._matches
+        if rows != self._shown:
+            # detached rows may lose their selection: restore it if shown
+            selection = self._hidden_selection.union(self.selection())
+            super(Listview, self).set_children('', *rows)
+            self._shown = list(rows)
+            if selection:
+                shown = set(rows)
+                self._hidden_selection = selection.difference(shown)
+                self.selection_set(
+                    [iid for iid in rows if iid in selection])
+        if not self._sorting and self._filter_text is None:
+            # the insertion order is restored: stop tracking the rows
+            self._rows = self._shown = None
+            self._hidden_selection = set()
+            self._sort_keys = {}
+            self._folded = {}
+
+    def _start_view(self):
+        if self.virtual:
+            raise ValueError(
+                'Listview: filtering requires non-virtual mode '
+                '(filter the model and use `set_items()` instead).')
+        if self._rows is None:
+            self._rows = list(self.get_children(''))
+            self._shown = list(self._rows)
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sort the items (stable), keeping the selection.
+
+        The sort keys are computed once per distinct item and cached
+        until a different `key` is used.
+        Items added later are shown in sorted order as well.
+
+        Args:
+            key (callable|None): The function computing the sort key
+                of an item. If None, the items themselves are used.
+            reverse (bool): Sort in descending order.
+
+        Returns:
+            None.
+        """
+        if key is not self._sort_key:
+            self._sort_keys = {}
+        self._sorting = True
+        self._sort_key = key
+        self._sort_reverse = reverse
+        if self.virtual:
+            if isinstance(self._model, _TableRows):
+                # rows are not hashable in general: no key caching
+                order = self._model.argsort(key, reverse)
+                self._model.reorder(order)
+            else:
+                model = self._mutable_model()
+                order = sorted(
+                    range(len(model)),
+                    key=lambda i: self._get_sort_key(model[i]),
+                    reverse=reverse)
+                model[:] = [model[i] for i in order]
+            if self._selected and hasattr(order, 'argsort'):
+                inverse = order.argsort()
+                self._selected = {int(inverse[j]) for j in self._selected}
+            elif self._selected:
+                self._selected = {
+                    i for i, j in enumerate(order) if j in self._selected}
+            self.refresh()
+            return
+        self._start_view()
+        self._sorted_rows = None
+        self._matches = None
+        self._update_view()
+
+    def unsort(self):
+        """Restore the insertion order of the items (non-virtual only)."""
+        if self.virtual:
+            raise ValueError(
+                'Listview: the insertion order is not kept in virtual mode.')
+        self._sorting = False
+        self._sort_key = None
+        self._sorted_rows = None
+        self._matches = None
+        self._update_view()
+
+    def bind_heading_sort(self, key=None, column='#0'):
+        """
+        Sort the items when clicking on a column heading.
+
+        Clicking again on the same heading toggles the sort direction.
+
+        Args:
+            key (callable|None): The function computing the sort key
+                of an item. If None, the items themselves are used,
+                or the values of `column` in table mode.
+            column (str): The column identifier.
+
+        Returns:
+            None.
+        """
+        if key is None and self._columns and column in self._columns:
+            key = _column_key(self._columns.index(column))
+
+        def command():
+            self.sort(
+                key, self._sorting and self._sort_key is key
+                and not self._sort_reverse)
+
+        self.heading(column, command=command)
+
+    def filter_items(self, text='', func=None):
+        """
+        Show only the items matching a filter, keeping the selection.
+
+        The other rows are detached (not deleted) and reattached when they
+        match again, in a single Tcl round trip.
+        When the new filter text contains the previous one (e.g. while
+        typing), only the items previously shown are tested.
+        Items added later are filtered as well.
+
+        Args:
+            text (str): The filter text.
+                By default, the items containing it (ignoring case) are
+                shown. If empty, all the items are shown.
+            func (callable|None): The match function.
+                Must accept the filter text and an item and return True if
+                the item should be shown.
+
+        Returns:
+            None.
+        """
+        if func is None:
+            text = text.lower()
+        if not text:
+            self._filter_text = self._filter_func = self._matches = None
+        else:
+            self._start_view()
+            if func is not None or self._filter_func is not None \
+                    or self._filter_text is None \
+                    or self._filter_text not in text:
+                self._matches = None
+            self._filter_text = text
+            self._filter_func = func
+        self._update_view()
+
+
+# ======================================================================
+class LazyTree(Treeview):
+    def __init__(self, *_args, **_kws):
+        """
+        A tree whose children are fetched from a provider when opened.
+
+        Only the children of the nodes opened are inserted into Tk: the other
+        nodes with children get a placeholder child.
+        When more than `max_rows` rows are loaded, the children of the nodes
+        collapsed least recently are unloaded.
+
+        Args:
+            *_args: Positional arguments for `ttk.Treeview`.
+            **_kws: Keyword arguments for `ttk.Treeview`, and:
+                provider (callable|None): The data provider.
+                    Must accept the key of a node (None for the root) and
+                    return its children as `(key, text, values, has_children)`
+                    tuples.
+                worker (bool): Call the provider in a worker thread.
+                max_rows (int|None): The maximum number of rows loaded.
+                    If None, the rows are never unloaded.
+                placeholder (str): The text of the placeholder rows.
+                dispatcher (pytk.dispatch.Dispatcher|None): The dispatcher
+                    for the results of the worker.
+                    If None and `worker` is True, a new one is created.
+
+        Returns:
+            None.
+        """
+        provider = _kws.pop('provider', None)
+        self.worker = _kws.pop('worker', False)
+        self.max_rows = _kws.pop('max_rows', 100000)
+        self.placeholder = _kws.pop('placeholder', '...')
+        self.dispatcher = _kws.pop('dispatcher', None)
+        super(LazyTree, self).__init__(*_args, **_kws)
+        self._owns_dispatcher = self.dispatcher is None and self.worker
+        if self._owns_dispatcher:
+            self.dispatcher = dispatch.Dispatcher(self.winfo_toplevel())
+        self.provider = None
+        # iid -> key
+        self._keys = {}
+        # iid -> children iids (for the loaded nodes only)
+        self._children = {}
+        # iid -> token of the load in progress
+        self._loading = {}
+        # the nodes holding a placeholder row (not loaded yet)
+        self._placeholders = set()
+        # the loaded nodes that are collapsed (least recently first)
+        self._collapsed = collections.OrderedDict()
+        self._num_rows = 0
+        self.bind('<<TreeviewOpen>>', self._on_open, '+')
+        self.bind('<<TreeviewClose>>', self._on_close, '+')
+        if provider is not None:
+            self.set_provider(provider)
+
+    def set_provider(self, provider):
+        """
+        Set the data provider and load the root nodes.
+
+        Args:
+            provider (callable): The data provider.
+                See `LazyTree()` for details.
+
+        Returns:
+            None.
+        """
+        self.provider = provider
+        self.reload()
+
+    def reload(self, iid=''):
+        """
+        Fetch the children of a node again.
+
+        Args:
+            iid (str): The node. If empty, the whole tree is reloaded.
+
+        Returns:
+            None.
+        """
+        self._num_rows -= self._forget(iid)
+        self._collapsed.pop(iid, None)
+        self._load(iid)
+
+    def get_key(self, iid):
+        """Get the key of a node (None for the root)."""
+        return self._keys.get(iid)
+
+    def get_val(self):
+        return [self._keys[iid] for iid in self.selection()]
+
+    def is_loaded(self, iid):
+        return iid in self._children
+
+    def _forget(self, iid):
+        # forget the loaded descendants of a node, return their number
+        num = 0
+        for child in self._children.pop(iid, ()):
+            num += 1 + self._forget(child)
+            del self._keys[child]
+            self._collapsed.pop(child, None)
+            self._placeholders.discard(child)
+        self._loading.pop(iid, None)
+        return num
+
+    def _on_open(self, event):
+        # also fired for the leaves (e.g. on double-click)
+        iid = self.focus()
+        if iid in self._children:
+            self._collapsed.pop(iid, None)
+        elif iid in self._placeholders and iid not in self._loading:
+            self._load(iid)
+
+    def _on_close(self, event):
+        iid = self.focus()
+        if iid in self._children:
+            self._collapsed.pop(iid, None)
+            self._collapsed[iid] = None
+            self._unload_excess()
+
+    def _load(self, iid):
+        token = object()
+        self._loading[iid] = token
+        key = self._keys.get(iid)
+        if not self.worker:
+            self._on_loaded(iid, token, list(self.provider(key)))
+            return
+
+        def fetch(provider=self.provider):
+            try:
+                children, error = list(provider(key)), None
+            except Exception as e:
+                children, error = None, e
+            self.dispatcher.call(self._on_loaded, iid, token, children, error)
+
+        thread = threading.Thread(target=fetch)
+        thread.daemon = True
+        thread.start()
+
+    def _on_loaded(self, iid, token, children, error=None):
+        if self._loading.get(iid) is not token \
+                or (iid and not self.exists(iid)):
+            return
+        del self._loading[iid]
+        if error is not None:
+            # allow opening the node again
+            self.item(iid, open=False)
+            raise error
+        rows = []
+        for key, text, values, has_children in children:
+            rows.extend((text, values, int(bool(has_children))))
+        new = self.tk.splitlist(_call_tcl_proc(
+            self, _TREE_LOAD_TCL, '::pytk::tree_load',
+            self, iid, self.placeholder, rows))
+        self._placeholders.discard(iid)
+        for child, item in zip(new, children):
+            self._keys[child] = item[0]
+            if item[3]:
+                self._placeholders.add(child)
+        self._children[iid] = list(new)
+        self._num_rows += len(new)
+        if iid and not self.item(iid, 'open'):
+            self._collapsed[iid] = None
+        self._unload_excess()
+
+    def _unload_excess(self):
+        # unload the children of the nodes collapsed least recently
+        if self.max_rows is None:
+            return
+        while self._num_rows > self.max_rows and self._collapsed:
+            iid, _ = self._collapsed.popitem(last=False)
+            self._num_rows -= self._forget(iid)
+            # deleting the children also deletes their descendants
+            self.delete(*self.get_children(iid))
+            self.insert(iid, 'end', text=self.placeholder)
+            self._placeholders.add(iid)
+
+    def destroy(self):
+        self._loading.clear()
+        if self._owns_dispatcher:
+            self.dispatcher.close()
+        super(LazyTree, self).destroy()
 
 
 # ======================================================================
@@ -264,6 +1609,43 @@ class ScrollingFrame(Frame):
             self, parent,
             label_kws=None, label_pack_kws=None,
             *_args, **_kws):
+        """
+        A frame with a vertical scrollbar.
+
+        The widgets are either added to the `scrolling` frame, or, in
+        virtual mode (if `make_row` is given), created as rows of the same
+        height: only the rows in the viewport (plus `overscan`) are kept
+        as widgets, and they are reused while scrolling.
+
+        Args:
+            parent (tk.Widget): The parent widget.
+            label_kws (dict|None): Keyword arguments for the `Label` shown
+                above the frame. If None, no label is shown.
+            label_pack_kws (dict|None): Keyword arguments for packing the
+                label.
+            *_args: Positional arguments for `ttk.Frame`.
+            **_kws: Keyword arguments for `ttk.Frame`, and:
+                make_row (callable|None): The row factory (virtual mode).
+                    Must accept the parent and return a new row widget.
+                bind_row (callable|None): The row binder (virtual mode).
+                    Must accept a row widget and the index of the row,
+                    and show the corresponding data.
+                num_rows (int): The number of rows (virtual mode).
+                row_height (int|None): The height of the rows in pixels.
+                    If None, the height of the first row created is used.
+                overscan (int): The number of rows kept above and below
+                    the viewport (virtual mode).
+
+        Returns:
+            None.
+        """
+        # virtual mode: only the rows in the viewport are kept as widgets
+        self.make_row = _kws.pop('make_row', None)
+        self.bind_row = _kws.pop('bind_row', None)
+        self.num_rows = _kws.pop('num_rows', 0)
+        self.row_height = _kws.pop('row_height', None)
+        self.overscan = _kws.pop('overscan', 2)
+        self.virtual = self.make_row is not None
         super(ScrollingFrame, self).__init__(parent, *_args, **_kws)
 
         if label_kws:
@@ -283,6 +1665,14 @@ class ScrollingFrame(Frame):
         self.canvas.xview_moveto(0)
         self.canvas.yview_moveto(0)
 
+        self.sys_events = {
+            'scroll_up': {'unix': 4, 'win': +120},
+            'scroll_down': {'unix': 5, 'win': -120}}
+
+        if self.virtual:
+            self._init_virtual()
+            return
+
         # create a frame inside the canvas which will be scrolled with it
         self.scrolling = Frame(self.canvas)
 
@@ -290,7 +1680,7 @@ class ScrollingFrame(Frame):
             0, 0, window=self.scrolling, anchor='nw')
 
         # track changes to the canvas and frame width and sync them,
-        # also updating the scrollbar
+        # also updating the scrollbar (only once per idle cycle)
         def _configure_interior(event):
             # update the scrollbars to match the size of the inner frame
             # size = (
@@ -301,32 +1691,311 @@ class ScrollingFrame(Frame):
             if self.scrolling.winfo_reqwidth() != self.canvas.winfo_width():
                 self.canvas.config(width=self.scrolling.winfo_reqwidth())
 
-        self.scrolling.bind('<Configure>', _configure_interior)
+        self.scrolling.bind(
+            '<Configure>', util.coalesce(self, _configure_interior))
 
         def _configure_canvas(event):
             if self.scrolling.winfo_reqwidth() != self.canvas.winfo_width():
                 self.canvas.itemconfigure(scrolling_id,
                                           width=self.canvas.winfo_width())
 
-        self.canvas.bind('<Configure>', _configure_canvas)
+        self.canvas.bind(
+            '<Configure>', util.coalesce(self, _configure_canvas))
 
         scrolling_widgets = [self.scrolling, self.v_scrollbar]
-        for widget in scrolling_widgets:
-            widget.bind('<MouseWheel>', self.mousewheel)
-            widget.bind('<Button-4>', self.mousewheel)
-            widget.bind('<Button-5>', self.mousewheel)
-        self.sys_events = {
-            'scroll_up': {'unix': 4, 'win': +120},
-            'scroll_down': {'unix': 5, 'win': -120}}
+        util.bind_wheel(
+            scrolling_widgets, self.scroll, sys_events=self.sys_events)
 
     def mousewheel(self, event):
-        scroll_up = (
-                event.num == self.sys_events['scroll_up']['unix'] or
-                event.delta == self.sys_events['scroll_up']['win'])
-        scroll_down = (
-                event.num == self.sys_events['scroll_down']['unix'] or
-                event.delta == self.sys_events['scroll_down']['win'])
-        if scroll_up:
-            self.canvas.yview_scroll(-1, 'units')
-        elif scroll_down:
-            self.canvas.yview_scroll(1, 'units')
+        self.scroll(util.get_wheel_steps(event, self.sys_events))
+
+    def scroll(self, steps):
+        if steps:
+            self.canvas.yview_scroll(-steps, 'units')
+
+    def _init_virtual(self):
+        self.scrolling = None
+        # each row is: [widget, canvas window id, bound index or None]
+        self._rows = []
+        self._layout_id = None
+        self._wheel_handler = util.bind_wheel(
+            [self.canvas, self.v_scrollbar], self.scroll,
+            sys_events=self.sys_events)
+
+        def _yscroll(first, last):
+            self.v_scrollbar.set(first, last)
+            self.refresh()
+
+        self.canvas.config(yscrollcommand=_yscroll)
+        self.canvas.bind(
+            '<Configure>', util.coalesce(self, self._configure_virtual))
+        self.refresh()
+
+    def _new_row(self):
+        widget = self.make_row(self.canvas)
+        if not self.row_height:
+            widget.update_idletasks()
+            self.row_height = max(1, widget.winfo_reqheight())
+            self._update_scrollregion()
+        item_id = self.canvas.create_window(
+            0, -2 * self.row_height, window=widget, anchor='nw',
+            width=self.canvas.winfo_width(), height=self.row_height)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            widget.bind(sequence, self._wheel_handler, '+')
+        row = [widget, item_id, None]
+        self._rows.append(row)
+        return row
+
+    def _update_scrollregion(self):
+        if self.row_height:
+            self.canvas.config(
+                yscrollincrement=self.row_height,
+                scrollregion=(
+                    0, 0, self.canvas.winfo_width(),
+                    self.num_rows * self.row_height))
+
+    def _configure_virtual(self, event):
+        width = self.canvas.winfo_width()
+        for widget, item_id, index in self._rows:
+            self.canvas.itemconfigure(item_id, width=width)
+        self._update_scrollregion()
+        self.refresh()
+
+    def set_num_rows(self, num_rows):
+        """
+        Set the number of rows of a virtual ScrollingFrame.
+
+        Args:
+            num_rows (int): The number of rows.
+
+        Returns:
+            None.
+        """
+        self.num_rows = num_rows
+        for row in self._rows:
+            if row[2] is not None and row[2] >= num_rows:
+                row[2] = None
+                self.canvas.coords(row[1], 0, -2 * self.row_height)
+        self._update_scrollregion()
+        self.refresh()
+
+    def refresh(self, rebind=False):
+        """
+        Update the rows in the viewport of a virtual ScrollingFrame.
+
+        Args:
+            rebind (bool): Rebind all the rows shown (e.g. after the
+                underlying data changed), not only the newly shown ones.
+
+        Returns:
+            None.
+        """
+        if rebind:
+            for row in self._rows:
+                row[2] = None
+        if self._layout_id is None:
+            self._layout_id = self.after_idle(self._layout)
+
+    def _layout(self):
+        self._layout_id = None
+        if not self.num_rows:
+            shown = range(0)
+        else:
+            if not self._rows:
+                self._new_row()
+            top = self.canvas.canvasy(0)
+            height = self.canvas.winfo_height()
+            first = max(0, int(top // self.row_height) - self.overscan)
+            last = min(
+                self.num_rows,
+                int((top + height) // self.row_height) + 1 + self.overscan)
+            shown = range(first, last)
+        bound = set(row[2] for row in self._rows)
+        free = [row for row in self._rows if row[2] not in shown]
+        for i in shown:
+            if i not in bound:
+                row = free.pop() if free else self._new_row()
+                row[2] = i
+                self.bind_row(row[0], i)
+                self.canvas.coords(row[1], 0, i * self.row_height)
+        for row in free:
+            if row[2] is not None:
+                row[2] = None
+                self.canvas.coords(row[1], 0, -2 * self.row_height)
+
+    def see_row(self, index):
+        """Scroll a virtual ScrollingFrame so that a row is visible."""
+        if not self.num_rows:
+            return
+        if not self.row_height:
+            # the height is measured on the first row
+            self._new_row()
+        top = self.canvas.canvasy(0)
+        height = self.canvas.winfo_height()
+        total = float(self.num_rows * self.row_height)
+        y = index * self.row_height
+        if y < top:
+            self.canvas.yview_moveto(y / total)
+        elif y + self.row_height > top + height:
+            self.canvas.yview_moveto((y + self.row_height - height) / total)
+
+
+# ======================================================================
+def _get_form_kind(widget):
+    if isinstance(widget, Checkbutton_):
+        return 'check'
+    elif isinstance(widget, tk.Spinbox):
+        return 'spinbox'
+    elif isinstance(widget, Scale):
+        return 'scale'
+    elif isinstance(widget, Combobox):
+        return 'combo'
+    elif isinstance(widget, Entry_):
+        return 'entry'
+    else:
+        return None
+
+
+# ======================================================================
+def _is_form_val_allowed(widget, val):
+    values = getattr(widget, 'values', None)
+    num_val = util.auto_convert(val)
+    if values:
+        return num_val in values or val in values or str(val) in values
+    elif widget.start is None or widget.stop is None:
+        return True
+    else:
+        try:
+            return widget.start <= num_val <= widget.stop
+        except TypeError:
+            return False
+
+
+# ======================================================================
+def get_form_widgets(parent):
+    """
+    Find the value widgets (with `get_val()`/`set_val()`) in a widget tree.
+
+    Args:
+        parent (tk.Misc): The root of the widget tree.
+
+    Returns:
+        widgets (dict[str,tk.Widget]): The widgets found.
+            The keys are the widget paths relative to `parent`
+            (e.g. `frame.name`), hence using the `name` option when creating
+            the widgets gives stable keys.
+    """
+    prefix = str(parent).rstrip('.') + '.'
+    widgets = {}
+    stack = [parent]
+    while stack:
+        widget = stack.pop()
+        if widget is not parent \
+                and hasattr(widget, 'get_val') and hasattr(widget, 'set_val'):
+            widgets[str(widget)[len(prefix):]] = widget
+        stack.extend(widget.children.values())
+    return widgets
+
+
+# ======================================================================
+def get_form_vals(parent, widgets=None):
+    """
+    Get the values of all the value widgets in a widget tree.
+
+    The values mirrored in Python (see `bind_change()`) are read without
+    Tcl round trips, the other pytk value widgets are read in a single Tcl
+    round trip and the remaining widgets with `get_val()` one by one.
+
+    Args:
+        parent (tk.Misc): The root of the widget tree.
+        widgets (dict[str,tk.Widget]|None): The widgets to read.
+            If None, uses `get_form_widgets(parent)`.
+
+    Returns:
+        vals (dict[str,Any]): The values, as returned by `get_val()`.
+    """
+    if widgets is None:
+        widgets = get_form_widgets(parent)
+    vals = {}
+    specs, keys, kinds = [], [], []
+    for key, widget in widgets.items():
+        kind = _get_form_kind(widget)
+        if isinstance(widget, _Traced):
+            vals[key] = widget.get_val()
+        elif kind:
+            specs.extend((widget._w, kind))
+            keys.append(key)
+            kinds.append(kind)
+        else:
+            vals[key] = widget.get_val()
+    if specs:
+        results = parent.tk.splitlist(_call_tcl_proc(
+            parent, _FORM_TCL, '::pytk::form_get', tuple(specs)))
+        for key, kind, result in zip(keys, kinds, results):
+            if kind == 'check':
+                vals[key] = bool(int(result))
+            elif kind in ('spinbox', 'scale'):
+                vals[key] = util.auto_convert(str(result))
+            else:
+                vals[key] = str(result)
+    return vals
+
+
+# ======================================================================
+def set_form_vals(parent, vals, widgets=None):
+    """
+    Set the values of the value widgets in a widget tree.
+
+    Only the widgets whose value actually changes are written, and the
+    pytk value widgets are written in a single Tcl round trip (none, if no
+    value changes and all the values are mirrored in Python).
+    All the values are validated before writing any.
+
+    Args:
+        parent (tk.Misc): The root of the widget tree.
+        vals (dict[str,Any]): The values, as accepted by `set_val()`.
+            The keys are the ones from `get_form_widgets()`.
+            Missing keys are left untouched.
+        widgets (dict[str,tk.Widget]|None): The widgets to write.
+            If None, uses `get_form_widgets(parent)`.
+
+    Returns:
+        num_changed (int): The number of widgets written.
+
+    Raises:
+        KeyError: If a key does not correspond to any widget.
+        ValueError: If a value is not allowed by a Spinbox or Range.
+    """
+    if widgets is None:
+        widgets = get_form_widgets(parent)
+    specs, others = [], []
+    for key, val in vals.items():
+        widget = widgets[key]
+        kind = _get_form_kind(widget)
+        if kind == 'check':
+            val = int(bool(val))
+        elif kind in ('spinbox', 'scale'):
+            if not _is_form_val_allowed(widget, val):
+                raise ValueError('{}: value `{}` not allowed.'.format(
+                    type(widget).__name__, val))
+        elif kind:
+            val = '' if val is None else str(val)
+        if isinstance(widget, _Traced):
+            if widget._convert(val) == widget.get_val():
+                continue
+            elif kind != 'check':
+                specs.extend((str(widget._var), 'var', val))
+                continue
+        if kind:
+            specs.extend((widget._w, kind, val))
+        else:
+            others.append((widget, val))
+    num_changed = 0
+    for widget, val in others:
+        if widget.get_val() != val:
+            widget.set_val(val)
+            num_changed += 1
+    if specs:
+        num_changed += int(_call_tcl_proc(
+            parent, _FORM_TCL, '::pytk::form_set', tuple(specs)))
+    return num_changed
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Test the lazy file browser (requires a display).
+"""
+
+# ======================================================================
+# :: Future Imports
+from __future__ import (
+    division, absolute_import, print_function, unicode_literals, )
+
+# ======================================================================
+# :: Python Standard Library Imports
+import os
+import time
+import shutil
+import tempfile
+import unittest
+
+# ======================================================================
+# :: Internal Imports
+from pytk import tk
+from pytk import browser
+
+
+# ======================================================================
+class TestFileBrowser(unittest.TestCase):
+    def setUp(self):
+        try:
+            self.root = tk.Tk()
+        except tk.TclError:
+            raise unittest.SkipTest('no display available')
+        self.dirpath = tempfile.mkdtemp()
+        for name in ('a.py', 'b.txt', 'c.txt'):
+            open(os.path.join(self.dirpath, name), 'w').close()
+        os.mkdir(os.path.join(self.dirpath, 'sub'))
+        browser.clear_cache()
+        self.browser = browser.FileBrowser(self.root, details=False)
+
+    def tearDown(self):
+        self.root.destroy()
+        shutil.rmtree(self.dirpath)
+
+    def _wait(self, timeout=10.0):
+        end = time.time() + timeout
+        while self.browser._scans or self.browser._pending:
+            self.assertLess(time.time(), end)
+            self.root.update()
+            time.sleep(0.001)
+
+    def _get_names(self):
+        return [
+            self.browser.item(iid, 'text')
+            for iid in self.browser.get_children()]
+
+    def test_set_pattern_refresh(self):
+        self.browser.set_root(self.dirpath)
+        self._wait()
+        self.assertEqual(self._get_names(), ['sub', 'a.py', 'b.txt', 'c.txt'])
+        # the hidden entries are detached: they must be deleted on refresh
+        self.browser.set_pattern('*.py')
+        self.assertEqual(self._get_names(), ['sub', 'a.py'])
+        self.browser.refresh()
+        self._wait()
+        self.assertEqual(self._get_names(), ['sub', 'a.py'])
+        self.browser.set_pattern('')
+        self.assertEqual(self._get_names(), ['sub', 'a.py', 'b.txt', 'c.txt'])
+
+    def test_clear(self):
+        self.browser.set_root(self.dirpath)
+        self._wait()
+        self.browser.set_pattern('*.py')
+        self.browser.clear()
+        self.browser.set_root(self.dirpath)
+        self._wait()
+        self.browser.set_pattern(None)
+        self.assertEqual(self._get_names(), ['sub', 'a.py', 'b.txt', 'c.txt'])
+
+
+# ======================================================================
+if __name__ == '__main__':
+    unittest.main()